@@ -0,0 +1,159 @@
+# benchmarks/api_bench.py
+"""
+API 회귀 벤치마크
+
+합성 데이터로 DB를 채운 뒤 실제 FastAPI 앱을 프로세스 안에서(서버 없이) 비동기 클라이언트로 호출해
+시나리오별 p50/p95/p99 응답시간과 초당 처리량을 JSON으로 출력한다.
+같은 옵션(--rows, --seed, --requests, --concurrency)으로 커밋마다 실행한 결과를 --baseline 으로 비교하면
+p95가 --threshold 비율 이상 느려진 시나리오를 표시하고 종료 코드 1을 반환한다.
+
+$ python -m benchmarks.api_bench --rows 100000 --output before.json
+$ python -m benchmarks.api_bench --rows 100000 --baseline before.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.seed import seed, URL_HELP, FORCE_HELP
+
+
+def scenarios(rows, size):  # {시나리오 이름: 요청 경로 생성 함수(rnd -> path)}
+    last_page = max(1, rows // size)
+    return {
+        "saying_list": lambda rnd: f"/saying?p=1&size={size}",
+        "saying_deep_page": lambda rnd: f"/saying?p={rnd.randint(max(1, last_page - 50), last_page)}&size={size}",
+        "saying_cursor": lambda rnd: f"/saying?cursor=&size={size}",
+        "fourchar_list": lambda rnd: f"/fourchar?p=1&size={size}",
+        "fourchar_deep_page": lambda rnd: f"/fourchar?p={rnd.randint(max(1, last_page - 50), last_page)}&size={size}",
+        "saying_filter_keyword": lambda rnd: f"/saying/filter/?keyword={rnd.choice(['life', 'wisdom', 'dream', 'heart'])}&size={size}",
+        "saying_filter_categories": lambda rnd: f"/saying/filter/?categories=인생&categories=사랑&p={rnd.randint(1, 20)}&size={size}",
+        "fourchar_filter_consonants": lambda rnd: f"/fourchar/filter/?consonants={rnd.choice('ㄱㄴㄷㅁㅂㅅㅇㅈ')}&p={rnd.randint(1, 20)}&size={size}",
+        "fourchar_filter_keyword": lambda rnd: f"/fourchar/filter/?keyword={rnd.choice('一人大天山水')}&size={size}",
+        "saying_single": lambda rnd: f"/saying/{rnd.randint(1, rows)}",
+        "fourchar_single": lambda rnd: f"/fourchar/{rnd.randint(1, rows)}",
+    }
+
+
+def percentile(latencies, ratio):  # 정렬된 목록에서 백분위 값(ms)
+    return round(latencies[min(len(latencies) - 1, int(len(latencies) * ratio))] * 1000, 2)
+
+
+async def run_scenario(client, make_path, requests, concurrency, rnd):
+    latencies = []
+    errors = 0
+    paths = [make_path(rnd) for _ in range(requests)]
+
+    async def worker(index):
+        nonlocal errors
+        for path in paths[index::concurrency]:
+            start = time.perf_counter()
+            response = await client.get(path)
+            latencies.append(time.perf_counter() - start)
+            errors += response.status_code >= 400
+
+    await client.get(paths[0])  # 워밍업
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(index) for index in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "requests_per_sec": round(len(latencies) / elapsed, 1),
+        "p50_ms": percentile(latencies, 0.50),
+        "p95_ms": percentile(latencies, 0.95),
+        "p99_ms": percentile(latencies, 0.99),
+    }
+
+
+async def run(args):
+    import httpx
+    from main import app  # DB 연결주소 환경변수를 설정한 뒤에 불러온다
+
+    results = {}
+    selected = scenarios(args.rows, args.size)
+    if args.scenarios:
+        selected = {name: selected[name] for name in args.scenarios}
+    async with app.router.lifespan_context(app):  # 검색 색인, 랜덤 id 목록 생성
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            for name, make_path in selected.items():
+                results[name] = await run_scenario(client, make_path, args.requests, args.concurrency, random.Random(args.seed))
+                print(name, json.dumps(results[name]), file=sys.stderr)
+    return results
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, baseline, threshold):  # p95 기준 회귀 시나리오 목록
+    regressions = []
+    for name, current in results.items():
+        before = baseline.get("scenarios", {}).get(name)
+        if not before or not before["p95_ms"]:
+            continue
+        ratio = current["p95_ms"] / before["p95_ms"]
+        current["p95_change"] = round(ratio - 1, 3)
+        if ratio > 1 + threshold:
+            regressions.append(name)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--url", default=None, help=URL_HELP)
+    parser.add_argument("--force", action="store_true", help=FORCE_HELP)
+    parser.add_argument("--rows", type=int, default=10_000, help="명언/사자성어 각각의 행 수")
+    parser.add_argument("--size", type=int, default=15, help="페이지 크기")
+    parser.add_argument("--requests", type=int, default=500, help="시나리오별 요청 수")
+    parser.add_argument("--concurrency", type=int, default=10, help="동시 요청 수")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--scenarios", nargs="*", help="실행할 시나리오 이름(기본: 전체)")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    parser.add_argument("--baseline", help="비교할 이전 결과 JSON")
+    parser.add_argument("--threshold", type=float, default=0.2, help="p95가 이 비율 이상 느려지면 회귀로 판단")
+    args = parser.parse_args()
+
+    url = args.url or "sqlite:///" + os.path.join(tempfile.mkdtemp(), "api_bench.db")
+    os.environ["DATABASE_CONNECTION_STRING"] = url
+    os.environ.pop("ASYNC_DATABASE_CONNECTION_STRING", None)
+    os.environ.pop("DATABASE_REPLICA_CONNECTION_STRING", None)
+
+    seed(url, sayings=args.rows, fourchars=args.rows, seed_value=args.seed, force=args.force).dispose()
+
+    report = {
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "options": {key: getattr(args, key) for key in ("rows", "size", "requests", "concurrency", "seed")},
+        "scenarios": asyncio.run(run(args)),
+    }
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as file:
+            baseline = json.load(file)
+        report["baseline_commit"] = baseline.get("commit")
+        regressions = compare(report["scenarios"], baseline, args.threshold)
+        report["regressions"] = regressions
+
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(output)
+    print(output)
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
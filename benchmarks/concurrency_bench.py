@@ -0,0 +1,72 @@
+# benchmarks/concurrency_bench.py
+"""
+동시 접속 처리량(requests/sec) 측정
+
+실행 중인 서버에 동시 클라이언트 N개로 요청을 보내 초당 처리량을 측정한다.
+같은 DB/데이터로 변경 전후 커밋의 서버를 각각 띄워 결과를 비교한다.
+
+$ python -m benchmarks.concurrency_bench --base-url http://127.0.0.1:8000 --clients 50 --duration 10
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+
+import httpx
+
+
+PATHS = [
+    "/saying?p={page}&size=15",
+    "/fourchar?p={page}&size=15",
+    "/saying/filter/?categories=인생&p={page}",
+    "/fourchar/filter/?consonants=ㄱ&p={page}",
+    "/saying/{id}",
+    "/fourchar/{id}",
+]
+
+
+async def client_loop(client, deadline, max_id, stats, rnd):
+    while time.perf_counter() < deadline:
+        path = rnd.choice(PATHS).format(page=rnd.randint(1, 50), id=rnd.randint(1, max_id))
+        start = time.perf_counter()
+        try:
+            response = await client.get(path)
+        except httpx.HTTPError:
+            stats["errors"] += 1
+            continue
+        stats["latencies"].append(time.perf_counter() - start)
+        stats["errors"] += response.status_code >= 500
+
+
+async def run(base_url, clients, duration, max_id):
+    stats = {"latencies": [], "errors": 0}
+    limits = httpx.Limits(max_connections=clients, max_keepalive_connections=clients)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60) as client:
+        deadline = time.perf_counter() + duration
+        started = time.perf_counter()
+        await asyncio.gather(*(client_loop(client, deadline, max_id, stats, random.Random(i)) for i in range(clients)))
+        elapsed = time.perf_counter() - started
+    latencies = sorted(stats["latencies"])
+    return {
+        "clients": clients,
+        "requests": len(latencies),
+        "errors": stats["errors"],
+        "requests_per_sec": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(latencies[len(latencies) // 2] * 1000, 2),
+        "p99_ms": round(latencies[int(len(latencies) * 0.99)] * 1000, 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--clients", type=int, default=50)
+    parser.add_argument("--duration", type=float, default=10)
+    parser.add_argument("--max-id", type=int, default=10_000, help="단일 조회에 사용할 id 범위")
+    args = parser.parse_args()
+    print(json.dumps(asyncio.run(run(args.base_url, args.clients, args.duration, args.max_id))))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+# benchmarks/pagination_bench.py
+"""
+OFFSET 페이징과 커서(keyset) 페이징의 깊은 페이지 조회 시간 비교
+
+$ python -m benchmarks.pagination_bench --rows 200000 --page 1000 --size 15
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+
+from sqlmodel import Session, select
+
+from models.sayings import Saying, SayingRead
+from tools.pagination import paging, keyset_paging, keyset_page, encode_cursor, projection
+from benchmarks.seed import seed, URL_HELP, FORCE_HELP
+
+
+def measure(fn, repeat):  # 평균 실행시간(ms)
+    fn()  # 워밍업
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--url", default=None, help=URL_HELP)
+    parser.add_argument("--force", action="store_true", help=FORCE_HELP)
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--page", type=int, default=1000)
+    parser.add_argument("--size", type=int, default=15)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    url = args.url or "sqlite:///" + os.path.join(tempfile.mkdtemp(), "pagination_bench.db")
+    engine = seed(url, sayings=args.rows, fourchars=0, force=args.force)
+
+    with Session(engine) as session:
+        # 커서 모드로 page-1 페이지까지 이동했을 때의 커서를 미리 구한다(클라이언트가 들고 있는 값)
+        skip = (args.page - 1) * args.size
+        last_id = session.exec(
+            select(Saying.id).where(Saying.use_yn==1).order_by(Saying.id.desc()).offset(skip - 1).limit(1)
+        ).one() if skip else None
+        cursor = encode_cursor(last_id) if last_id is not None else ""
+
+        statement = projection(Saying, SayingRead)  # 라우트와 같은 조회문
+
+        def offset_page():
+            return session.exec(paging(page=args.page, size=args.size, Table=Saying, statement=statement)).all()
+
+        def cursor_page():
+            rows = session.exec(keyset_paging(cursor=cursor, size=args.size, Table=Saying, statement=statement)).all()
+            return keyset_page(rows, args.size)["content"]
+
+        assert [row.id for row in offset_page()] == [row["id"] for row in cursor_page()]  # 두 방식의 결과가 같아야 한다
+
+        result = {
+            "rows": args.rows,
+            "page": args.page,
+            "size": args.size,
+            "offset_ms": round(measure(offset_page, args.repeat), 3),
+            "cursor_ms": round(measure(cursor_page, args.repeat), 3),
+        }
+    print(json.dumps(result, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
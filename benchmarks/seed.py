@@ -0,0 +1,101 @@
+# benchmarks/seed.py
+"""
+벤치마크용 합성 데이터 생성
+"""
+import random
+
+from sqlmodel import SQLModel, create_engine
+from sqlalchemy import inspect, insert, text
+
+from models.sayings import Saying
+from models.fourchars import FourChar
+import models.category, models.versions, models.changes, models.authors  # drop_all 대상에 모든 테이블 포함  # noqa: F401
+from tools.initials import hangul_initial, alpha_initial
+from tools.categories import sync_statements
+from tools import authors
+from database.migration import upgrade
+
+
+SAYING_CATEGORIES = ["인생", "사랑", "성공", "우정", "노력", "행복", "지혜", "용기"]
+FOURCHAR_CATEGORIES = ["교훈", "학문", "처세", "자연", "우정", "효도"]
+AUTHORS = ["Confucius", "Seneca", "Lao Tzu", "Einstein", "Goethe", "Tolstoy", "세종대왕", "이순신"]
+HANJA = "一二三人大天地日月山水火木金土心中國學生白"
+WORDS = ["life", "love", "time", "success", "friend", "heart", "wisdom", "courage", "dream", "light"]
+
+
+def hangul_syllable(rnd):  # 임의의 한글 음절 1개
+    return chr(0xAC00 + rnd.randrange(11172))
+
+
+def hangul_text(rnd, length):  # 임의의 한글 문자열
+    return "".join(hangul_syllable(rnd) if rnd.random() > 0.15 else " " for _ in range(length)).strip() or "가"
+
+
+def saying_row(rnd):
+    contents_eng = " ".join(rnd.choice(WORDS) for _ in range(rnd.randint(5, 15))).capitalize()
+    return {
+        "category": rnd.choice(SAYING_CATEGORIES),
+        "author": rnd.choice(AUTHORS),
+        "contents_kr": hangul_text(rnd, rnd.randint(20, 60)),
+        "contents_eng": contents_eng,
+        "initial": alpha_initial(contents_eng),
+        "type_id": 0,
+        "use_yn": 1,
+    }
+
+
+def fourchar_row(rnd):
+    contents_kr = "".join(hangul_syllable(rnd) for _ in range(4))
+    return {
+        "category": rnd.choice(FOURCHAR_CATEGORIES),
+        "contents_kr": contents_kr,
+        "initial": hangul_initial(contents_kr),
+        "contents_zh": "".join(rnd.choice(HANJA) for _ in range(4)),
+        "contents_detail": hangul_text(rnd, rnd.randint(15, 40)),
+        "type_id": 1,
+        "use_yn": 1,
+    }
+
+
+# 벤치마크의 --url, --force 도움말
+URL_HELP = "DB 연결주소(기본: 임시 SQLite 파일). 기존 테이블과 데이터를 모두 지운다(SQLite가 아니거나 비어 있지 않으면 --force 필요)"
+FORCE_HELP = "SQLite가 아니거나 테이블이 있는 --url DB도 지우고 채운다"
+
+
+def check_target(engine, force):  # 운영 DB를 실수로 지우지 않도록 빈 SQLite DB가 아니면 force가 있어야 한다
+    if force:
+        return
+    if engine.dialect.name != "sqlite":
+        raise RuntimeError(f"{engine.url}: SQLite가 아닌 DB는 테이블을 모두 지우므로 --force 를 주어야 합니다.")
+    tables = inspect(engine).get_table_names()
+    if tables:
+        raise RuntimeError(f"{engine.url}: 이미 테이블이 있는 DB입니다({', '.join(tables)}). 지우고 채우려면 --force 를 주세요.")
+
+
+def seed(url, sayings=10_000, fourchars=10_000, seed_value=42, batch=5_000, force=False):
+    """
+    url 데이터베이스에 테이블을 만들고 합성 명언/사자성어를 채운 뒤 엔진을 반환.
+    기존 테이블은 모두 지우므로 빈 SQLite DB가 아니면 force=True 여야 한다.
+    """
+    rnd = random.Random(seed_value)
+    engine = create_engine(url)
+    try:
+        check_target(engine, force)
+    except RuntimeError:
+        engine.dispose()
+        raise
+    SQLModel.metadata.drop_all(engine)
+    with engine.begin() as connection:
+        connection.execute(text("DROP TABLE IF EXISTS alembic_version"))
+    upgrade(url)  # 운영과 같은 스키마(마이그레이션)로 생성
+    with engine.begin() as connection:
+        for Table, make_row, count in ((Saying, saying_row, sayings), (FourChar, fourchar_row, fourchars)):
+            for start in range(0, count, batch):
+                rows = [make_row(rnd) for _ in range(min(batch, count - start))]
+                connection.execute(insert(Table), rows)
+        for Table in (Saying, FourChar):  # 카테고리 테이블 채우기(/category/new_all 과 같은 방식)
+            for statement in sync_statements(Table):
+                connection.execute(statement)
+        for statement in authors.sync_statements():  # 발화자 테이블 채우기
+            connection.execute(statement)
+    return engine
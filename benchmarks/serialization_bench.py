@@ -0,0 +1,75 @@
+# benchmarks/serialization_bench.py
+"""
+size=100 목록 페이지 1개를 만드는 데 드는 응답 크기(byte)와 CPU 시간 비교
+
+- orm   : 기존 방식. select(Saying) 전체 컬럼 ORM 객체 -> pydantic 직렬화 -> json(JSONResponse)
+- slim  : 사용하는 컬럼만 조회(SayingRead) -> dict -> pydantic 직렬화 -> orjson(ORJSONResponse)
+
+$ python -m benchmarks.serialization_bench --rows 20000 --size 100
+"""
+import argparse
+import gzip
+import json
+import os
+import tempfile
+import time
+
+from fastapi.responses import JSONResponse, ORJSONResponse
+from pydantic import TypeAdapter
+from sqlmodel import Session, select
+
+from models.sayings import Saying, SayingRead
+from tools.pagination import paging, projection, as_dicts
+from benchmarks.seed import seed, URL_HELP, FORCE_HELP
+
+
+RESPONSE_ADAPTER = TypeAdapter(dict)  # response_model=dict 응답을 FastAPI가 직렬화하는 방식과 같다
+
+
+def orm_page(session, page, size):
+    rows = session.exec(paging(page=page, size=size, Table=Saying, statement=select(Saying))).all()
+    content = RESPONSE_ADAPTER.dump_python({"total_rows": 0, "total_page": 0, "content": rows}, mode="json")
+    return JSONResponse(content).body
+
+
+def slim_page(session, page, size):
+    rows = as_dicts(session.exec(paging(page=page, size=size, Table=Saying, statement=projection(Saying, SayingRead))).all())
+    content = RESPONSE_ADAPTER.dump_python({"total_rows": 0, "total_page": 0, "content": rows}, mode="json")
+    return ORJSONResponse(content).body
+
+
+def measure(fn, session, size, repeat):
+    body = fn(session, 1, size)  # 워밍업
+    start = time.process_time()
+    for i in range(repeat):
+        body = fn(session, i % 50 + 1, size)
+    cpu_ms = (time.process_time() - start) / repeat * 1000
+    return {
+        "bytes": len(body),
+        "gzip_bytes": len(gzip.compress(body, compresslevel=5)),
+        "cpu_ms": round(cpu_ms, 3),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--url", default=None, help=URL_HELP)
+    parser.add_argument("--force", action="store_true", help=FORCE_HELP)
+    parser.add_argument("--rows", type=int, default=20_000)
+    parser.add_argument("--size", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    url = args.url or "sqlite:///" + os.path.join(tempfile.mkdtemp(), "serialization_bench.db")
+    engine = seed(url, sayings=args.rows, fourchars=0, force=args.force)
+    with Session(engine) as session:
+        result = {
+            "size": args.size,
+            "orm": measure(orm_page, session, args.size, args.repeat),
+            "slim": measure(slim_page, session, args.size, args.repeat),
+        }
+    print(json.dumps(result))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,9 @@
 # database/connection.py
 
-from sqlmodel import SQLModel, Session, create_engine
+from sqlmodel import create_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing import Optional
 
@@ -8,21 +11,105 @@ from typing import Optional
 # 데이터베이스와 연결 환경설정
 class Settings(BaseSettings):
     DATABASE_CONNECTION_STRING: Optional[str] = None  # DB 연결주소, .env파일에서 불러온다.
+    ASYNC_DATABASE_CONNECTION_STRING: Optional[str] = None  # 비동기 드라이버 DB 연결주소. 없으면 DATABASE_CONNECTION_STRING에서 변환
+    DATABASE_REPLICA_CONNECTION_STRING: Optional[str] = None  # 읽기 전용 복제본 DB 연결주소. 있으면 GET 라우트가 복제본을 사용
+
+    DB_POOL_SIZE: int = 5  # 커넥션 풀 기본 연결 수
+    DB_MAX_OVERFLOW: int = 10  # 풀이 가득 찼을 때 추가로 열 수 있는 연결 수
+    DB_POOL_TIMEOUT: int = 30  # 풀에서 연결을 기다리는 최대 시간(초)
+    DB_POOL_RECYCLE: int = 3600  # 연결 재생성 주기(초). MySQL wait_timeout 보다 짧게 설정
+    DB_POOL_PRE_PING: bool = True  # 연결을 꺼낼 때 끊긴 연결인지 확인
+    DB_ECHO: bool = False  # 실행되는 SQL 출력(개발용, 운영에서는 처리량이 크게 떨어짐)
     UVICORN_IP: Optional[str] = None  # uvicorn ip번호
     UVICORN_PORT: Optional[int] = None  # uvicorn port번호
+    UVICORN_RELOAD: bool = False  # 개발용 자동 재시작(단일 프로세스). 운영에서는 false
+    UVICORN_WORKERS: Optional[int] = None  # 워커 프로세스 수. 없으면 CPU 코어 수
+    UVICORN_LOOP: str = "auto"  # 이벤트 루프(auto: uvloop가 설치되어 있으면 uvloop)
+    UVICORN_HTTP: str = "auto"  # HTTP 파서(auto: httptools가 설치되어 있으면 httptools)
+    UVICORN_BACKLOG: int = 2048  # 대기 중인 연결 최대 수
+    UVICORN_KEEPALIVE: int = 5  # keep-alive 연결 유지 시간(초)
+    UVICORN_GRACEFUL_TIMEOUT: int = 30  # 종료 시 처리 중인 요청을 기다리는 최대 시간(초)
+    UVICORN_LIMIT_CONCURRENCY: Optional[int] = None  # 워커당 최대 동시 연결 수(초과 시 503)
+    DB_INIT_ON_STARTUP: bool = True  # 앱 시작 시 스키마 버전 확인. 멀티 워커 실행 시에는 main.py가 한 번만 실행하고 false로 바꾼다
+    DB_AUTO_MIGRATE: bool = False  # 앱 시작 시 스키마 버전 확인 대신 `alembic upgrade head` 실행(개발/SQLite용)
 
-    model_config = SettingsConfigDict(env_file=".env")
+    COUNT_CACHE_SIZE: int = 1024  # 필터별 전체 개수 캐시 최대 항목 수
+    COUNT_CACHE_TTL: int = 60  # 전체 개수 캐시 유지 시간(초). 다른 워커의 쓰기가 반영되는 최대 지연
+    COUNT_ESTIMATE_LIMIT: int = 1000  # estimate=true 일 때 이 개수까지만 센다
+
+    SEARCH_BACKEND: str = "ngram"  # 검색어 필터링 방식(ngram, fulltext, like). tools/search.py 참고
+    SEARCH_MAX_IDS: int = 5000  # ngram 검색 결과가 이보다 많으면 LIKE 조건으로 조회
+
+    ITEM_CACHE_BACKEND: str = "memory"  # 단일 조회 캐시 저장소(memory, none). tools/cache.py 참고
+    ITEM_CACHE_SIZE: int = 10000  # 단일 조회 캐시 최대 항목 수
+    ITEM_CACHE_TTL: int = 300  # 단일 조회 캐시 유지 시간(초)
+
+    COMPRESSION: str = "gzip"  # 응답 압축 방식(gzip, br, none). br은 brotli-asgi 패키지가 필요
+    COMPRESSION_MINIMUM_SIZE: int = 1000  # 이 크기(byte) 이상인 응답만 압축
+    COMPRESSION_LEVEL: int = 5  # 압축 레벨(gzip 1~9, br 0~11)
+
+    HTTP_CACHE_CONTROL: str = "no-cache"  # 목록/필터/카테고리 조회 응답의 Cache-Control 헤더(항상 ETag로 재검증)
 
+    BULK_BATCH_SIZE: int = 1000  # 대량 가져오기 INSERT 묶음 크기, 내보내기 한 번에 읽는 행 수
+    BATCH_MAX_IDS: int = 100  # /saying/batch, /fourchar/batch 한 번에 조회할 수 있는 최대 id 수
 
-def conn():
-    SQLModel.metadata.create_all(engine_url)  # DB 연결 및 테이블 생성
+    RATE_LIMIT_PER_SECOND: float = 0  # 클라이언트별 초당 허용 요청 수(token bucket). 0이면 제한 없음. tools/rate_limit.py 참고
+    RATE_LIMIT_BURST: int = 60  # 한 번에 몰아서 보낼 수 있는 최대 요청 수
+    RATE_LIMIT_KEY_HEADER: Optional[str] = None  # 지정하면 이 헤더 값(API 키)으로 클라이언트 구분, 없으면 IP
+
+    SIMILAR_SNAPSHOT_PATH: Optional[str] = None  # 비슷한 데이터 추천 색인 파일(예: cache/similar_index.npz). 없으면 워커마다 시작 시 생성. tools/similar.py 참고
+
+    INDEX_SYNC_INTERVAL: float = 2.0  # 다른 워커의 쓰기를 메모리 색인(검색/랜덤/자동완성/추천)에 반영하는 주기(초). 0이면 반영 안 함(워커 1개일 때). tools/index_sync.py 참고
+
+    SNAPSHOT_PATH: Optional[str] = None  # 지정하면 목록/필터/단일/카테고리 조회를 DB 대신 이 스냅샷 파일(mmap)에서 처리. tools/snapshot.py 참고
+    SNAPSHOT_CHECK_INTERVAL: float = 1.0  # 다른 워커가 스냅샷 파일을 교체했는지 확인하는 주기(초)
+    SNAPSHOT_REFRESH_DELAY: float = 1.0  # 쓰기 후 스냅샷 파일을 다시 만들기까지 기다리는 시간(초). 그 사이 쓰기는 한 번에 반영
+
+    METRICS_ENABLED: bool = True  # 요청 처리 시간/SQL 통계 수집(Server-Timing 헤더, /metrics). tools/metrics.py 참고
+
+    model_config = SettingsConfigDict(env_file=".env")
 
 
 # 세션을 관리하는 함수. FastAPI의 Depends()와 함께 사용하면 관리가 용이
-def get_session():
-    with Session(engine_url) as session:  # 세션을 종료하면 세션이 닫히도록 with문으로 작성
+async def get_session():
+    async with AsyncSession(async_engine, expire_on_commit=False) as session:  # 세션을 종료하면 세션이 닫히도록 with문으로 작성
         yield session  # 각 작업마다 독립된 세션을 연결하기 위해 제너레이터 형태로 반환
 
 
+# 조회(GET) 라우트용 세션. 복제본 DB가 설정되어 있으면 복제본에 연결
+async def get_read_session():
+    async with AsyncSession(replica_engine or async_engine, expire_on_commit=False) as session:
+        yield session
+
+
+# 동기 드라이버 주소를 비동기 드라이버 주소로 변환(mysql+pymysql -> mysql+aiomysql, sqlite -> sqlite+aiosqlite)
+ASYNC_DRIVERS = {"mysql": "aiomysql", "sqlite": "aiosqlite"}
+
+def to_async_url(url):
+    url = make_url(url)
+    backend = url.get_backend_name()
+    return url.set(drivername=f"{backend}+{ASYNC_DRIVERS.get(backend, url.get_driver_name())}")
+
+
+def engine_options(url):  # Settings의 풀 설정을 엔진 옵션으로 변환
+    options = {"echo": settings.DB_ECHO, "pool_pre_ping": settings.DB_POOL_PRE_PING}
+    if make_url(url).get_backend_name() != "sqlite":  # SQLite는 파일 단위 풀을 사용하므로 크기 설정이 없다
+        options.update(
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+            pool_recycle=settings.DB_POOL_RECYCLE,
+        )
+    return options
+
+
 settings = Settings()  # 환경변수
-engine_url = create_engine(url=settings.DATABASE_CONNECTION_STRING, echo=True)  # DB 엔진 생성
\ No newline at end of file
+engine_url = create_engine(settings.DATABASE_CONNECTION_STRING, **engine_options(settings.DATABASE_CONNECTION_STRING))  # DB 엔진 생성(테이블 생성, 관리 명령어용)
+
+async_url = settings.ASYNC_DATABASE_CONNECTION_STRING or to_async_url(settings.DATABASE_CONNECTION_STRING)
+async_engine = create_async_engine(async_url, **engine_options(async_url))  # 라우트에서 사용하는 비동기 DB 엔진
+
+replica_engine = None  # 읽기 전용 복제본 비동기 DB 엔진
+if settings.DATABASE_REPLICA_CONNECTION_STRING:
+    replica_url = to_async_url(settings.DATABASE_REPLICA_CONNECTION_STRING)
+    replica_engine = create_async_engine(replica_url, **engine_options(replica_url))
\ No newline at end of file
@@ -0,0 +1,45 @@
+# database/migration.py
+"""
+스키마 버전 관리(Alembic)
+
+앱 시작 시에는 DB에 기록된 리비전(alembic_version)이 최신 리비전과 같은지만 확인한다.
+테이블 생성/변경은 `alembic upgrade head` 로 실행한다(DB_AUTO_MIGRATE=true 이면 시작 시 자동 실행).
+"""
+from pathlib import Path
+
+from alembic import command
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def alembic_config(url=None):  # 실행 위치와 상관없이 프로젝트의 alembic.ini 사용. url을 주면 .env 대신 사용
+    config = Config(str(ROOT / "alembic.ini"))
+    config.set_main_option("script_location", str(ROOT / "migrations"))
+    if url is not None:
+        config.attributes["url"] = str(url)
+    return config
+
+
+def head_revision():
+    return ScriptDirectory.from_config(alembic_config()).get_current_head()
+
+
+def current_revision(engine):
+    with engine.connect() as connection:
+        return MigrationContext.configure(connection).get_current_revision()
+
+
+def upgrade(url=None):  # 최신 리비전까지 마이그레이션
+    command.upgrade(alembic_config(url), "head")
+
+
+def verify_schema(engine):  # DB 스키마가 최신이 아니면 실행을 중단
+    current, head = current_revision(engine), head_revision()
+    if current != head:
+        raise RuntimeError(
+            f"DB 스키마 버전({current})이 최신 버전({head})과 다릅니다. `alembic upgrade head` 를 실행하세요."
+        )
@@ -1,32 +1,83 @@
 # main.py
 
 from fastapi import FastAPI
-from fastapi.responses import RedirectResponse
+from fastapi.responses import RedirectResponse, ORJSONResponse
+import os
 import uvicorn
 from contextlib import asynccontextmanager
 
-from database.connection import conn
+from database.connection import engine_url, async_engine, replica_engine
+from database.migration import upgrade, verify_schema
+from sqlmodel import Session
+from tools.search import search_backend
+from tools.random_pool import id_pool
+from tools.suggest import suggest_index
+from tools.similar import similar_index
+from tools.index_sync import index_sync
+from tools.snapshot import snapshot_store, export_snapshot
+from tools.http_cache import ensure_versions
+from tools.metrics import MetricsMiddleware, instrument_engine
+from tools.rate_limit import RateLimitMiddleware, MemoryRateLimitBackend
 
 from routes.sayings import saying_router
 from routes.fourchars import fourchar_router
 from routes.category import category_router
+from routes.health import health_router
+from routes.metrics import metrics_router
 
 from database.connection import settings
 
 from starlette.middleware.cors import CORSMiddleware
+from starlette.middleware.gzip import GZipMiddleware
+
+
+# DB 초기화(스키마 버전 확인 등). 워커가 여러 개일 때는 워커를 띄우기 전에 한 번만 실행
+def init_db():
+    if settings.DB_AUTO_MIGRATE:
+        upgrade()  # 최신 스키마로 마이그레이션
+    else:
+        verify_schema(engine_url)  # 스키마 버전이 최신인지만 확인
+    ensure_versions(engine_url)  # HTTP 캐시용 테이블 버전 행 생성
 
 
 # lifesapn : 어플리케이션 시작과 종료 시 실행되는 프로세스 작성
 @asynccontextmanager
 async def lifesapn(app: FastAPI):
     # 앱 시작 시 작동되는 코드 작성
-    conn()  # DB 연결 및 초기화
+    if settings.DB_INIT_ON_STARTUP:
+        init_db()
+    with Session(engine_url) as session:
+        index_sync.mark(session)  # 색인을 만들기 전의 변경 토큰(이후 다른 워커의 쓰기를 따라잡는다)
+        search_backend.build(session)  # 검색 색인 생성
+        id_pool.build(session)  # 랜덤 조회용 id 목록 생성
+        suggest_index.build(session)  # 자동완성 색인 생성
+        similar_index.load_or_build(session, settings.SIMILAR_SNAPSHOT_PATH)  # 추천 색인(파일이 최신이면 읽기만)
+    if settings.SNAPSHOT_PATH:  # 읽기 전용 스냅샷 모드(파일이 없거나 오래됐으면 새로 만든 뒤 mmap으로 연다)
+        snapshot_store.open(engine_url, settings.SNAPSHOT_PATH, settings.SNAPSHOT_CHECK_INTERVAL, settings.SNAPSHOT_REFRESH_DELAY)
+    engine_url.dispose()  # 시작 작업에만 사용한 동기 엔진의 연결 반환
+    index_sync.start(async_engine, settings.INDEX_SYNC_INTERVAL)  # 다른 워커의 쓰기를 메모리 색인에 반영
 
     yield
     # 앱 종료 시 작동되는 코드 작성
+    await index_sync.stop()
+    await async_engine.dispose()  # 커넥션 풀 정리
+    if replica_engine is not None:
+        await replica_engine.dispose()
+    engine_url.dispose()
+
 
+app = FastAPI(lifespan=lifesapn, default_response_class=ORJSONResponse)  # FastAPI 인스턴스 생성(orjson으로 JSON 직렬화)
 
-app = FastAPI(lifespan=lifesapn)  # FastAPI 인스턴스 생성
+
+# 클라이언트별 요청 수 제한(CORS 안쪽에 두어 429 응답에도 CORS 헤더가 붙도록 먼저 등록)
+if settings.RATE_LIMIT_PER_SECOND > 0:
+    app.add_middleware(
+        RateLimitMiddleware,
+        backend=MemoryRateLimitBackend(),
+        rate=settings.RATE_LIMIT_PER_SECOND,
+        burst=settings.RATE_LIMIT_BURST,
+        key_header=settings.RATE_LIMIT_KEY_HEADER,
+    )
 
 
 # CORS 설정(허가할 origin 주소를 리스트에 추가)
@@ -43,10 +94,36 @@ app.add_middleware(
 )
 
 
+# 응답 압축 설정(큰 목록 페이지의 전송량 감소)
+if settings.COMPRESSION == "br":
+    try:
+        from brotli_asgi import BrotliMiddleware  # brotli를 지원하지 않는 클라이언트에는 gzip으로 응답
+        app.add_middleware(BrotliMiddleware, quality=settings.COMPRESSION_LEVEL, minimum_size=settings.COMPRESSION_MINIMUM_SIZE, gzip_fallback=True)
+    except ImportError:
+        app.add_middleware(GZipMiddleware, minimum_size=settings.COMPRESSION_MINIMUM_SIZE, compresslevel=settings.COMPRESSION_LEVEL)
+elif settings.COMPRESSION == "gzip":
+    app.add_middleware(GZipMiddleware, minimum_size=settings.COMPRESSION_MINIMUM_SIZE, compresslevel=settings.COMPRESSION_LEVEL)
+
+
+# 요청 처리 시간 / SQL 통계 수집(가장 바깥 미들웨어라 압축 시간까지 포함)
+if settings.METRICS_ENABLED:
+    instrument_engine(async_engine)
+    if replica_engine is not None:
+        instrument_engine(replica_engine)
+    app.add_middleware(MetricsMiddleware)
+    app.include_router(metrics_router)
+
+
+# 스냅샷 모드: 쓰기가 커밋되면 스냅샷 파일을 다시 만든다(tools/snapshot.py)
+if settings.SNAPSHOT_PATH:
+    snapshot_store.watch_commits()
+
+
 # 라우트 등록
 app.include_router(saying_router, prefix="/saying")
 app.include_router(fourchar_router, prefix="/fourchar")
 app.include_router(category_router, prefix="/category")
+app.include_router(health_router, prefix="/health")
 
 
 # 첫 화면
@@ -59,4 +136,27 @@ async def main() -> dict:
 
 # uvicorn 앱 실행
 if __name__ == "__main__":
-    uvicorn.run("main:app", host=settings.UVICORN_IP, port=settings.UVICORN_PORT, reload=True)
\ No newline at end of file
+    if settings.UVICORN_RELOAD:  # 개발용: 코드 변경 시 자동 재시작(단일 프로세스)
+        uvicorn.run("main:app", host=settings.UVICORN_IP, port=settings.UVICORN_PORT, reload=True)
+    else:  # 운영용: 멀티 워커
+        init_db()  # 스키마 확인은 여기서 한 번만 하고
+        os.environ["DB_INIT_ON_STARTUP"] = "false"  # 워커들은 건너뛴다(환경변수는 워커 프로세스에 상속됨)
+        if settings.SIMILAR_SNAPSHOT_PATH:
+            with Session(engine_url) as session:
+                similar_index.load_or_build(session, settings.SIMILAR_SNAPSHOT_PATH)  # 워커들이 읽기만 하도록 추천 색인 파일을 미리 갱신
+        if settings.SNAPSHOT_PATH:
+            export_snapshot(engine_url, settings.SNAPSHOT_PATH)  # 워커들이 같은 스냅샷 파일을 열도록 미리 생성
+        engine_url.dispose()
+        uvicorn.run(
+            "main:app",
+            host=settings.UVICORN_IP,
+            port=settings.UVICORN_PORT,
+            workers=settings.UVICORN_WORKERS or (os.cpu_count() if settings.INDEX_SYNC_INTERVAL > 0 else 1),  # 색인 동기화를 끄면 워커 1개
+            loop=settings.UVICORN_LOOP,
+            http=settings.UVICORN_HTTP,
+            backlog=settings.UVICORN_BACKLOG,
+            timeout_keep_alive=settings.UVICORN_KEEPALIVE,
+            timeout_graceful_shutdown=settings.UVICORN_GRACEFUL_TIMEOUT,
+            limit_concurrency=settings.UVICORN_LIMIT_CONCURRENCY,
+            proxy_headers=True,
+        )
\ No newline at end of file
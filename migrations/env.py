@@ -0,0 +1,66 @@
+# migrations/env.py
+"""
+Alembic 실행 환경
+
+$ alembic upgrade head                           # 최신 스키마로 변경
+$ alembic revision --autogenerate -m "설명"       # 모델 변경 내용으로 새 리비전 생성
+SQLite에서도 컬럼 변경이 가능하도록 batch 모드(render_as_batch)로 실행한다.
+"""
+from logging.config import fileConfig
+
+from alembic import context
+from sqlalchemy import create_engine
+from sqlmodel import SQLModel
+
+import models.sayings, models.fourchars, models.category, models.versions, models.changes, models.authors  # 모든 테이블을 metadata에 등록  # noqa: F401
+
+
+config = context.config
+target_metadata = SQLModel.metadata
+
+if config.cmd_opts is not None and config.config_file_name is not None:  # alembic 명령어로 실행할 때만 로그 설정(앱 안에서 실행하면 앱 로그 설정 유지)
+    fileConfig(config.config_file_name, disable_existing_loggers=False)
+
+
+def database_url():  # alembic_config(url)로 주소를 받으면 앱 설정(.env)을 읽지 않는다(벤치마크, 테스트)
+    url = config.attributes.get("url")
+    if url is None:
+        from database.connection import settings
+        url = settings.DATABASE_CONNECTION_STRING
+    return url
+
+
+def include_object(object, name, type_, reflected, compare_to):  # 검색 백엔드가 직접 관리하는 FULLTEXT 인덱스는 비교에서 제외
+    return not (type_ == "index" and name and name.startswith("ft_"))
+
+
+def run_migrations_offline():  # SQL 스크립트만 출력(alembic upgrade head --sql)
+    context.configure(
+        url=database_url(),
+        target_metadata=target_metadata,
+        literal_binds=True,
+        render_as_batch=True,
+        include_object=include_object,
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online():
+    engine = create_engine(database_url())
+    with engine.connect() as connection:
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            render_as_batch=True,
+            include_object=include_object,
+        )
+        with context.begin_transaction():
+            context.run_migrations()
+    engine.dispose()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
@@ -0,0 +1,89 @@
+"""baseline
+
+마이그레이션 도입 전(create_all)의 스키마.
+그때부터 사용하던 DB는 `alembic stamp 0001` 로 이 버전을 기록한 뒤 `alembic upgrade head` 를 실행한다.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18 11:00:44.561092
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+revision = '0001'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('category',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('fourchar_categories', sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+    sa.Column('saying_categories', sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+
+    op.create_table('fourchar',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('contents_kr', sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+    sa.Column('category', sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+    sa.Column('contents_detail', sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+    sa.Column('contents_zh', sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+    sa.Column('type_id', sa.Integer(), nullable=True),
+    sa.Column('use_yn', sa.Integer(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('contents_divided', sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+    sa.Column('url_name', sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+    sa.Column('contents_eng', sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+    sa.Column('author', sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+    sa.Column('continent', sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('fourchar', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_fourchar_category'), ['category'], unique=False)
+        batch_op.create_index(batch_op.f('ix_fourchar_contents_detail'), ['contents_detail'], unique=False)
+        batch_op.create_index(batch_op.f('ix_fourchar_contents_kr'), ['contents_kr'], unique=False)
+
+    op.create_table('saying',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('category', sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+    sa.Column('author', sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+    sa.Column('contents_kr', sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+    sa.Column('contents_eng', sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+    sa.Column('type_id', sa.Integer(), nullable=True),
+    sa.Column('use_yn', sa.Integer(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('contents_detail', sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+    sa.Column('url_name', sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+    sa.Column('contents_zh', sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+    sa.Column('contents_divided', sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+    sa.Column('continent', sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('saying', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_saying_author'), ['author'], unique=False)
+        batch_op.create_index(batch_op.f('ix_saying_category'), ['category'], unique=False)
+        batch_op.create_index(batch_op.f('ix_saying_contents_eng'), ['contents_eng'], unique=False)
+        batch_op.create_index(batch_op.f('ix_saying_contents_kr'), ['contents_kr'], unique=False)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('saying', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_saying_contents_kr'))
+        batch_op.drop_index(batch_op.f('ix_saying_contents_eng'))
+        batch_op.drop_index(batch_op.f('ix_saying_category'))
+        batch_op.drop_index(batch_op.f('ix_saying_author'))
+
+    op.drop_table('saying')
+    with op.batch_alter_table('fourchar', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_fourchar_contents_kr'))
+        batch_op.drop_index(batch_op.f('ix_fourchar_contents_detail'))
+        batch_op.drop_index(batch_op.f('ix_fourchar_category'))
+
+    op.drop_table('fourchar')
+    op.drop_table('category')
@@ -0,0 +1,61 @@
+"""initial column
+
+초성/첫 글자 필터용 initial 컬럼과 인덱스 추가(saying: contents_eng 첫 글자, fourchar: contents_kr 첫 글자 초성).
+기존 행은 tools/initials.py 와 같은 기준으로 batch 개씩 채운다.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 19:02:11.204318
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from tools.initials import hangul_initial, alpha_initial
+
+
+revision = '0002'
+down_revision = '0001'
+branch_labels = None
+depends_on = None
+
+
+BATCH = 1000
+
+# {테이블: (값을 계산할 컬럼, 계산 함수)}
+SOURCES = {
+    "saying": ("contents_eng", alpha_initial),
+    "fourchar": ("contents_kr", hangul_initial),
+}
+
+
+def backfill(table, source, compute):
+    rows = sa.table(table, sa.column('id'), sa.column(source), sa.column('initial'))
+    statement = rows.update().where(rows.c.id == sa.bindparam('row_id')).values(initial=sa.bindparam('value'))
+    connection = op.get_bind()
+    last_id = 0
+    while True:
+        batch = connection.execute(
+            sa.select(rows.c.id, rows.c[source]).where(rows.c.id > last_id).order_by(rows.c.id).limit(BATCH)
+        ).all()
+        if not batch:
+            break
+        last_id = batch[-1][0]
+        values = [{"row_id": id, "value": compute(value)} for id, value in batch]
+        values = [value for value in values if value["value"] is not None]
+        if values:
+            connection.execute(statement, values)
+
+
+def upgrade() -> None:
+    for table, (source, compute) in SOURCES.items():
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.add_column(sa.Column('initial', sa.String(length=1), nullable=True))
+            batch_op.create_index(batch_op.f(f'ix_{table}_initial'), ['initial'], unique=False)
+        backfill(table, source, compute)
+
+
+def downgrade() -> None:
+    for table in SOURCES:
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.drop_index(batch_op.f(f'ix_{table}_initial'))
+            batch_op.drop_column('initial')
@@ -0,0 +1,56 @@
+"""category counts
+
+카테고리 테이블 정리
+- 중복 행 중 id가 가장 작은 행만 남기고 saying_categories, fourchar_categories 에 유니크 인덱스 추가(upsert 기준)
+- 데이터 테이블에는 있지만 카테고리 테이블에 없는 카테고리 추가
+- 카테고리별 운영 중(use_yn=1) 데이터 개수 item_count 컬럼 추가 및 계산
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18 19:04:37.918551
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '0003'
+down_revision = '0002'
+branch_labels = None
+depends_on = None
+
+
+# {데이터 테이블: 카테고리 테이블 필드}
+FIELDS = {
+    "saying": "saying_categories",
+    "fourchar": "fourchar_categories",
+}
+
+
+def upgrade() -> None:
+    op.execute(  # MySQL은 DELETE 대상 테이블을 바로 서브쿼리에 쓸 수 없으므로 파생 테이블로 감싼다
+        "DELETE FROM category WHERE id NOT IN (SELECT id FROM ("
+        "SELECT MIN(id) AS id FROM category GROUP BY saying_categories, fourchar_categories"
+        ") AS keep)"
+    )
+    with op.batch_alter_table('category', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('item_count', sa.Integer(), nullable=True))
+        for field in FIELDS.values():
+            batch_op.create_index(batch_op.f(f'ix_category_{field}'), [field], unique=True)
+
+    for table, field in FIELDS.items():
+        op.execute(
+            f"INSERT INTO category ({field}, item_count) "
+            f"SELECT category, 0 FROM {table} WHERE category IS NOT NULL "
+            f"AND category NOT IN (SELECT {field} FROM category WHERE {field} IS NOT NULL) GROUP BY category"
+        )
+        op.execute(
+            f"UPDATE category SET item_count = (SELECT COUNT(*) FROM {table} "
+            f"WHERE {table}.category = category.{field} AND {table}.use_yn = 1) WHERE {field} IS NOT NULL"
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('category', schema=None) as batch_op:
+        for field in FIELDS.values():
+            batch_op.drop_index(batch_op.f(f'ix_category_{field}'))
+        batch_op.drop_column('item_count')
@@ -0,0 +1,29 @@
+"""table version
+
+HTTP 캐시(ETag/Last-Modified)용 테이블별 버전. 행(saying, fourchar, category)은 앱 시작 시 만든다(tools/http_cache.py)
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18 19:06:02.517730
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '0004'
+down_revision = '0003'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('table_version',
+    sa.Column('name', sa.String(length=32), nullable=False),
+    sa.Column('version', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('name')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('table_version')
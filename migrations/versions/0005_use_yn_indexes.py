@@ -0,0 +1,32 @@
+"""use_yn indexes
+
+운영 중(use_yn=1) 목록/카테고리 조회용 (use_yn, id), (use_yn, category, id) 복합 인덱스 추가
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18 19:07:45.032114
+"""
+from alembic import op
+
+
+revision = '0005'
+down_revision = '0004'
+branch_labels = None
+depends_on = None
+
+
+TABLES = ("saying", "fourchar")
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.create_index(f'ix_{table}_use_yn_id', ['use_yn', 'id'], unique=False)
+            batch_op.create_index(f'ix_{table}_use_yn_category_id', ['use_yn', 'category', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.drop_index(f'ix_{table}_use_yn_category_id')
+            batch_op.drop_index(f'ix_{table}_use_yn_id')
@@ -0,0 +1,52 @@
+"""lean table layout
+
+- 검색에 쓰이지 않는 긴 본문 컬럼 인덱스 삭제(LIKE '%..%' 와 n-gram 색인은 B-tree 인덱스를 사용하지 않는다)
+- category 단일 인덱스 삭제((use_yn, category, id) 복합 인덱스가 대신한다)
+- 문자열 컬럼 길이 지정(VARCHAR(255) -> 용도에 맞는 길이)
+  category/author 는 줄어들기 때문에 MySQL strict 모드에서는 길이를 넘는 값이 있으면 실패한다. 먼저 확인할 것:
+  SELECT MAX(CHAR_LENGTH(category)), MAX(CHAR_LENGTH(author)) FROM saying;
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18 11:00:56.263772
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+revision = '0006'
+down_revision = '0005'
+branch_labels = None
+depends_on = None
+
+
+# {테이블: [(컬럼, 새 길이)]}
+LENGTHS = {
+    "saying": [("category", 50), ("author", 100), ("contents_kr", 500), ("contents_eng", 500)],
+    "fourchar": [("category", 50), ("contents_kr", 20), ("contents_detail", 500), ("contents_zh", 20)],
+    "category": [("saying_categories", 50), ("fourchar_categories", 50)],
+}
+
+DROPPED_INDEXES = {
+    "saying": [("ix_saying_category", ["category"]), ("ix_saying_contents_eng", ["contents_eng"]), ("ix_saying_contents_kr", ["contents_kr"])],
+    "fourchar": [("ix_fourchar_category", ["category"]), ("ix_fourchar_contents_detail", ["contents_detail"]), ("ix_fourchar_contents_kr", ["contents_kr"])],
+}
+
+
+def upgrade() -> None:
+    for table, columns in LENGTHS.items():
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            for name, _ in DROPPED_INDEXES.get(table, []):
+                batch_op.drop_index(name)
+            for column, length in columns:
+                batch_op.alter_column(column, existing_type=sqlmodel.sql.sqltypes.AutoString(), type_=sa.String(length), existing_nullable=True)
+
+
+def downgrade() -> None:
+    for table, columns in LENGTHS.items():
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            for column, length in columns:
+                batch_op.alter_column(column, existing_type=sa.String(length), type_=sqlmodel.sql.sqltypes.AutoString(), existing_nullable=True)
+            for name, columns in DROPPED_INDEXES.get(table, []):
+                batch_op.create_index(name, columns, unique=False)
@@ -0,0 +1,45 @@
+"""change log
+
+생성/수정/삭제 기록 테이블(/saying/changes, /fourchar/changes)
+토큰(version)은 쓰기 트랜잭션이 올린 table_version 버전이고, 정리(prune-changes)한 위치는 change_log_state 에 남긴다.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-18 11:04:32.627387
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '0007'
+down_revision = '0006'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('change_log',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('table_name', sa.String(length=16), nullable=False),
+    sa.Column('row_id', sa.Integer(), nullable=False),
+    sa.Column('action', sa.String(length=8), nullable=False),
+    sa.Column('version', sa.Integer(), nullable=False),
+    sa.Column('changed_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('change_log', schema=None) as batch_op:
+        batch_op.create_index('ix_change_log_table_name_version_id', ['table_name', 'version', 'id'], unique=False)
+
+    op.create_table('change_log_state',
+    sa.Column('table_name', sa.String(length=16), nullable=False),
+    sa.Column('pruned_version', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('table_name')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('change_log_state')
+    with op.batch_alter_table('change_log', schema=None) as batch_op:
+        batch_op.drop_index('ix_change_log_table_name_version_id')
+
+    op.drop_table('change_log')
@@ -0,0 +1,49 @@
+"""author aggregate
+
+발화자 집계 테이블(/saying/authors) 추가 및 기존 명언으로 채우기.
+saying.author 단일 인덱스를 발화자별 목록용 (author, use_yn, id) 복합 인덱스로 교체
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-18 11:07:31.309533
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '0008'
+down_revision = '0007'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('author',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(length=100), nullable=False),
+    sa.Column('item_count', sa.Integer(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('author', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_author_name'), ['name'], unique=True)
+
+    with op.batch_alter_table('saying', schema=None) as batch_op:
+        batch_op.drop_index('ix_saying_author')
+        batch_op.create_index('ix_saying_author_use_yn_id', ['author', 'use_yn', 'id'], unique=False)
+
+    op.execute(
+        "INSERT INTO author (name, item_count) "
+        "SELECT author, SUM(CASE WHEN use_yn = 1 THEN 1 ELSE 0 END) FROM saying "
+        "WHERE author IS NOT NULL AND author <> '' GROUP BY author"
+    )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('saying', schema=None) as batch_op:
+        batch_op.drop_index('ix_saying_author_use_yn_id')
+        batch_op.create_index('ix_saying_author', ['author'], unique=False)
+
+    with op.batch_alter_table('author', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_author_name'))
+
+    op.drop_table('author')
@@ -0,0 +1,11 @@
+# models/authors.py
+
+from typing import Optional
+from sqlmodel import Field, SQLModel
+from sqlalchemy import String
+
+
+class Author(SQLModel, table=True):  # 발화자 테이블 모델 클래스(/saying/authors 목록용 집계)
+    id: Optional[int] = Field(default=None, primary_key=True)
+    name: str = Field(index=True, unique=True, sa_type=String(100))  # 발화자(saying.author)
+    item_count: Optional[int] = 0  # 운영 중(use_yn=1)인 명언 개수. 생성/수정/삭제 시 갱신
@@ -1,9 +1,11 @@
 # models/category.py
 
 from sqlmodel import SQLModel, Field
-from typing import List, Optional
+from sqlalchemy import String
+from typing import Optional
 
 class Category(SQLModel, table=True):  # 카테고리 테이블 모델 클래스
     id: Optional[int] = Field(default=None, primary_key=True)
-    fourchar_categories: Optional[str] = None
-    saying_categories: Optional[str] = None
\ No newline at end of file
+    fourchar_categories: Optional[str] = Field(default=None, index=True, unique=True, sa_type=String(50))
+    saying_categories: Optional[str] = Field(default=None, index=True, unique=True, sa_type=String(50))
+    item_count: Optional[int] = 0  # 운영 중(use_yn=1)인 데이터 개수. 생성/수정/삭제 시 갱신
@@ -0,0 +1,30 @@
+# models/changes.py
+
+from typing import Optional
+from sqlmodel import Field, SQLModel
+from sqlalchemy import String, Index
+
+from datetime import datetime
+
+from models.sayings import current_time_kst
+
+
+class ChangeLog(SQLModel, table=True):  # 변경 기록 모델 클래스(/saying/changes, /fourchar/changes 동기화용)
+    __tablename__ = "change_log"
+    __table_args__ = (
+        Index("ix_change_log_table_name_version_id", "table_name", "version", "id"),  # 테이블별로 토큰(version) 이후 변경 조회
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    table_name: str = Field(sa_type=String(16))                # saying, fourchar
+    row_id: int                                                # 변경된 데이터 id
+    action: str = Field(sa_type=String(8))                     # create, update, delete
+    version: int = 0                                           # 변경 토큰. 쓰기 트랜잭션이 올린 table_version 의 버전(커밋 순서대로 증가)
+    changed_at: Optional[datetime] = Field(default_factory=current_time_kst, nullable=True)
+
+
+class ChangeLogState(SQLModel, table=True):  # 테이블별 변경 기록 정리 상태
+    __tablename__ = "change_log_state"
+
+    table_name: str = Field(primary_key=True, sa_type=String(16))  # saying, fourchar
+    pruned_version: int = 0                                         # 정리된 마지막 토큰(이보다 오래된 since는 전체를 다시 받아야 함)
@@ -2,6 +2,7 @@
 
 from typing import Optional
 from sqlmodel import Field, SQLModel
+from sqlalchemy import String, Index
 
 from datetime import datetime, timedelta
 
@@ -13,14 +14,21 @@ def current_time_kst():
 
 class FourChar(SQLModel, table=True):  # 사자성어 테이블 모델 클래스
 
+    # 복합 인덱스: 운영 중(use_yn=1) 목록을 id 역순으로, 카테고리 필터는 카테고리 안에서 id 역순으로 바로 찾는다
+    __table_args__ = (
+        Index("ix_fourchar_use_yn_id", "use_yn", "id"),
+        Index("ix_fourchar_use_yn_category_id", "use_yn", "category", "id"),
+    )
+
     # PK_ID
     id: Optional[int] = Field(default=None, primary_key=True)
 
     # 사용 필드
-    contents_kr: str = Field(index=True, nullable=True)       # 사자성어(한글)*
-    category: str = Field(index=True, nullable=True)          # 카테고리*
-    contents_detail: str = Field(index=True, nullable=True)   # 뜻 풀이*
-    contents_zh: Optional[str] = ""                                      # 사자성어(한문)
+    contents_kr: str = Field(nullable=True, max_length=20, sa_type=String(20))        # 사자성어(한글)*
+    category: str = Field(nullable=True, max_length=50, sa_type=String(50))           # 카테고리*
+    contents_detail: str = Field(nullable=True, max_length=500, sa_type=String(500))   # 뜻 풀이*
+    contents_zh: Optional[str] = Field(default="", max_length=20, sa_type=String(20))  # 사자성어(한문)
+    initial: Optional[str] = Field(default=None, index=True, sa_type=String(1))  # contents_kr 첫 글자 초성, 초성 필터용
 
     # 자동생성 필드
     type_id: Optional[int] = 1
@@ -50,14 +58,50 @@ class FourChar(SQLModel, table=True):  # 사자성어 테이블 모델 클래스
     }
 
 
-class FourCharUpdate(SQLModel):  # 사자성어 수정 모델 클래스
-    url_name: Optional[str] = None
+class FourCharRead(SQLModel):  # 사자성어 목록 조회 모델 클래스(목록/필터 응답에서 사용하는 필드만 조회)
+    id: int
+    category: Optional[str] = None
     contents_kr: Optional[str] = None
+    contents_zh: Optional[str] = None
     contents_detail: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+
+class FourCharCreate(SQLModel):  # 사자성어 생성 모델 클래스(요청 본문 검증용, 길이 제한은 테이블 컬럼 길이와 같음, 넘으면 422)
+    contents_kr: Optional[str] = Field(default=None, max_length=20)
+    category: Optional[str] = Field(default=None, max_length=50)
+    contents_detail: Optional[str] = Field(default=None, max_length=500)
+    contents_zh: Optional[str] = Field(default="", max_length=20)
+    type_id: Optional[int] = 1
+    use_yn: Optional[int] = 1
+    contents_divided: Optional[str] = ""
+    url_name: Optional[str] = ""
+    contents_eng: Optional[str] = ""
+    author: Optional[str] = ""
+    continent: Optional[str] = ""
+
+    # 모델 설정
+    model_config = {
+        "json_schema_extra": {
+            "example": {
+                "category": "카테고리*",
+                "contents_kr": "사자성어(한글)*",
+                "contents_zh": "사자성어(한문)",
+                "contents_detail": "뜻 풀이*"
+            }
+        }
+    }
+
+
+class FourCharUpdate(SQLModel):  # 사자성어 수정 모델 클래스(길이 제한은 테이블 컬럼 길이와 같음, 넘으면 422)
+    url_name: Optional[str] = None
+    contents_kr: Optional[str] = Field(default=None, max_length=20)
+    contents_detail: Optional[str] = Field(default=None, max_length=500)
     type_id: Optional[int] = None
-    category: Optional[str] = None
+    category: Optional[str] = Field(default=None, max_length=50)
     contents_eng: Optional[str] = None
-    contents_zh: Optional[str] = None
+    contents_zh: Optional[str] = Field(default=None, max_length=20)
     contents_divided: Optional[str] = None
     author: Optional[str] = None
     continent: Optional[str] = None
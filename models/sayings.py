@@ -2,6 +2,7 @@
 
 from typing import Optional
 from sqlmodel import Field, SQLModel
+from sqlalchemy import String, Index
 
 from datetime import datetime, timedelta
 
@@ -13,14 +14,22 @@ def current_time_kst():
 
 class Saying(SQLModel, table=True):  # 명언 테이블 모델 클래스
 
+    # 복합 인덱스: 운영 중(use_yn=1) 목록을 id 역순으로, 카테고리 필터는 카테고리 안에서 id 역순으로 바로 찾는다
+    __table_args__ = (
+        Index("ix_saying_use_yn_id", "use_yn", "id"),
+        Index("ix_saying_use_yn_category_id", "use_yn", "category", "id"),
+        Index("ix_saying_author_use_yn_id", "author", "use_yn", "id"),  # 발화자별 명언 목록(/saying/authors/{name})
+    )
+
     # PK_ID
     id: Optional[int] = Field(default=None, primary_key=True)
 
     # 사용 필드
-    category: str = Field(index=True, nullable=True)      # 카테고리*
-    author: str = Field(index=True, nullable=True)        # 발화자*
-    contents_kr: str = Field(index=True, nullable=True)   # 뜻 풀이*
-    contents_eng: str = Field(index=True, default="", nullable=True)      # 영문 명언
+    category: str = Field(nullable=True, max_length=50, sa_type=String(50))      # 카테고리*
+    author: str = Field(nullable=True, max_length=100, sa_type=String(100))   # 발화자*
+    contents_kr: str = Field(nullable=True, max_length=500, sa_type=String(500))  # 뜻 풀이*
+    contents_eng: str = Field(default="", nullable=True, max_length=500, sa_type=String(500))  # 영문 명언
+    initial: Optional[str] = Field(default=None, index=True, sa_type=String(1))  # contents_eng 첫 글자(대문자), 알파벳 필터용
 
     # 자동생성 필드
     type_id: Optional[int] = 0
@@ -48,11 +57,47 @@ class Saying(SQLModel, table=True):  # 명언 테이블 모델 클래스
     }
 
 
-class SayingUpdate(SQLModel):  # 명언 수정 모델 클래스
-    contents_kr: Optional[str] = None   # 수정 필드
-    category: Optional[str] = None      # 수정 필드
-    contents_eng: Optional[str] = None  # 수정 필드
-    author: Optional[str] = None        # 수정 필드
+class SayingRead(SQLModel):  # 명언 목록 조회 모델 클래스(목록/필터 응답에서 사용하는 필드만 조회)
+    id: int
+    category: Optional[str] = None
+    author: Optional[str] = None
+    contents_kr: Optional[str] = None
+    contents_eng: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+
+class SayingCreate(SQLModel):  # 명언 생성 모델 클래스(요청 본문 검증용, 길이 제한은 테이블 컬럼 길이와 같음, 넘으면 422)
+    category: Optional[str] = Field(default=None, max_length=50)
+    author: Optional[str] = Field(default=None, max_length=100)
+    contents_kr: Optional[str] = Field(default=None, max_length=500)
+    contents_eng: Optional[str] = Field(default="", max_length=500)
+    type_id: Optional[int] = 0
+    use_yn: Optional[int] = 1
+    contents_detail: Optional[str] = ""
+    url_name: Optional[str] = ""
+    contents_zh: Optional[str] = ""
+    contents_divided: Optional[str] = ""
+    continent: Optional[str] = ""
+
+    # 모델 설정
+    model_config = {
+        "json_schema_extra": {
+            "example": {
+                "category": "카테고리*",
+                "author": "발화자*",
+                "contents_kr": "뜻 풀이*",
+                "contents_eng": "영문 명언"
+            }
+        }
+    }
+
+
+class SayingUpdate(SQLModel):  # 명언 수정 모델 클래스(길이 제한은 테이블 컬럼 길이와 같음, 넘으면 422)
+    contents_kr: Optional[str] = Field(default=None, max_length=500)   # 수정 필드
+    category: Optional[str] = Field(default=None, max_length=50)       # 수정 필드
+    contents_eng: Optional[str] = Field(default=None, max_length=500)  # 수정 필드
+    author: Optional[str] = Field(default=None, max_length=100)        # 수정 필드
     url_name: Optional[str] = None
     contents_detail: Optional[str] = None
     type_id: Optional[int] = None
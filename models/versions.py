@@ -0,0 +1,17 @@
+# models/versions.py
+
+from typing import Optional
+from sqlmodel import Field, SQLModel
+from sqlalchemy import String
+
+from datetime import datetime
+
+from models.sayings import current_time_kst
+
+
+class TableVersion(SQLModel, table=True):  # 테이블 버전 모델 클래스(HTTP 캐시 ETag/Last-Modified 계산용)
+    __tablename__ = "table_version"
+
+    name: str = Field(primary_key=True, sa_type=String(32))  # 테이블명(saying, fourchar, category)
+    version: int = 0                                          # 쓰기마다 1씩 증가
+    updated_at: Optional[datetime] = Field(default_factory=current_time_kst, nullable=True)  # 마지막 쓰기 시간(한국 시간)
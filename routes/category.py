@@ -2,25 +2,37 @@
 
 from fastapi import APIRouter, Depends, Query
 from sqlmodel import select
-from typing import List
 
 from models.category import Category
 from models.sayings import Saying
 from models.fourchars import FourChar
+from tools.categories import sync_statements
+from tools.http_cache import http_cache, bump_version
+from tools.snapshot import snapshot_store
 
-from database.connection import get_session
+from database.connection import get_session, get_read_session
 
 
 category_router = APIRouter(tags=["Category"])
 
 
-@category_router.get("/")  # GET READ 모든 select_category(saying or fourchar)의 카테고리들
-async def retrieve_all_categories(select_category: str=Query(default=None), session=Depends(get_session)):
+@category_router.get("/", dependencies=[Depends(http_cache("category", snapshot=True))])  # GET READ 모든 select_category(saying or fourchar)의 카테고리들
+async def retrieve_all_categories(select_category: str=Query(default=None), with_counts: bool=Query(default=False), session=Depends(get_read_session)):
+    if snapshot_store.enabled:  # 스냅샷 모드(tools/snapshot.py)
+        return snapshot_store.current.categories(select_category, with_counts)
+
     if select_category == "fourchar":
-        statement = select(Category.fourchar_categories).where(Category.fourchar_categories.isnot(None)).order_by(Category.fourchar_categories.asc())
+        column = Category.fourchar_categories
     else:
-        statement = select(Category.saying_categories).where(Category.saying_categories.isnot(None)).order_by(Category.saying_categories.asc())
-    categories = session.exec(statement).all()
+        column = Category.saying_categories
+
+    if with_counts:  # 카테고리별 데이터 개수 포함
+        statement = select(column, Category.item_count).where(column.isnot(None)).order_by(column.asc())
+        rows = (await session.exec(statement)).all()
+        return [{"name": name, "count": count or 0} for name, count in rows]
+
+    statement = select(column).where(column.isnot(None)).order_by(column.asc())
+    categories = (await session.exec(statement)).all()
     return categories
 
 
@@ -33,23 +45,13 @@ async def new_all_categories(session=Depends(get_session)) -> dict:
     """
     카테고리 테이블의 데이터를 업데이트 합니다.
     """
-    # 명언 데이터의 카테고리 불러오기 & category_set에 데이터 넣기
-    statement = select(Saying.category).distinct()
-    saying_categories = session.exec(statement).all()
-    
-    # 사자성어 데이터의 카테고리 불러오기 & category_set에 데이터 넣기
-    statement = select(FourChar.category).distinct()
-    fourchar_categories = session.exec(statement).all()
-
-    for cat in saying_categories:
-        saying_category = Category(saying_categories=cat)
-        session.add(saying_category)
-    
-    for cat in fourchar_categories:
-        fourchar_category = Category(fourchar_categories=cat)
-        session.add(fourchar_category)
-    
-    session.commit()
+    # 명언, 사자성어 데이터의 카테고리 중 없는 것만 추가 & 카테고리별 개수 다시 계산
+    for Table in (Saying, FourChar):
+        for statement in sync_statements(Table):
+            await session.exec(statement)
+
+    await bump_version(session, "category")  # HTTP 캐시 버전 증가
+    await session.commit()
     return {
         "message": "카테고리 업데이트 했습니다."
-    }
\ No newline at end of file
+    }
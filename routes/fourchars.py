@@ -1,15 +1,30 @@
 # routes/fourchars.py
 
-from fastapi import APIRouter, HTTPException, status, Depends, Query
-from sqlmodel import select, delete, func, or_, and_
+from fastapi import APIRouter, HTTPException, status, Depends, Query, Body, Request
+from fastapi.responses import StreamingResponse
+from sqlmodel import or_
 from typing import List, Optional
 from datetime import datetime, timedelta
 
-from models.fourchars import FourChar, FourCharUpdate
-from models.category import Category
-from tools.pagination import paging
+from models.fourchars import FourChar, FourCharRead, FourCharCreate, FourCharUpdate, current_time_kst
+from tools.pagination import paging, keyset_paging, keyset_page, projection, as_dicts, count_statement
+from tools.count_cache import count_cache
+from tools.search import search_backend, clean_keyword
+from tools.initials import fill_initial
+from tools.cache import item_cache
+from tools.random_pool import id_pool, daily_picks
+from tools.suggest import suggest_index
+from tools.similar import similar_index, similar_items
+from tools.bulk import bulk_import, bulk_export
+from tools.batch import parse_ids, fetch_batch
+from tools.coalesce import coalesce
+from tools.changes import record_change, read_changes
+from tools.facets import facet_counts
+from tools.categories import apply_category_change
+from tools.http_cache import http_cache, bump_version
+from tools.snapshot import snapshot_store
 
-from database.connection import get_session
+from database.connection import get_session, get_read_session, settings
 
 
 fourchar_router = APIRouter(tags=["FourChars"])
@@ -17,22 +32,35 @@ fourchar_router = APIRouter(tags=["FourChars"])
 
 ## CRUD START ############################################################################################## 
 
-@fourchar_router.get("", response_model=dict)  # GET READ 모든 사자성어 데이터들
-async def retrieve_all_fourchars(p: int=Query(default=1), size: int=Query(default=15), session=Depends(get_session)) -> dict:
+@fourchar_router.get("", response_model=dict, dependencies=[Depends(http_cache("fourchar", snapshot=True))])  # GET READ 모든 사자성어 데이터들
+@coalesce  # 동시에 들어온 같은 조건 요청은 DB 조회 1번으로 처리(tools/coalesce.py)
+async def retrieve_all_fourchars(p: int=Query(default=1), size: int=Query(default=15, ge=1, le=100), cursor: Optional[str]=Query(default=None), session=Depends(get_read_session)) -> dict:
 
     """
     저장된 모든 사자성어들 조회
     """
+    if snapshot_store.enabled:  # 스냅샷 모드(DB 조회 없음, tools/snapshot.py)
+        return snapshot_store.current.list("fourchar", p, size, cursor)
+
+    if cursor is not None:  # 커서 모드(cursor=빈 값이면 첫 페이지)
+        statement = keyset_paging(cursor=cursor, size=size, Table=FourChar, statement=projection(FourChar, FourCharRead))
+        fourchars = (await session.exec(statement)).all()
+        return keyset_page(fourchars, size)
+
     # 토탈페이지 확인
-    total_record = session.exec(select(func.count(FourChar.id))).one()
+    cache_key = count_cache.key("fourchar")
+    total_record = count_cache.get(cache_key)
+    if total_record is None:
+        total_record = (await session.exec(count_statement(FourChar))).one()  # 운영 중(use_yn==1)인 데이터만
+        count_cache.set(cache_key, total_record)
     total_page = (total_record // size) + bool(total_record % size)
     if p > total_page:
         p = total_page
     
     # 페이징 처리
-    statement = select(FourChar)
+    statement = projection(FourChar, FourCharRead)  # 사용하는 컬럼만 조회
     statement = paging(page=p, size=size, Table=FourChar, statement=statement)
-    fourchars = session.exec(statement).all()
+    fourchars = as_dicts((await session.exec(statement)).all())
 
     return {
         "total_rows": total_record,
@@ -41,14 +69,95 @@ async def retrieve_all_fourchars(p: int=Query(default=1), size: int=Query(defaul
     }
 
 
+@fourchar_router.get("/random", response_model=FourChar)  # GET READ 임의의 사자성어 데이터
+async def retrieve_random_fourchar(category: str=Query(default=None), daily: bool=Query(default=False), session=Depends(get_read_session)) -> FourChar:
+    """
+    임의의 사자성어 조회(daily=true 이면 오늘의 사자성어)
+    """
+    if daily:
+        id = await daily_picks.choice(session, FourChar, category, current_time_kst().date())  # 모든 워커에서 같은 데이터
+    else:
+        id = id_pool.choice("fourchar", category)  # tools/random_pool.py 메모리 id 목록에서 선택
+
+    if id is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="조건에 맞는 사자성어가 존재하지 않습니다."
+        )
+    return await retrieve_fourchar(id, session)
+
+
+@fourchar_router.get("/export")  # GET READ 전체 사자성어 데이터 내보내기(스트리밍)
+async def export_fourchars(format: str=Query(default="ndjson", pattern="^(ndjson|csv)$"), batch: int=Query(default=settings.BULK_BATCH_SIZE, ge=1)):
+    """
+    전체 사자성어 내보내기(NDJSON 또는 CSV)
+    """
+    media_type = "text/csv" if format == "csv" else "application/x-ndjson"
+    return StreamingResponse(
+        bulk_export(FourChar, format, batch),  # tools/bulk.py
+        media_type=media_type,
+        headers={"Content-Disposition": f"attachment; filename=fourchar.{format}"}
+    )
+
+
+@fourchar_router.get("/batch", response_model=dict, dependencies=[Depends(http_cache("fourchar"))])  # GET READ 여러 사자성어 데이터
+async def retrieve_fourchar_batch(ids: List[str]=Query(default=None), session=Depends(get_read_session)) -> dict:
+    """
+    여러 id 한 번에 조회(ids=1,2,3 또는 ids=1&ids=2). 요청 순서대로 content, 없는 id는 missing
+    """
+    return await fetch_batch(session, FourChar, parse_ids(ids))  # tools/batch.py
+
+
+@fourchar_router.post("/batch", response_model=dict)  # POST READ 여러 사자성어 데이터(id가 많아 URL이 길어질 때)
+async def retrieve_fourchar_batch_post(ids: List[int]=Body(embed=True), session=Depends(get_read_session)) -> dict:
+    """
+    여러 id 한 번에 조회. 본문: {"ids": [1, 2, 3]}
+    """
+    return await fetch_batch(session, FourChar, parse_ids(ids))
+
+
+@fourchar_router.get("/changes", response_model=dict, dependencies=[Depends(http_cache("fourchar"))])  # GET READ 변경된 사자성어 데이터(동기화)
+async def retrieve_fourchar_changes(since: Optional[int]=Query(default=None, ge=0), limit: int=Query(default=500, ge=1, le=5000), session=Depends(get_read_session)) -> dict:
+    """
+    since(변경 토큰) 이후 생성/수정/삭제된 데이터 조회. 응답의 next를 다음 요청의 since로 사용(has_more가 true면 이어서 요청)
+    """
+    return await read_changes(session, FourChar, FourCharRead, since, limit)  # tools/changes.py
+
+
+@fourchar_router.get("/suggest", response_model=dict)  # GET READ 자동완성
+async def suggest_fourchar(q: str=Query(min_length=1), limit: int=Query(default=10, ge=1, le=50)) -> dict:
+    """
+    사자성어 한글, 한문 접두어 자동완성(입력 중인 한글 자모도 지원). DB를 조회하지 않는다
+    """
+    return {
+        "q": q,
+        "content": suggest_index.suggest("fourchar", q, limit)  # tools/suggest.py
+    }
+
+
 @fourchar_router.get("/{id}", response_model=FourChar)  # GET READ 단일 사자성어 데이터
-async def retrieve_fourchar(id: int, session=Depends(get_session)) -> FourChar:
+async def retrieve_fourchar(id: int, session=Depends(get_read_session)) -> FourChar:
     """
     사자성어 조회
     """
-    fourchar = session.get(FourChar, id)
-    if fourchar:
-        return fourchar
+    if snapshot_store.enabled:  # 스냅샷 모드
+        data = snapshot_store.current.get("fourchar", id)
+        if data is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="선택한 ID를 가진 사자성어가 존재하지 않습니다."
+            )
+        return data
+
+    cached = await item_cache.get("fourchar", id)  # tools/cache.py 단일 조회 캐시
+    if cached is not None:
+        return cached
+
+    fourchar = await session.get(FourChar, id)
+    if fourchar and fourchar.use_yn == 1:  # 삭제(use_yn=0)된 데이터는 404
+        data = fourchar.model_dump()
+        await item_cache.set("fourchar", id, data)
+        return data
     
     raise HTTPException(
         status_code=status.HTTP_404_NOT_FOUND,
@@ -56,42 +165,78 @@ async def retrieve_fourchar(id: int, session=Depends(get_session)) -> FourChar:
     )
 
 
-@fourchar_router.post("/new", response_model=FourChar)  # POST CREATE 새 사자성어 데이터
-async def create_new_fourchar(new_fourchar: FourChar, session=Depends(get_session)) -> FourChar:
+@fourchar_router.get("/{id}/similar", response_model=dict, dependencies=[Depends(http_cache("fourchar"))])  # GET READ 비슷한 사자성어 데이터
+async def retrieve_similar_fourchars(id: int, size: int=Query(default=10, ge=1, le=50), session=Depends(get_read_session)) -> dict:
     """
-    사자성어 새로 생성
+    본문이 비슷한 사자성어 최대 size개(유사도 score 높은 순, tools/similar.py)
     """
-    category_name = new_fourchar.category
+    response = await similar_items(session, FourChar, id, size)
+    if response is not None:
+        return response
 
-    statement = select(Category).where(Category.fourchar_categories == category_name)
-    category = session.exec(statement).first()
+    raise HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail="선택한 ID를 가진 사자성어가 존재하지 않습니다."
+    )
 
-    if not category:
-        category = Category(fourchar_categories=category_name)
-        session.add(category)
-        session.commit()
-        session.refresh(category)
 
+@fourchar_router.post("/new", response_model=FourChar)  # POST CREATE 새 사자성어 데이터
+async def create_new_fourchar(new_data: FourCharCreate, session=Depends(get_session)) -> FourChar:
+    """
+    사자성어 새로 생성
+    """
+    new_fourchar = FourChar(**new_data.model_dump())  # 길이 등 검증을 마친 본문으로 테이블 모델 생성
+    await apply_category_change(session, "fourchar", after=(new_fourchar.category, new_fourchar.use_yn))  # 카테고리 upsert 및 개수 갱신
+
+    fill_initial(new_fourchar)  # 초성/첫 글자 필드 계산
     session.add(new_fourchar)
-    session.commit()
-    session.refresh(new_fourchar)  # 캐시 데이터 업데이트
+    await session.flush()  # id 생성
+    await bump_version(session, "fourchar", "category")  # HTTP 캐시 버전 증가
+    await record_change(session, "fourchar", new_fourchar.id, "create")  # 변경 기록(tools/changes.py)
+    await session.commit()
+    await session.refresh(new_fourchar)  # 캐시 데이터 업데이트
+    count_cache.adjust("fourchar", int(new_fourchar.use_yn == 1))  # 전체 개수 캐시 갱신
+    search_backend.index(new_fourchar)  # 검색 색인 갱신
+    await item_cache.invalidate("fourchar", new_fourchar.id)
+    id_pool.update(new_fourchar)  # 랜덤 조회 목록 갱신
+    suggest_index.update(new_fourchar)  # 자동완성 색인 갱신
+    similar_index.update(new_fourchar)  # 추천 색인 갱신
     return new_fourchar
 
 
+@fourchar_router.post("/bulk")  # POST CREATE 사자성어 데이터 대량 가져오기
+async def bulk_import_fourchars(request: Request, batch: int=Query(default=settings.BULK_BATCH_SIZE, ge=1), session=Depends(get_session)) -> dict:
+    """
+    사자성어 대량 생성. 본문은 NDJSON(한 줄에 JSON 1개) 또는 CSV(Content-Type: text/csv, 첫 줄 헤더)
+    """
+    return await bulk_import(request.stream(), request.headers.get("content-type"), FourChar, FourCharUpdate, batch, session)  # tools/bulk.py
+
+
 @fourchar_router.put("/edit/{id}", response_model=FourChar)  # PUT UPDATE 기존 사자성어 데이터
 async def update_fourchar(id: int, new_data: FourCharUpdate, session=Depends(get_session)) -> FourChar:
     """
     사자성어 수정
     """
-    fourchar = session.get(FourChar, id)
+    fourchar = await session.get(FourChar, id)
     if fourchar:
+        before = (fourchar.category, fourchar.use_yn)
         fourchar_data = new_data.model_dump(exclude_unset=True)  # 클라이언트가 작성한 데이터만 변경하는 dict 생성
         fourchar_data["updated_at"] = (datetime.utcnow() + timedelta(hours=9)).replace(microsecond=0)  # updated_at 컬럼에 업데이트 시간 추가
         for key, value in fourchar_data.items():
             setattr(fourchar, key, value)  # setattr(object, name, value) >>> object에 존재하는 속성의 값을 바꾸거나, 새로운 속성을 생성하여 값을 부여한다.
+        fill_initial(fourchar)  # 초성/첫 글자 필드 재계산
+        await apply_category_change(session, "fourchar", before=before, after=(fourchar.category, fourchar.use_yn))
         session.add(fourchar)
-        session.commit()
-        session.refresh(fourchar)
+        await bump_version(session, "fourchar", "category")
+        await record_change(session, "fourchar", id, "update")
+        await session.commit()
+        await session.refresh(fourchar)
+        count_cache.invalidate("fourchar")  # 카테고리 등이 바뀌었을 수 있으므로 개수 캐시 무효화
+        search_backend.index(fourchar)
+        await item_cache.invalidate("fourchar", id)  # 단일 조회 캐시 무효화
+        id_pool.update(fourchar)
+        suggest_index.update(fourchar)
+        similar_index.update(fourchar)
         return fourchar
     
     raise HTTPException(
@@ -100,14 +245,30 @@ async def update_fourchar(id: int, new_data: FourCharUpdate, session=Depends(get
     )
 
 @fourchar_router.delete("/delete/{id}")  # DELETE 기존 사자성어 데이터
-async def delete_fourchar(id: int, session=Depends(get_session)) -> dict:
+async def delete_fourchar(id: int, hard: bool=Query(default=False), session=Depends(get_session)) -> dict:
     """
-    사자성어 삭제
+    사자성어 삭제(기본은 use_yn=0 으로 바꾸는 소프트 삭제, hard=true 이면 행 삭제)
     """
-    fourchar = session.get(FourChar, id)
+    fourchar = await session.get(FourChar, id)
     if fourchar:
-        session.delete(fourchar)
-        session.commit()
+        before = (fourchar.category, fourchar.use_yn)
+        if hard:
+            await apply_category_change(session, "fourchar", before=before)
+            await session.delete(fourchar)
+        else:
+            fourchar.use_yn = 0
+            fourchar.updated_at = current_time_kst()
+            await apply_category_change(session, "fourchar", before=before, after=(fourchar.category, 0))
+            session.add(fourchar)
+        await bump_version(session, "fourchar", "category")
+        await record_change(session, "fourchar", id, "delete")
+        await session.commit()
+        count_cache.adjust("fourchar", -int(before[1] == 1))  # 전체 개수 캐시 갱신
+        search_backend.remove(FourChar, id)
+        await item_cache.invalidate("fourchar", id)
+        id_pool.remove("fourchar", id)
+        suggest_index.remove("fourchar", id)
+        similar_index.remove("fourchar", id)
         return {
             "message": "사자성어를 삭제했습니다."
         }
@@ -123,57 +284,82 @@ async def delete_fourchar(id: int, session=Depends(get_session)) -> dict:
 카테고리들(List), 검색어(Str), 초성 첫글자들(List)
 필터링 해주는 함수
 """
-@fourchar_router.get("/filter/", response_model=dict)
+@fourchar_router.get("/filter/", response_model=dict, dependencies=[Depends(http_cache("fourchar", snapshot=True))])
+@coalesce  # 동시에 들어온 같은 조건 요청은 DB 조회 1번으로 처리(tools/coalesce.py)
 async def fourchar_filtering(
         categories: List[str]=Query(default=None),
         keyword: str=Query(default=None),
         consonants: List[str]=Query(default=None),
         p: int=Query(default=1),
-        size: int=Query(default=15),
-        session=Depends(get_session)
+        size: int=Query(default=15, ge=1, le=100),
+        cursor: Optional[str]=Query(default=None),
+        estimate: bool=Query(default=False),
+        order: str=Query(default="latest"),
+        facets: bool=Query(default=False),
+        session=Depends(get_read_session)
         ) -> dict:
     
-    statement = select(FourChar)
+    keyword = clean_keyword(keyword)  # 앞뒤 공백 제거, 소문자(검색 조건과 개수 캐시 키가 같은 값을 사용)
+
+    if snapshot_store.enabled:  # 스냅샷 모드(미리 만든 카테고리/초성 색인 사용)
+        return snapshot_store.current.filter("fourchar", categories, keyword, consonants, p, size, cursor, order, facets)
+
+    statement = projection(FourChar, FourCharRead)  # 사용하는 컬럼만 조회
 
     if categories:  # 카테고리 필터가 됐다면,
         conditions = [FourChar.category==cat for cat in categories]
         statement = statement.where(or_(*conditions))
 
     if keyword:  # 검색어 필터가 됐다면,
-        statement = statement.where(or_(FourChar.contents_detail.like(f"%{keyword}%"), FourChar.contents_kr.like(f"%{keyword}%"), FourChar.contents_zh.like(f"%{keyword}%")))
+        statement = statement.where(search_backend.condition(FourChar, keyword))  # tools/search.py 검색 백엔드
 
     if consonants:  # 초성 필터가 됐다면,
-        ranges = {
-                "ㄱ": ("가", "나"),
-                "ㄴ": ("나", "다"),
-                "ㄷ": ("다", "라"),
-                "ㄹ": ("라", "마"),
-                "ㅁ": ("마", "바"),
-                "ㅂ": ("바", "사"),
-                "ㅅ": ("사", "아"),
-                "ㅇ": ("아", "자"),
-                "ㅈ": ("자", "차"),
-                "ㅊ": ("차", "카"),
-                "ㅋ": ("카", "타"),
-                "ㅌ": ("타", "파"),
-                "ㅍ": ("파", "하"),
-                "ㅎ": ("하", "힣"),
-                }
-        conditions = [and_(ranges[consonant][0] <= FourChar.contents_kr, FourChar.contents_kr < ranges[consonant][1]) for consonant in consonants]
-        statement = statement.where(or_(*conditions))
+        statement = statement.where(FourChar.initial.in_(consonants))  # initial 인덱스 조회
+
+    facet = None
+    if facets:  # 카테고리/초성별 개수(GROUP BY 쿼리 1번, tools/facets.py)
+        facet = await facet_counts(session, FourChar, keyword, categories, consonants)
+
+    if cursor is not None:  # 커서 모드
+        statement = keyset_paging(cursor=cursor, size=size, Table=FourChar, statement=statement)
+        filtered_fourchars = (await session.exec(statement)).all()
+        page = keyset_page(filtered_fourchars, size)
+        if facets:
+            page["facets"] = facet
+        return page
 
     # 토탈 페이지 확인
-    total_record = session.exec(select(func.count()).select_from(statement)).one()
+    estimated = False
+    cache_key = count_cache.key("fourchar", categories=categories, keyword=keyword, consonants=consonants)
+    total_record = count_cache.get(cache_key)
+    if total_record is None and estimate and keyword:  # 검색어 필터는 정해진 개수까지만 세서 추정값을 반환
+        limit = settings.COUNT_ESTIMATE_LIMIT
+        total_record = (await session.exec(count_statement(FourChar, statement, limit=limit))).one()
+        estimated = total_record >= limit
+        if not estimated:  # 제한보다 적으면 정확한 값이므로 캐시
+            count_cache.set(cache_key, total_record)
+    elif total_record is None:
+        total_record = (await session.exec(count_statement(FourChar, statement))).one()
+        count_cache.set(cache_key, total_record)
     total_page = (total_record // size) + bool(total_record % size)
     if p > total_page:
         p = total_page
     
+    if keyword and order == "relevance":  # 관련도 정렬(같은 관련도는 최신순)
+        score = search_backend.relevance(FourChar, keyword)
+        if score is not None:
+            statement = statement.order_by(score.desc())
+
     # 페이징 처리
     statement = paging(page=p, size=size, Table=FourChar, statement=statement)
-    filtered_fourchars = session.exec(statement).all()
+    filtered_fourchars = as_dicts((await session.exec(statement)).all())
 
-    return {
+    response = {
         "total_rows": total_record,
         "total_page": total_page,
+        "estimated": estimated,
         "content": filtered_fourchars
-    }
\ No newline at end of file
+    }
+    if facets:
+        response["facets"] = facet
+    return response
\ No newline at end of file
@@ -0,0 +1,55 @@
+# routes/health.py
+
+from fastapi import APIRouter, Response, status
+from sqlalchemy import text
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from database.connection import async_engine, replica_engine
+from tools.cache import item_cache
+
+
+health_router = APIRouter(tags=["Health"])
+
+
+def pool_status(engine):  # 커넥션 풀 사용 현황
+    pool = engine.pool
+    stats = {"pool": type(pool).__name__, "status": pool.status()}
+    for name in ("size", "checkedin", "checkedout", "overflow"):  # QueuePool 계열만 제공하는 값
+        if hasattr(pool, name):
+            stats[name] = getattr(pool, name)()
+    return stats
+
+
+async def ping(engine):  # SELECT 1 로 연결 확인
+    try:
+        async with AsyncSession(engine) as session:
+            await session.exec(text("SELECT 1"))
+        return True
+    except Exception:
+        return False
+
+
+@health_router.get("/db")  # GET DB 연결 및 커넥션 풀 상태
+async def db_health(response: Response) -> dict:
+    """
+    DB 연결 상태와 커넥션 풀(checkout, overflow) 현황 조회
+    """
+    engines = {"primary": async_engine}
+    if replica_engine is not None:
+        engines["replica"] = replica_engine
+
+    result = {}
+    for name, engine in engines.items():
+        result[name] = {"ok": await ping(engine), **pool_status(engine)}
+
+    if not all(stats["ok"] for stats in result.values()):
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    return result
+
+
+@health_router.get("/cache")  # GET 단일 조회 캐시 상태
+async def cache_health() -> dict:
+    """
+    단일 조회 캐시 적중(hit/miss) 현황 조회
+    """
+    return item_cache.stats()
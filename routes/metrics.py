@@ -0,0 +1,50 @@
+# routes/metrics.py
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from database.connection import async_engine, replica_engine
+from tools.cache import item_cache
+from tools.metrics import metrics
+from tools.coalesce import single_flight
+
+
+metrics_router = APIRouter(tags=["Metrics"])
+
+
+def pool_lines():  # 커넥션 풀 사용 현황(QueuePool 계열만)
+    engines = {"primary": async_engine}
+    if replica_engine is not None:
+        engines["replica"] = replica_engine
+
+    lines = ["# HELP db_pool_connections 커넥션 풀 연결 수", "# TYPE db_pool_connections gauge"]
+    for name, engine in engines.items():
+        pool = engine.pool
+        for state in ("checkedin", "checkedout", "overflow"):
+            if hasattr(pool, state):
+                lines.append(f'db_pool_connections{{engine="{name}",state="{state}"}} {getattr(pool, state)()}')
+    return lines
+
+
+def cache_lines():  # 단일 조회 캐시 적중 현황
+    stats = item_cache.stats()
+    return [
+        "# HELP item_cache_requests_total 단일 조회 캐시 조회 수",
+        "# TYPE item_cache_requests_total counter",
+        f'item_cache_requests_total{{result="hit"}} {stats["hits"]}',
+        f'item_cache_requests_total{{result="miss"}} {stats["misses"]}',
+        "# HELP coalesced_requests_total 실행 중인 같은 조회의 결과를 같이 받은 요청 수",
+        "# TYPE coalesced_requests_total counter",
+        f"coalesced_requests_total {single_flight.shared}",
+    ]
+
+
+metrics.collectors.extend([pool_lines, cache_lines])
+
+
+@metrics_router.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)  # GET Prometheus 수집용
+async def retrieve_metrics() -> PlainTextResponse:
+    """
+    라우트별 처리 시간 히스토그램, SQL 실행 수/시간, 커넥션 풀, 캐시 현황(Prometheus 텍스트 형식)
+    """
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
@@ -1,15 +1,31 @@
 # routes/sayings.py
 
-from fastapi import APIRouter, HTTPException, status, Depends, Query, Body
-from sqlmodel import select, delete, func, or_
+from fastapi import APIRouter, HTTPException, status, Depends, Query, Body, Request
+from fastapi.responses import StreamingResponse
+from sqlmodel import or_
 from typing import List, Optional
 from datetime import datetime, timedelta
 
-from models.sayings import Saying, SayingUpdate
-from models.category import Category
-from tools.pagination import paging
+from models.sayings import Saying, SayingRead, SayingCreate, SayingUpdate, current_time_kst
+from tools.pagination import paging, keyset_paging, keyset_page, projection, as_dicts, count_statement
+from tools.count_cache import count_cache
+from tools.search import search_backend, clean_keyword
+from tools.initials import fill_initial
+from tools.cache import item_cache
+from tools.random_pool import id_pool, daily_picks
+from tools.suggest import suggest_index
+from tools.similar import similar_index, similar_items
+from tools.bulk import bulk_import, bulk_export
+from tools.batch import parse_ids, fetch_batch
+from tools.coalesce import coalesce
+from tools.changes import record_change, read_changes
+from tools.facets import facet_counts
+from tools.categories import apply_category_change
+from tools.authors import apply_author_change, author_page
+from tools.http_cache import http_cache, bump_version
+from tools.snapshot import snapshot_store
 
-from database.connection import get_session
+from database.connection import get_session, get_read_session, settings
 
 
 saying_router = APIRouter(tags=["Sayings"])
@@ -17,21 +33,34 @@ saying_router = APIRouter(tags=["Sayings"])
 
 ## CRUD START ############################################################################################## 
 
-@saying_router.get("", response_model=dict)  # GET READ 모든 명언 데이터들
-async def retrieve_all_sayings(p: int=Query(default=1), size: int=Query(default=15), session=Depends(get_session)) -> dict:
+@saying_router.get("", response_model=dict, dependencies=[Depends(http_cache("saying", snapshot=True))])  # GET READ 모든 명언 데이터들
+@coalesce  # 동시에 들어온 같은 조건 요청은 DB 조회 1번으로 처리(tools/coalesce.py)
+async def retrieve_all_sayings(p: int=Query(default=1), size: int=Query(default=15, ge=1, le=100), cursor: Optional[str]=Query(default=None), session=Depends(get_read_session)) -> dict:
     """
     저장된 명언 데이터들 조회
     """
+    if snapshot_store.enabled:  # 스냅샷 모드(DB 조회 없음, tools/snapshot.py)
+        return snapshot_store.current.list("saying", p, size, cursor)
+
+    if cursor is not None:  # 커서 모드(cursor=빈 값이면 첫 페이지)
+        statement = keyset_paging(cursor=cursor, size=size, Table=Saying, statement=projection(Saying, SayingRead))
+        sayings = (await session.exec(statement)).all()
+        return keyset_page(sayings, size)
+
     # 토탈 페이지 확인
-    total_record = session.exec(select(func.count(Saying.id))).one()
+    cache_key = count_cache.key("saying")
+    total_record = count_cache.get(cache_key)
+    if total_record is None:
+        total_record = (await session.exec(count_statement(Saying))).one()  # 운영 중(use_yn==1)인 데이터만
+        count_cache.set(cache_key, total_record)
     total_page = (total_record // size) + bool(total_record % size)
     if p > total_page:
         p = total_page
 
     # 페이징 처리
-    statement = select(Saying)
+    statement = projection(Saying, SayingRead)  # 사용하는 컬럼만 조회
     statement = paging(page=p, size=size, Table=Saying, statement=statement)  # tools/pagination.py 페이지 처리 툴
-    sayings = session.exec(statement).all()
+    sayings = as_dicts((await session.exec(statement)).all())
 
     return {
         "total_rows": total_record,
@@ -40,14 +69,113 @@ async def retrieve_all_sayings(p: int=Query(default=1), size: int=Query(default=
     }
 
 
+@saying_router.get("/random", response_model=Saying)  # GET READ 임의의 명언 데이터
+async def retrieve_random_saying(category: str=Query(default=None), daily: bool=Query(default=False), session=Depends(get_read_session)) -> Saying:
+    """
+    임의의 명언 조회(daily=true 이면 오늘의 명언)
+    """
+    if daily:
+        id = await daily_picks.choice(session, Saying, category, current_time_kst().date())  # 모든 워커에서 같은 데이터
+    else:
+        id = id_pool.choice("saying", category)  # tools/random_pool.py 메모리 id 목록에서 선택
+
+    if id is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="조건에 맞는 데이터가 존재하지 않습니다."
+        )
+    return await retrieve_saying(id, session)
+
+
+@saying_router.get("/export")  # GET READ 전체 명언 데이터 내보내기(스트리밍)
+async def export_sayings(format: str=Query(default="ndjson", pattern="^(ndjson|csv)$"), batch: int=Query(default=settings.BULK_BATCH_SIZE, ge=1)):
+    """
+    전체 명언 내보내기(NDJSON 또는 CSV)
+    """
+    media_type = "text/csv" if format == "csv" else "application/x-ndjson"
+    return StreamingResponse(
+        bulk_export(Saying, format, batch),  # tools/bulk.py
+        media_type=media_type,
+        headers={"Content-Disposition": f"attachment; filename=saying.{format}"}
+    )
+
+
+@saying_router.get("/batch", response_model=dict, dependencies=[Depends(http_cache("saying"))])  # GET READ 여러 명언 데이터
+async def retrieve_saying_batch(ids: List[str]=Query(default=None), session=Depends(get_read_session)) -> dict:
+    """
+    여러 id 한 번에 조회(ids=1,2,3 또는 ids=1&ids=2). 요청 순서대로 content, 없는 id는 missing
+    """
+    return await fetch_batch(session, Saying, parse_ids(ids))  # tools/batch.py
+
+
+@saying_router.post("/batch", response_model=dict)  # POST READ 여러 명언 데이터(id가 많아 URL이 길어질 때)
+async def retrieve_saying_batch_post(ids: List[int]=Body(embed=True), session=Depends(get_read_session)) -> dict:
+    """
+    여러 id 한 번에 조회. 본문: {"ids": [1, 2, 3]}
+    """
+    return await fetch_batch(session, Saying, parse_ids(ids))
+
+
+@saying_router.get("/changes", response_model=dict, dependencies=[Depends(http_cache("saying"))])  # GET READ 변경된 명언 데이터(동기화)
+async def retrieve_saying_changes(since: Optional[int]=Query(default=None, ge=0), limit: int=Query(default=500, ge=1, le=5000), session=Depends(get_read_session)) -> dict:
+    """
+    since(변경 토큰) 이후 생성/수정/삭제된 데이터 조회. 응답의 next를 다음 요청의 since로 사용(has_more가 true면 이어서 요청)
+    """
+    return await read_changes(session, Saying, SayingRead, since, limit)  # tools/changes.py
+
+
+@saying_router.get("/suggest", response_model=dict)  # GET READ 자동완성
+async def suggest_saying(q: str=Query(min_length=1), limit: int=Query(default=10, ge=1, le=50)) -> dict:
+    """
+    발화자, 영문 명언 접두어 자동완성(입력 중인 한글 자모도 지원). DB를 조회하지 않는다
+    """
+    return {
+        "q": q,
+        "content": suggest_index.suggest("saying", q, limit)  # tools/suggest.py
+    }
+
+
+@saying_router.get("/authors", response_model=dict, dependencies=[Depends(http_cache("saying"))])  # GET READ 발화자 목록
+async def retrieve_authors(cursor: Optional[str]=Query(default=None), size: int=Query(default=30, ge=1, le=200), session=Depends(get_read_session)) -> dict:
+    """
+    발화자 목록(이름순, 운영 중인 명언 개수 포함). 응답의 next_cursor를 다음 요청의 cursor로 사용
+    """
+    return await author_page(session, cursor, size)  # tools/authors.py 발화자 집계 테이블 조회
+
+
+@saying_router.get("/authors/{name}", response_model=dict, dependencies=[Depends(http_cache("saying"))])  # GET READ 발화자별 명언 목록
+async def retrieve_sayings_by_author(name: str, cursor: Optional[str]=Query(default=None), size: int=Query(default=15, ge=1, le=100), session=Depends(get_read_session)) -> dict:
+    """
+    발화자의 명언 목록(최신순 커서 페이징, (author, use_yn, id) 인덱스 조회)
+    """
+    statement = projection(Saying, SayingRead).where(Saying.author == name)
+    statement = keyset_paging(cursor=cursor, size=size, Table=Saying, statement=statement)
+    return keyset_page((await session.exec(statement)).all(), size)
+
+
 @saying_router.get("/{id}", response_model=Saying)  # GET READ 단일 명언 데이터
-async def retrieve_saying(id: int, session=Depends(get_session)) -> Saying:
+async def retrieve_saying(id: int, session=Depends(get_read_session)) -> Saying:
     """
     데이터 조회
     """
-    saying = session.get(Saying, id)
-    if saying:
-        return saying
+    if snapshot_store.enabled:  # 스냅샷 모드
+        data = snapshot_store.current.get("saying", id)
+        if data is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="선택한 ID를 가진 데이터이 존재하지 않습니다."
+            )
+        return data
+
+    cached = await item_cache.get("saying", id)  # tools/cache.py 단일 조회 캐시
+    if cached is not None:
+        return cached
+
+    saying = await session.get(Saying, id)
+    if saying and saying.use_yn == 1:  # 삭제(use_yn=0)된 데이터는 404
+        data = saying.model_dump()
+        await item_cache.set("saying", id, data)
+        return data
     
     raise HTTPException(
         status_code=status.HTTP_404_NOT_FOUND,
@@ -55,42 +183,81 @@ async def retrieve_saying(id: int, session=Depends(get_session)) -> Saying:
     )
 
 
-@saying_router.post("/new", response_model=Saying)  # POST CREATE 새 명언 데이터
-async def create_new_saying(new_saying: Saying, session=Depends(get_session)) -> Saying:
+@saying_router.get("/{id}/similar", response_model=dict, dependencies=[Depends(http_cache("saying"))])  # GET READ 비슷한 명언 데이터
+async def retrieve_similar_sayings(id: int, size: int=Query(default=10, ge=1, le=50), session=Depends(get_read_session)) -> dict:
     """
-    데이터 새로 생성
+    본문이 비슷한 명언 최대 size개(유사도 score 높은 순, tools/similar.py)
     """
-    category_name = new_saying.category
+    response = await similar_items(session, Saying, id, size)
+    if response is not None:
+        return response
+
+    raise HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail="선택한 ID를 가진 데이터이 존재하지 않습니다."
+    )
 
-    statement = select(Category).where(Category.saying_categories == category_name)
-    category = session.exec(statement).first()
 
-    if not category:  # 카테고리명이 없으면 새로 생성
-        category = Category(saying_categories=category_name)
-        session.add(category)
-        session.commit()
-        session.refresh(category)
+@saying_router.post("/new", response_model=Saying)  # POST CREATE 새 명언 데이터
+async def create_new_saying(new_data: SayingCreate, session=Depends(get_session)) -> Saying:
+    """
+    데이터 새로 생성
+    """
+    new_saying = Saying(**new_data.model_dump())  # 길이 등 검증을 마친 본문으로 테이블 모델 생성
+    await apply_category_change(session, "saying", after=(new_saying.category, new_saying.use_yn))  # 카테고리 upsert 및 개수 갱신
+    await apply_author_change(session, after=(new_saying.author, new_saying.use_yn))  # 발화자 upsert 및 개수 갱신
 
+    fill_initial(new_saying)  # 초성/첫 글자 필드 계산
     session.add(new_saying)
-    session.commit()
-    session.refresh(new_saying)  # 캐시 데이터 업데이트
+    await session.flush()  # id 생성
+    await bump_version(session, "saying", "category")  # HTTP 캐시 버전 증가
+    await record_change(session, "saying", new_saying.id, "create")  # 변경 기록(tools/changes.py)
+    await session.commit()
+    await session.refresh(new_saying)  # 캐시 데이터 업데이트
+    count_cache.adjust("saying", int(new_saying.use_yn == 1))  # 전체 개수 캐시 갱신
+    search_backend.index(new_saying)  # 검색 색인 갱신
+    await item_cache.invalidate("saying", new_saying.id)
+    id_pool.update(new_saying)  # 랜덤 조회 목록 갱신
+    suggest_index.update(new_saying)  # 자동완성 색인 갱신
+    similar_index.update(new_saying)  # 추천 색인 갱신
     return new_saying
 
 
+@saying_router.post("/bulk")  # POST CREATE 명언 데이터 대량 가져오기
+async def bulk_import_sayings(request: Request, batch: int=Query(default=settings.BULK_BATCH_SIZE, ge=1), session=Depends(get_session)) -> dict:
+    """
+    명언 대량 생성. 본문은 NDJSON(한 줄에 JSON 1개) 또는 CSV(Content-Type: text/csv, 첫 줄 헤더)
+    """
+    return await bulk_import(request.stream(), request.headers.get("content-type"), Saying, SayingUpdate, batch, session)  # tools/bulk.py
+
+
 @saying_router.put("/edit/{id}", response_model=Saying)  # PUT UPDATE 기존 명언 데이터
 async def update_saying(id: int, new_data: SayingUpdate, session=Depends(get_session)) -> Saying:
     """
     데이터 수정
     """
-    saying = session.get(Saying, id)
+    saying = await session.get(Saying, id)
     if saying:
+        before = (saying.category, saying.use_yn)
+        before_author = (saying.author, saying.use_yn)
         saying_data = new_data.model_dump(exclude_unset=True)  # 클라이언트가 작성한 데이터만 변경하는 dict 생성
         saying_data["updated_at"] = (datetime.utcnow() + timedelta(hours=9)).replace(microsecond=0)  # updated_at 컬럼에 업데이트 시간을 작성
         for key, value in saying_data.items():
             setattr(saying, key, value)  # setattr(object, name, value) >>> object에 존재하는 속성의 값을 바꾸거나, 새로운 속성을 생성하여 값을 부여한다.
+        fill_initial(saying)  # 초성/첫 글자 필드 재계산
+        await apply_category_change(session, "saying", before=before, after=(saying.category, saying.use_yn))
+        await apply_author_change(session, before=before_author, after=(saying.author, saying.use_yn))
         session.add(saying)
-        session.commit()
-        session.refresh(saying)
+        await bump_version(session, "saying", "category")
+        await record_change(session, "saying", id, "update")
+        await session.commit()
+        await session.refresh(saying)
+        count_cache.invalidate("saying")  # 카테고리 등이 바뀌었을 수 있으므로 개수 캐시 무효화
+        search_backend.index(saying)
+        await item_cache.invalidate("saying", id)  # 단일 조회 캐시 무효화
+        id_pool.update(saying)
+        suggest_index.update(saying)
+        similar_index.update(saying)
         return saying
     
     raise HTTPException(
@@ -99,14 +266,31 @@ async def update_saying(id: int, new_data: SayingUpdate, session=Depends(get_ses
     )
 
 @saying_router.delete("/delete/{id}")  # DELETE 기존 명언 데이터
-async def delete_saying(id: int, session=Depends(get_session)) -> dict:
+async def delete_saying(id: int, hard: bool=Query(default=False), session=Depends(get_session)) -> dict:
     """
-    데이터 삭제
+    데이터 삭제(기본은 use_yn=0 으로 바꾸는 소프트 삭제, hard=true 이면 행 삭제)
     """
-    saying = session.get(Saying, id)
+    saying = await session.get(Saying, id)
     if saying:
-        session.delete(saying)
-        session.commit()
+        before = (saying.category, saying.use_yn)
+        await apply_author_change(session, before=(saying.author, saying.use_yn))  # 운영 중이었다면 발화자 개수 감소
+        if hard:
+            await apply_category_change(session, "saying", before=before)
+            await session.delete(saying)
+        else:
+            saying.use_yn = 0
+            saying.updated_at = current_time_kst()
+            await apply_category_change(session, "saying", before=before, after=(saying.category, 0))
+            session.add(saying)
+        await bump_version(session, "saying", "category")
+        await record_change(session, "saying", id, "delete")
+        await session.commit()
+        count_cache.adjust("saying", -int(before[1] == 1))  # 전체 개수 캐시 갱신
+        search_backend.remove(Saying, id)
+        await item_cache.invalidate("saying", id)
+        id_pool.remove("saying", id)
+        suggest_index.remove("saying", id)
+        similar_index.remove("saying", id)
         return {
             "message": "데이터을 삭제했습니다."
         }
@@ -122,41 +306,82 @@ async def delete_saying(id: int, session=Depends(get_session)) -> dict:
 카테고리들(List), 검색어(Str), 알파벳 첫글자들(List)
 필터링 해주는 함수
 """
-@saying_router.get("/filter/", response_model=dict)
+@saying_router.get("/filter/", response_model=dict, dependencies=[Depends(http_cache("saying", snapshot=True))])
+@coalesce  # 동시에 들어온 같은 조건 요청은 DB 조회 1번으로 처리(tools/coalesce.py)
 async def saying_filtering(
         categories: List[str]=Query(default=None),
         keyword: str=Query(default=None),
         consonants: List[str]=Query(default=None),
         p: int=Query(default=1),
-        size: int=Query(default=15),
-        session=Depends(get_session)
+        size: int=Query(default=15, ge=1, le=100),
+        cursor: Optional[str]=Query(default=None),
+        estimate: bool=Query(default=False),
+        order: str=Query(default="latest"),
+        facets: bool=Query(default=False),
+        session=Depends(get_read_session)
         ) -> dict:
     
-    statement = select(Saying)
+    keyword = clean_keyword(keyword)  # 앞뒤 공백 제거, 소문자(검색 조건과 개수 캐시 키가 같은 값을 사용)
+
+    if snapshot_store.enabled:  # 스냅샷 모드(미리 만든 카테고리/초성 색인 사용)
+        return snapshot_store.current.filter("saying", categories, keyword, consonants, p, size, cursor, order, facets)
+
+    statement = projection(Saying, SayingRead)  # 사용하는 컬럼만 조회
 
     if categories:  # 카테고리 필터링 됐다면,
         conditions = [Saying.category==cat for cat in categories]
         statement = statement.where(or_(*conditions))
 
     if keyword:  # 검색어 필터링 됐다면,
-        statement = statement.where(or_(Saying.contents_kr.like(f"%{keyword}%"), Saying.contents_eng.like(f"%{keyword}%")))
+        statement = statement.where(search_backend.condition(Saying, keyword))  # tools/search.py 검색 백엔드
 
     if consonants:  # 알파벳 필터링 됐다면,
-        conditions = [Saying.contents_eng.ilike(f"{consonant}%") for consonant in consonants]
-        statement = statement.where(or_(*conditions))
+        statement = statement.where(Saying.initial.in_([consonant.upper() for consonant in consonants]))  # initial 인덱스 조회
+
+    facet = None
+    if facets:  # 카테고리/초성별 개수(GROUP BY 쿼리 1번, tools/facets.py)
+        facet = await facet_counts(session, Saying, keyword, categories, consonants)
+
+    if cursor is not None:  # 커서 모드
+        statement = keyset_paging(cursor=cursor, size=size, Table=Saying, statement=statement)
+        filtered_sayings = (await session.exec(statement)).all()
+        page = keyset_page(filtered_sayings, size)
+        if facets:
+            page["facets"] = facet
+        return page
 
     # 토탈 페이지 확인
-    total_record = session.exec(select(func.count()).select_from(statement)).one()
+    estimated = False
+    cache_key = count_cache.key("saying", categories=categories, keyword=keyword, consonants=consonants)
+    total_record = count_cache.get(cache_key)
+    if total_record is None and estimate and keyword:  # 검색어 필터는 정해진 개수까지만 세서 추정값을 반환
+        limit = settings.COUNT_ESTIMATE_LIMIT
+        total_record = (await session.exec(count_statement(Saying, statement, limit=limit))).one()
+        estimated = total_record >= limit
+        if not estimated:  # 제한보다 적으면 정확한 값이므로 캐시
+            count_cache.set(cache_key, total_record)
+    elif total_record is None:
+        total_record = (await session.exec(count_statement(Saying, statement))).one()
+        count_cache.set(cache_key, total_record)
     total_page = (total_record // size) + bool(total_record % size)
     if p > total_page:
         p = total_page
     
+    if keyword and order == "relevance":  # 관련도 정렬(같은 관련도는 최신순)
+        score = search_backend.relevance(Saying, keyword)
+        if score is not None:
+            statement = statement.order_by(score.desc())
+
     # 페이징 처리
     statement = paging(page=p, size=size, Table=Saying, statement=statement)  # tools/pagination.py 페이지 처리 툴
-    filtered_sayings = session.exec(statement).all()
+    filtered_sayings = as_dicts((await session.exec(statement)).all())
     
-    return {
+    response = {
         "total_rows": total_record,
         "total_page": total_page,
+        "estimated": estimated,
         "content": filtered_sayings
-    }
\ No newline at end of file
+    }
+    if facets:
+        response["facets"] = facet
+    return response
\ No newline at end of file
@@ -0,0 +1,32 @@
+# tests/conftest.py
+"""
+테스트 공통 설정
+
+앱(main.py)과 설정(database/connection.py)은 불러올 때 DB 주소를 읽으므로, 먼저 임시 SQLite DB 주소를 환경변수로 지정한다.
+$ pip install -r requirements-dev.txt
+$ python -m pytest
+"""
+import os
+import tempfile
+
+import pytest
+
+
+DIRECTORY = tempfile.mkdtemp()
+DATABASE_URL = f"sqlite:///{os.path.join(DIRECTORY, 'test.db')}"
+
+os.environ["DATABASE_CONNECTION_STRING"] = DATABASE_URL
+os.environ["SIMILAR_SNAPSHOT_PATH"] = os.path.join(DIRECTORY, "similar_index.npz")
+os.environ["INDEX_SYNC_INTERVAL"] = "0"  # 프로세스 1개이므로 워커 간 동기화 불필요
+
+
+@pytest.fixture(scope="session")
+def client():
+    from fastapi.testclient import TestClient
+    from benchmarks.seed import seed
+
+    seed(DATABASE_URL, 50, 50).dispose()  # 마이그레이션으로 테이블 생성 후 합성 데이터 채우기
+    from main import app  # DB 주소 환경변수를 설정한 뒤에 불러온다
+
+    with TestClient(app) as client:  # lifespan(검색 색인, 랜덤 id 목록 등 생성) 실행
+        yield client
@@ -0,0 +1,80 @@
+# tests/test_changes.py
+"""
+변경 기록(tools/changes.py): 토큰(next/since), 버전 단위로 나누는 has_more, 정리된 토큰의 410 응답
+"""
+import json
+from datetime import timedelta
+
+from sqlmodel import Session, create_engine
+
+from models.sayings import current_time_kst
+from tools.changes import prune_changes
+from conftest import DATABASE_URL
+
+
+def latest_token(client, table):  # since 없이 요청하면 현재 토큰만 돌려준다
+    body = client.get(f"/{table}/changes").json()
+    assert body["content"] == [] and body["has_more"] is False
+    return body["next"]
+
+
+def create_saying(client, contents_kr):
+    response = client.post("/saying/new", json={"category": "변경", "author": "변경 테스트", "contents_kr": contents_kr})
+    assert response.status_code == 200
+    return response.json()["id"]
+
+
+def test_token_returns_changes_after_since(client):
+    since = latest_token(client, "saying")
+    id = create_saying(client, "토큰 생성")
+    client.put(f"/saying/edit/{id}", json={"contents_kr": "토큰 수정"})
+
+    body = client.get(f"/saying/changes?since={since}").json()
+    assert body["since"] == since and body["has_more"] is False
+    assert [row["contents_kr"] for row in body["content"]] == ["토큰 수정"]  # 같은 데이터의 변경은 현재 상태 1건
+    assert body["next"] == latest_token(client, "saying")
+
+    assert client.delete(f"/saying/delete/{id}").status_code == 200
+    body = client.get(f"/saying/changes?since={body['next']}").json()
+    assert body["content"] == [] and body["deleted"] == [id]
+
+
+def test_has_more_does_not_split_a_version(client):
+    since = latest_token(client, "saying")
+    ids = [create_saying(client, f"나누기 {n}") for n in range(3)]  # 버전 3개
+
+    first = client.get(f"/saying/changes?since={since}&limit=2").json()
+    assert first["has_more"] is True
+    assert [row["id"] for row in first["content"]] == ids[:2]
+
+    second = client.get(f"/saying/changes?since={first['next']}&limit=2").json()
+    assert second["has_more"] is False
+    assert [row["id"] for row in second["content"]] == ids[2:]
+
+
+def test_version_larger_than_limit_is_returned_whole(client):
+    since = latest_token(client, "saying")
+    rows = "\n".join(json.dumps({"category": "변경", "author": "가져오기", "contents_kr": f"한 버전 {n}"}) for n in range(3))
+    response = client.post("/saying/bulk", content=rows.encode(), headers={"Content-Type": "application/x-ndjson"})
+    assert response.status_code == 200  # 가져오기 1번 = 버전 1개
+
+    body = client.get(f"/saying/changes?since={since}&limit=2").json()
+    assert len(body["content"]) == 3  # limit보다 커도 한 버전은 나누지 않는다
+    assert client.get(f"/saying/changes?since={body['next']}").json()["content"] == []
+
+
+def test_pruned_token_is_gone(client):
+    since = latest_token(client, "saying")
+    create_saying(client, "정리 전")
+
+    engine = create_engine(DATABASE_URL)
+    try:
+        with Session(engine) as session:
+            assert prune_changes(session, current_time_kst() + timedelta(days=1)) > 0
+    finally:
+        engine.dispose()
+
+    assert client.get(f"/saying/changes?since={since}").status_code == 410
+    latest = latest_token(client, "saying")  # 정리 후에는 새로 받은 토큰부터 다시 동기화
+    create_saying(client, "정리 후")
+    assert [row["contents_kr"] for row in client.get(f"/saying/changes?since={latest}").json()["content"]] == ["정리 후"]
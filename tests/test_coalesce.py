@@ -0,0 +1,78 @@
+# tests/test_coalesce.py
+"""
+같은 조회 요청 합치기(tools/coalesce.py): 동시에 들어온 같은 요청은 조회를 1번만 실행하고 결과/오류를 모두에게 전달한다.
+"""
+import asyncio
+
+import pytest
+
+from tools.coalesce import coalesce, single_flight
+
+
+def counted_route(result=None, error=None):  # 호출 횟수를 세고, release가 설정될 때까지 기다리는 라우트
+    state = {"calls": 0, "release": asyncio.Event()}
+
+    @coalesce
+    async def route(p: int = 1):
+        state["calls"] += 1
+        await state["release"].wait()
+        if error is not None:
+            raise error
+        return {"p": p, "result": result}
+
+    return route, state
+
+
+async def gather_released(state, *calls):
+    tasks = [asyncio.ensure_future(call) for call in calls]
+    await asyncio.sleep(0)  # 모든 요청이 들어온 뒤에 조회를 끝낸다
+    state["release"].set()
+    return await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def test_concurrent_identical_requests_share_one_call():
+    async def main():
+        route, state = counted_route(result="같은 결과")
+        results = await gather_released(state, *[route(p=1) for _ in range(10)])
+        assert state["calls"] == 1
+        assert results == [{"p": 1, "result": "같은 결과"}] * 10
+        assert single_flight.calls == {}  # 끝나면 지운다(캐시하지 않음)
+
+        await route(p=1)  # 다음 요청은 다시 실행
+        assert state["calls"] == 2
+
+    asyncio.run(main())
+
+
+def test_different_parameters_are_not_coalesced():
+    async def main():
+        route, state = counted_route()
+        await gather_released(state, route(p=1), route(p=2), route(p=2))
+        assert state["calls"] == 2
+
+    asyncio.run(main())
+
+
+def test_error_is_passed_to_every_waiter():
+    async def main():
+        route, state = counted_route(error=ValueError("조회 실패"))
+        results = await gather_released(state, *[route(p=1) for _ in range(5)])
+        assert state["calls"] == 1
+        assert all(isinstance(result, ValueError) for result in results)
+
+    asyncio.run(main())
+
+
+def test_cancelled_first_request_does_not_cancel_others():
+    async def main():
+        route, state = counted_route(result="결과")
+        first = asyncio.ensure_future(route(p=1))
+        second = asyncio.ensure_future(route(p=1))
+        await asyncio.sleep(0)
+        first.cancel()  # 먼저 온 요청의 연결이 끊김
+        state["release"].set()
+        assert await second == {"p": 1, "result": "결과"}
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+    asyncio.run(main())
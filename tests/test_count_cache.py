@@ -0,0 +1,70 @@
+# tests/test_count_cache.py
+"""
+전체 개수 캐시(tools/count_cache.py): 생성/수정/삭제 후 목록과 카테고리 필터의 total_rows가 DB의 현재 개수와 같아야 한다.
+"""
+from sqlmodel import Session, create_engine, select, func
+
+from models.sayings import Saying
+from models.fourchars import FourChar
+from tools.count_cache import count_cache
+from conftest import DATABASE_URL
+
+
+def db_count(Table, category=None):
+    engine = create_engine(DATABASE_URL)
+    try:
+        with Session(engine) as session:
+            statement = select(func.count()).select_from(Table).where(Table.use_yn==1)
+            if category is not None:
+                statement = statement.where(Table.category==category)
+            return session.exec(statement).one()
+    finally:
+        engine.dispose()
+
+
+def totals(client, Table, *categories):  # (전체 개수, 카테고리별 개수...) 를 두 번 조회해 캐시에서 나온 값까지 확인
+    table = Table.__tablename__
+    for _ in range(2):
+        counts = [client.get(f"/{table}?p=1&size=1").json()["total_rows"]]
+        counts += [client.get(f"/{table}/filter/", params={"categories": category, "size": 1}).json()["total_rows"] for category in categories]
+    assert count_cache.get(count_cache.key(table)) is not None
+    for category in categories:
+        assert count_cache.get(count_cache.key(table, categories=[category])) is not None
+    assert counts == [db_count(Table)] + [db_count(Table, category) for category in categories]
+    return counts
+
+
+def test_create_updates_cached_counts(client):
+    before = totals(client, Saying, "개수A")
+    assert client.post("/saying/new", json={"category": "개수A", "author": "개수", "contents_kr": "개수 생성"}).status_code == 200
+    assert totals(client, Saying, "개수A") == [before[0] + 1, before[1] + 1]
+
+
+def test_category_edit_updates_both_filters(client):
+    id = client.post("/fourchar/new", json={"category": "개수B", "contents_kr": "개수수정", "contents_detail": "개수"}).json()["id"]
+    before = totals(client, FourChar, "개수B", "개수C")
+
+    assert client.put(f"/fourchar/edit/{id}", json={"category": "개수C"}).status_code == 200
+    assert totals(client, FourChar, "개수B", "개수C") == [before[0], before[1] - 1, before[2] + 1]
+
+
+def test_soft_and_hard_delete_update_cached_counts(client):
+    saying = client.post("/saying/new", json={"category": "개수D", "author": "개수", "contents_kr": "개수 삭제"}).json()["id"]
+    fourchar = client.post("/fourchar/new", json={"category": "개수D", "contents_kr": "개수삭제", "contents_detail": "개수"}).json()["id"]
+    saying_before = totals(client, Saying, "개수D")
+    fourchar_before = totals(client, FourChar, "개수D")
+
+    assert client.delete(f"/saying/delete/{saying}").status_code == 200
+    assert client.delete(f"/fourchar/delete/{fourchar}?hard=true").status_code == 200
+    assert totals(client, Saying, "개수D") == [saying_before[0] - 1, saying_before[1] - 1]
+    assert totals(client, FourChar, "개수D") == [fourchar_before[0] - 1, fourchar_before[1] - 1]
+
+
+def test_use_yn_edit_updates_cached_counts(client):
+    id = client.post("/saying/new", json={"category": "개수E", "author": "개수", "contents_kr": "운영 여부"}).json()["id"]
+    before = totals(client, Saying, "개수E")
+
+    assert client.put(f"/saying/edit/{id}", json={"use_yn": 0}).status_code == 200
+    assert totals(client, Saying, "개수E") == [before[0] - 1, before[1] - 1]
+    assert client.put(f"/saying/edit/{id}", json={"use_yn": 1}).status_code == 200
+    assert totals(client, Saying, "개수E") == before
@@ -0,0 +1,44 @@
+# tests/test_item_cache.py
+"""
+단일 조회 캐시(tools/cache.py): 수정/삭제 후에는 캐시된 이전 값이 아니라 DB의 현재 값을 응답해야 한다.
+"""
+from tools.cache import item_cache
+
+
+def get_twice(client, path):  # 두 번째 조회가 캐시에서 나왔는지 확인
+    first = client.get(path)
+    hits = item_cache.hits
+    second = client.get(path)
+    assert item_cache.hits == hits + 1
+    assert second.json() == first.json()
+    return second
+
+
+def test_edit_invalidates_cached_saying(client):
+    get_twice(client, "/saying/1")
+
+    response = client.put("/saying/edit/1", json={"author": "캐시 테스트"})
+    assert response.status_code == 200
+    assert client.get("/saying/1").json()["author"] == "캐시 테스트"
+
+
+def test_edit_invalidates_cached_fourchar(client):
+    get_twice(client, "/fourchar/1")
+
+    response = client.put("/fourchar/edit/1", json={"contents_detail": "캐시 테스트"})
+    assert response.status_code == 200
+    assert client.get("/fourchar/1").json()["contents_detail"] == "캐시 테스트"
+
+
+def test_soft_delete_invalidates_cached_item(client):
+    get_twice(client, "/saying/2")
+
+    assert client.delete("/saying/delete/2").status_code == 200
+    assert client.get("/saying/2").status_code == 404
+
+
+def test_hard_delete_invalidates_cached_item(client):
+    get_twice(client, "/fourchar/3")
+
+    assert client.delete("/fourchar/delete/3?hard=true").status_code == 200
+    assert client.get("/fourchar/3").status_code == 404
@@ -0,0 +1,67 @@
+# tests/test_migrations.py
+"""
+마이그레이션(migrations/versions): 빈 DB와 마이그레이션 도입 전 DB(0001)에 `alembic upgrade head` 를 실행하면
+모델과 같은 스키마가 되어야 한다(`alembic check`).
+"""
+import os
+
+from alembic import command
+from sqlalchemy import create_engine, text
+
+from database.migration import alembic_config, current_revision, head_revision, verify_schema
+
+
+def test_upgrade_head_matches_models(tmp_path):
+    url = f"sqlite:///{os.path.join(tmp_path, 'migrations.db')}"
+    config = alembic_config(url)
+
+    command.upgrade(config, "head")
+    command.check(config)  # 모델과 다르면 AutoGenerateDiffsDetected
+
+    engine = create_engine(url)
+    try:
+        assert current_revision(engine) == head_revision()
+        verify_schema(engine)
+    finally:
+        engine.dispose()
+
+
+def test_downgrade_and_upgrade_again(tmp_path):
+    url = f"sqlite:///{os.path.join(tmp_path, 'roundtrip.db')}"
+    config = alembic_config(url)
+
+    command.upgrade(config, "head")
+    command.downgrade(config, "base")
+    command.upgrade(config, "head")
+    command.check(config)
+
+
+def test_upgrade_from_baseline_keeps_data(tmp_path):
+    url = f"sqlite:///{os.path.join(tmp_path, 'baseline.db')}"
+    config = alembic_config(url)
+    command.upgrade(config, "0001")  # 도입 전 DB(create_all) + `alembic stamp 0001` 과 같은 상태
+
+    engine = create_engine(url)
+    try:
+        with engine.begin() as connection:  # 도입 전 DB에 있던 데이터(카테고리 중복 포함)
+            connection.execute(text(
+                "INSERT INTO saying (category, author, contents_kr, contents_eng, use_yn) VALUES "
+                "('사랑', '가', '뜻1', 'love', 1), ('사랑', '나', '뜻2', 'Life', 1), ('인생', '가', '뜻3', 'art', 0)"
+            ))
+            connection.execute(text("INSERT INTO fourchar (category, contents_kr, use_yn) VALUES ('학문', '각골난망', 1)"))
+            connection.execute(text(
+                "INSERT INTO category (saying_categories, fourchar_categories) VALUES ('사랑', NULL), ('사랑', NULL), (NULL, '학문')"
+            ))
+
+        command.upgrade(config, "head")
+        command.check(config)
+
+        with engine.connect() as connection:
+            assert connection.execute(text("SELECT initial FROM saying ORDER BY id")).scalars().all() == ["L", "L", "A"]
+            assert connection.execute(text("SELECT initial FROM fourchar")).scalar_one() == "ㄱ"
+            counts = connection.execute(text("SELECT saying_categories, item_count FROM category WHERE saying_categories IS NOT NULL")).all()
+            assert sorted(counts) == [("사랑", 2), ("인생", 0)]  # 중복 제거, 빠진 카테고리 추가, 운영 중 개수
+            assert connection.execute(text("SELECT name, item_count FROM author ORDER BY name")).all() == [("가", 1), ("나", 1)]
+        verify_schema(engine)
+    finally:
+        engine.dispose()
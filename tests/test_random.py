@@ -0,0 +1,24 @@
+# tests/test_random.py
+"""
+오늘의 명언(tools/random_pool.py DailyPicks): 하루 동안 같은 데이터를 반환하고, 고른 데이터가 삭제되면 다시 고른다.
+"""
+from tools.random_pool import daily_picks
+
+
+def test_daily_pick_is_remembered(client):
+    first = client.get("/fourchar/random?daily=true").json()
+    assert daily_picks.ids["fourchar", None] == first["id"]  # 다음 요청부터는 DB 조회 없이 기억한 id
+    assert client.get("/fourchar/random?daily=true").json()["id"] == first["id"]
+
+    category = first["category"]
+    assert client.get(f"/fourchar/random?daily=true&category={category}").json()["category"] == category
+
+
+def test_deleted_daily_pick_is_replaced(client):
+    first = client.get("/saying/random?daily=true").json()
+    assert client.delete(f"/saying/delete/{first['id']}").status_code == 200
+
+    response = client.get("/saying/random?daily=true")
+    assert response.status_code == 200
+    assert response.json()["id"] != first["id"]
+    assert client.get("/saying/random?daily=true").json()["id"] == response.json()["id"]
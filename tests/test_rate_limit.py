@@ -0,0 +1,70 @@
+# tests/test_rate_limit.py
+"""
+요청 수 제한(tools/rate_limit.py): 토큰이 초당 rate개씩 다시 차고, 없으면 429와 Retry-After로 응답한다.
+"""
+import asyncio
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from tools.rate_limit import MemoryRateLimitBackend, RateLimitMiddleware
+
+
+class Clock:  # 테스트에서 시간을 직접 움직인다
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def take(backend, key, rate=1, burst=2):
+    return asyncio.run(backend.take(key, rate, burst))
+
+
+def test_bucket_refills_at_rate():
+    clock = Clock()
+    backend = MemoryRateLimitBackend(clock=clock)
+    assert take(backend, "a") == (True, 0)
+    assert take(backend, "a") == (True, 0)
+    allowed, retry_after = take(backend, "a")  # burst 2개를 모두 사용
+    assert not allowed and retry_after == 1
+    assert take(backend, "b")[0]  # 다른 클라이언트는 따로 센다
+
+    clock.now = 0.5
+    allowed, retry_after = take(backend, "a")
+    assert not allowed and retry_after == 0.5
+    clock.now = 1.0
+    assert take(backend, "a")[0]  # 1초에 1개
+    clock.now = 100.0
+    assert [take(backend, "a")[0] for _ in range(3)] == [True, True, False]  # burst보다 많이 쌓이지 않는다
+
+
+def test_least_recently_used_bucket_is_evicted():
+    clock = Clock()
+    backend = MemoryRateLimitBackend(maxsize=2, clock=clock)
+    take(backend, "a")
+    take(backend, "b")
+    take(backend, "a")  # a를 다시 사용
+    take(backend, "c")
+    assert list(backend.buckets) == ["a", "c"]
+
+
+def test_middleware_responds_429():
+    app = FastAPI()
+
+    @app.get("/items")
+    async def items():
+        return {"ok": True}
+
+    @app.get("/health")
+    async def health():
+        return {"ok": True}
+
+    app.add_middleware(RateLimitMiddleware, backend=MemoryRateLimitBackend(clock=Clock()), rate=0.5, burst=2)
+    with TestClient(app) as client:
+        assert [client.get("/items").status_code for _ in range(2)] == [200, 200]
+        response = client.get("/items")
+        assert response.status_code == 429
+        assert response.headers["retry-after"] == "2"
+        assert client.get("/health").status_code == 200  # 제외 경로
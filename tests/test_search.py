@@ -0,0 +1,75 @@
+# tests/test_search.py
+"""
+검색어 필터링(tools/search.py): 생성/수정/삭제 후에도 검색 결과가 DB의 현재 데이터와 같아야 한다.
+"""
+from sqlalchemy.dialects import mysql
+from sqlmodel import Session, create_engine, select
+
+from models.sayings import Saying
+from models.fourchars import FourChar
+from tools.search import NgramSearchBackend, LikeSearchBackend, FulltextSearchBackend, search_backend
+from conftest import DATABASE_URL
+
+
+def search(client, table, keyword):  # 검색 결과 id 목록
+    response = client.get(f"/{table}/filter/", params={"keyword": keyword, "size": 100})
+    assert response.status_code == 200
+    return [row["id"] for row in response.json()["content"]]
+
+
+def test_created_saying_is_searchable(client):
+    assert search(client, "saying", "zebraquux") == []
+    created = client.post("/saying/new", json={"category": "검색", "author": "검색 테스트", "contents_kr": "얼룩말 명언", "contents_eng": "A ZebraQuux says hi"})
+    id = created.json()["id"]
+
+    assert search(client, "saying", "zebraquux") == [id]  # 대소문자 구분 없음
+    assert search(client, "saying", "얼룩말") == [id]
+
+
+def test_edit_moves_saying_to_new_keyword(client):
+    id = client.post("/saying/new", json={"category": "검색", "author": "검색 테스트", "contents_kr": "수정 전 문장", "contents_eng": "Oldkeyword"}).json()["id"]
+    assert search(client, "saying", "oldkeyword") == [id]
+
+    assert client.put(f"/saying/edit/{id}", json={"contents_eng": "Newkeyword"}).status_code == 200
+    assert search(client, "saying", "oldkeyword") == []
+    assert search(client, "saying", "newkeyword") == [id]
+
+
+def test_deleted_rows_are_not_found(client):
+    saying = client.post("/saying/new", json={"category": "검색", "author": "검색 테스트", "contents_kr": "소프트삭제 문장"}).json()["id"]
+    fourchar = client.post("/fourchar/new", json={"category": "검색", "contents_kr": "검색삭제", "contents_detail": "영구삭제 뜻풀이"}).json()["id"]
+    assert search(client, "saying", "소프트삭제") == [saying]
+    assert search(client, "fourchar", "영구삭제") == [fourchar]
+
+    assert client.delete(f"/saying/delete/{saying}").status_code == 200
+    assert client.delete(f"/fourchar/delete/{fourchar}?hard=true").status_code == 200
+    assert search(client, "saying", "소프트삭제") == []
+    assert search(client, "fourchar", "영구삭제") == []
+    assert fourchar not in search_backend.docs["fourchar"]  # 색인에서도 제거
+
+
+def test_ngram_matches_like(client):
+    engine = create_engine(DATABASE_URL)
+    try:
+        with Session(engine) as session:
+            ngram = NgramSearchBackend()
+            ngram.build(session)
+            like = LikeSearchBackend()
+            for Table, keywords in ((Saying, ["life", "e", "love time", "없는검색어"]), (FourChar, ["가", "一", "학"])):
+                for keyword in keywords:
+                    expected = session.exec(select(Table.id).where(like.condition(Table, keyword)).order_by(Table.id)).all()
+                    actual = session.exec(select(Table.id).where(ngram.condition(Table, keyword)).order_by(Table.id)).all()
+                    assert actual == expected, keyword
+
+            ngram.max_ids = 0  # 결과가 많으면 LIKE 조건으로 대체
+            assert str(ngram.condition(Saying, "life")) == str(like.condition(Saying, "life"))
+    finally:
+        engine.dispose()
+
+
+def test_fulltext_uses_phrase_match():
+    backend = FulltextSearchBackend()
+    statement = select(Saying.id).where(backend.condition(Saying, 'say "hi'))
+    compiled = str(statement.compile(dialect=mysql.dialect(), compile_kwargs={"literal_binds": True}))
+    assert "MATCH (saying.contents_kr, saying.contents_eng) AGAINST ('\"say  hi\"' IN BOOLEAN MODE)" in compiled
+    assert "LIKE" in str(select(Saying.id).where(backend.condition(Saying, "a")).compile(dialect=mysql.dialect()))  # 짧은 검색어
@@ -0,0 +1,93 @@
+# tests/test_similar.py
+"""
+비슷한 데이터 추천(tools/similar.py): TF-IDF 색인 생성, 추가 행렬(delta) 갱신, .npz 파일 저장/읽기
+"""
+import os
+
+import numpy as np
+from sqlmodel import Session, create_engine
+
+from tools import similar
+from tools.similar import SimilarIndex, TfidfMatrix, features
+from conftest import DATABASE_URL
+
+
+DOCUMENTS = {
+    1: "the quick brown fox jumps",
+    2: "the quick brown fox sleeps",
+    3: "가는 말이 고와야 오는 말이 곱다",
+    4: "오는 말이 고와야 가는 말도 곱다",
+    5: "time is gold",
+}
+
+
+def fit(documents):
+    return TfidfMatrix.fit(list(documents), [features([text]) for text in documents.values()])
+
+
+def all_neighbours(index, ids):
+    return dict(zip(ids, index.neighbours(ids, 3)))
+
+
+def test_fit_ranks_closest_document_first():
+    index = fit(DOCUMENTS)
+    neighbours = all_neighbours(index, [1, 3, 99])
+    assert neighbours[1][0][0] == 2
+    assert neighbours[3][0][0] == 4
+    assert all(id != 1 for id, _ in neighbours[1])  # 자기 자신 제외
+    assert all(0 < score <= 1 for id, score in neighbours[1])
+    assert neighbours[99] is None  # 색인에 없는 id
+
+
+def expected_index(index, documents):  # 같은 idf로 처음부터 만든 행렬(갱신 결과와 같아야 한다)
+    ids = list(documents)
+    return TfidfMatrix(np.array(ids, dtype=np.int64), index.transform([features([text]) for text in documents.values()]), index.idf)
+
+
+def test_delta_updates_match_rebuilt_matrix(monkeypatch):
+    monkeypatch.setattr(similar, "DELTA_MAX", 2)  # 3번째 추가에서 본 행렬에 합친다
+    index = fit(DOCUMENTS)
+    documents = dict(DOCUMENTS)
+
+    index.discard(5)
+    del documents[5]
+    documents[2] = "time is money"  # 수정: 이전 행은 삭제 표시, 새 행은 추가 행렬
+    index.upsert([2], [features([documents[2]])])
+    documents[6] = "the quick brown fox runs"
+    index.upsert([6], [features([documents[6]])])
+    assert len(index.pending_ids) == 2
+    assert all_neighbours(index, list(documents)) == all_neighbours(expected_index(index, documents), list(documents))
+
+    documents[7] = "말이 고와야 곱다"
+    index.upsert([7], [features([documents[7]])])
+    assert index.pending_ids == [] and len(index.ids) == 8  # 합친 뒤에도 행 번호는 그대로(삭제 표시 행 포함)
+    assert all_neighbours(index, list(documents)) == all_neighbours(expected_index(index, documents), list(documents))
+
+    index.compact()
+    assert len(index.ids) == len(documents)
+    assert all_neighbours(index, list(documents)) == all_neighbours(expected_index(index, documents), list(documents))
+
+
+def test_save_and_load_roundtrip(client, tmp_path):
+    path = os.path.join(tmp_path, "cache", "similar_index.npz")
+    engine = create_engine(DATABASE_URL)
+    try:
+        built = SimilarIndex()
+        with Session(engine) as session:
+            assert built.load_or_build(session, path) is True  # 파일이 없으면 만들고 저장
+        assert os.path.exists(path)
+
+        loaded = SimilarIndex()
+        with Session(engine) as session:
+            assert loaded.load_or_build(session, path) is False  # 테이블 버전이 같으면 읽기만
+        assert loaded.versions == built.versions
+        for table, index in built.tables.items():
+            ids = [int(id) for id in index.ids[:5]]
+            assert loaded.tables[table].neighbours(ids, 5) == index.neighbours(ids, 5)
+
+        id = int(built.tables["fourchar"].ids[0])
+        assert client.put(f"/fourchar/edit/{id}", json={"contents_detail": "추천 색인 갱신"}).status_code == 200
+        with Session(engine) as session:
+            assert SimilarIndex().load_or_build(session, path) is True  # 그 사이 쓰기가 있으면 다시 만든다
+    finally:
+        engine.dispose()
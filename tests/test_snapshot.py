@@ -0,0 +1,70 @@
+# tests/test_snapshot.py
+"""
+스냅샷 모드(tools/snapshot.py): 스냅샷 파일로 응답한 목록/필터/커서 조회가 DB로 응답한 결과와 같아야 한다.
+쓰기 후에는 스냅샷을 다시 만든(refresh) 뒤 같은지 확인한다.
+"""
+import asyncio
+import os
+
+from fastapi.encoders import jsonable_encoder
+from sqlmodel import create_engine
+
+from tools.snapshot import SnapshotStore
+from conftest import DATABASE_URL, DIRECTORY
+
+
+# (경로, 스냅샷 조회 함수 이름, 인자) 앱은 DB로 응답하고, 같은 조건을 스냅샷에서 직접 조회해 비교한다
+def cases(table, category, consonant):
+    return [
+        (f"/{table}?p=1&size=10", "list", (table, 1, 10, None)),
+        (f"/{table}?p=3&size=7", "list", (table, 3, 7, None)),
+        (f"/{table}?cursor=&size=10", "list", (table, 1, 10, "")),
+        (f"/{table}/filter/?categories={category}&p=1&size=5", "filter", (table, [category], None, None, 1, 5, None, "latest", False)),
+        (f"/{table}/filter/?consonants={consonant}&p=1&size=5", "filter", (table, None, None, [consonant], 1, 5, None, "latest", False)),
+        (f"/{table}/filter/?categories={category}&consonants={consonant}", "filter", (table, [category], None, [consonant], 1, 15, None, "latest", False)),
+        (f"/{table}/filter/?categories={category}&cursor=&size=5", "filter", (table, [category], None, None, 1, 5, "", "latest", False)),
+    ]
+
+
+def first_row(client, table):
+    return client.get(f"/{table}?p=1&size=1").json()["content"][0]
+
+
+def assert_same(client, snapshot, table):
+    row = first_row(client, table)
+    category = row["category"]
+    consonant = (row["contents_eng"] if table == "saying" else row["contents_kr"])[:1]
+    consonant = client.get(f"/{table}/{row['id']}").json()["initial"] or consonant
+    for path, method, args in cases(table, category, consonant):
+        expected = client.get(path).json()
+        actual = jsonable_encoder(getattr(snapshot, method)(*args))
+        assert actual == expected, path
+        if expected.get("next_cursor"):  # 다음 커서 페이지도 비교
+            next_args = args[:-1 if method == "list" else -3] + (expected["next_cursor"],) + (() if method == "list" else args[-2:])
+            next_path = path.replace("cursor=", f"cursor={expected['next_cursor']}")
+            assert jsonable_encoder(getattr(snapshot, method)(*next_args)) == client.get(next_path).json(), next_path
+
+
+def test_snapshot_matches_database_before_and_after_writes(client):
+    engine = create_engine(DATABASE_URL)
+    store = SnapshotStore()  # 앱의 snapshot_store는 켜지 않는다(앱은 계속 DB로 응답)
+    try:
+        store.open(engine, os.path.join(DIRECTORY, "test.snap"), check_interval=0, refresh_delay=0)
+        for table in ("saying", "fourchar"):
+            assert_same(client, store.current, table)
+
+        saying = first_row(client, "saying")
+        created = client.post("/saying/new", json={"category": saying["category"], "author": "스냅샷", "contents_kr": "새 명언", "contents_eng": "Snapshot"})
+        assert created.status_code == 200
+        assert client.put(f"/saying/edit/{saying['id']}", json={"category": "스냅샷"}).status_code == 200
+        fourchar = first_row(client, "fourchar")
+        assert client.delete(f"/fourchar/delete/{fourchar['id']}").status_code == 200
+
+        store.requested = True  # 쓰기 커밋 후 갱신 요청과 같다
+        asyncio.run(store.refresh())
+        assert store.current.get("saying", created.json()["id"]) is not None
+        assert store.current.get("fourchar", fourchar["id"]) is None  # 소프트 삭제
+        for table in ("saying", "fourchar"):
+            assert_same(client, store.current, table)
+    finally:
+        engine.dispose()
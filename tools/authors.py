@@ -0,0 +1,82 @@
+# tools/authors.py
+"""
+발화자 집계 테이블 동기화(/saying/authors)
+
+카테고리 테이블(tools/categories.py)과 같은 방식으로 명언 생성/수정/삭제 시 발화자 행을 upsert 하고
+운영 중(use_yn=1)인 명언 개수(item_count)를 증감한다. 목록 조회는 GROUP BY 없이 이 테이블만 읽는다.
+"""
+from sqlalchemy import bindparam, func, insert, literal, update
+from sqlmodel import select
+
+from models.authors import Author
+from models.sayings import Saying
+from tools.pagination import decode_cursor, encode_cursor
+from tools.upsert import upsert_statement
+
+
+async def upsert_authors(session, names):  # 커밋은 호출한 쪽에서
+    names = sorted({name for name in names if name})
+    if not names:
+        return
+    connection = await session.connection()
+    await connection.execute(upsert_statement(connection.dialect.name, Author, "name"), [{"name": name, "item_count": 0} for name in names])
+
+
+async def adjust_author_counts(session, counts):  # counts: {발화자: 증감값}
+    counts = {name: delta for name, delta in counts.items() if name and delta}
+    if not counts:
+        return
+    statement = (
+        update(Author)
+        .where(Author.name == bindparam("author_name"))
+        .values(item_count=func.coalesce(Author.item_count, 0) + bindparam("delta"))
+    )
+    connection = await session.connection()
+    await connection.execute(statement, [{"author_name": name, "delta": delta} for name, delta in counts.items()])
+
+
+async def apply_author_change(session, before=None, after=None):
+    """
+    명언 1개의 (발화자, use_yn) 변경을 발화자 테이블에 반영한다. 생성은 before=None, 삭제는 after=None
+    """
+    if after and after[0]:
+        await upsert_authors(session, [after[0]])
+    old = before[0] if before and before[1] == 1 else None
+    new = after[0] if after and after[1] == 1 else None
+    if old != new:
+        await adjust_author_counts(session, {old: -1, new: 1})
+
+
+def sync_statements():  # 발화자 테이블 전체 재계산(tools.manage sync-authors)
+    existing = select(Author.name)
+    missing = (
+        select(Saying.author, literal(0))
+        .where(Saying.author.isnot(None), Saying.author != "", Saying.author.not_in(existing))
+        .group_by(Saying.author)
+    )
+    count = (
+        select(func.count(Saying.id))
+        .where(Saying.author == Author.name, Saying.use_yn == 1)
+        .scalar_subquery()
+    )
+    return [
+        insert(Author).from_select(["name", "item_count"], missing),
+        update(Author).values(item_count=count),
+    ]
+
+
+async def author_page(session, cursor, size):  # 이름순 커서 페이징(운영 중인 명언이 있는 발화자만)
+    last_name = decode_cursor(cursor, key="name", kind=str)
+    statement = select(Author.name, Author.item_count).where(Author.item_count > 0)
+    if last_name is not None:
+        statement = statement.where(Author.name > last_name)
+    rows = (await session.exec(statement.order_by(Author.name).limit(size + 1))).all()
+    next_cursor = None
+    if len(rows) > size:
+        rows = rows[:size]
+        next_cursor = encode_cursor(rows[-1].name, key="name") if rows else None
+    return {
+        "size": len(rows),
+        "next_cursor": next_cursor,
+        "content": [row._asdict() for row in rows]
+    }
@@ -0,0 +1,47 @@
+# tools/batch.py
+"""
+여러 id 한 번에 조회(/saying/batch, /fourchar/batch)
+
+단일 조회 캐시에 있는 데이터는 캐시에서 꺼내고, 나머지는 IN 쿼리 1번으로 조회한 뒤 캐시에 저장한다.
+응답 content는 요청한 id 순서를 유지하고(중복 id는 한 번만), 존재하지 않거나 삭제(use_yn=0)된 id는 missing에 담는다.
+캐시에는 운영 중인 데이터만 저장한다(단일 조회와 같음).
+"""
+from fastapi import HTTPException, status
+from sqlmodel import select
+
+from database.connection import settings
+from tools.cache import item_cache
+
+
+def parse_ids(values):  # ids=1,2,3 과 ids=1&ids=2 형태 모두 지원. 순서를 유지하며 중복 제거
+    ids = []
+    try:
+        for value in values or []:
+            ids.extend(int(part) for part in str(value).split(",") if part.strip())
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="ids는 정수 목록이어야 합니다."
+        )
+    ids = list(dict.fromkeys(ids))
+    if len(ids) > settings.BATCH_MAX_IDS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"한 번에 최대 {settings.BATCH_MAX_IDS}개까지 조회할 수 있습니다."
+        )
+    return ids
+
+
+async def fetch_batch(session, Table, ids):
+    table = Table.__tablename__
+    found = await item_cache.get_many(table, ids)  # tools/cache.py 단일 조회 캐시
+    missing = [id for id in ids if id not in found]
+    if missing:
+        rows = (await session.exec(select(Table).where(Table.id.in_(missing), Table.use_yn==1))).all()
+        for row in rows:
+            data = found[row.id] = row.model_dump()
+            await item_cache.set(table, row.id, data)
+    return {
+        "content": [found[id] for id in ids if id in found],
+        "missing": [id for id in ids if id not in found]
+    }
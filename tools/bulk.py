@@ -0,0 +1,182 @@
+# tools/bulk.py
+"""
+대량 가져오기(import) / 내보내기(export)
+
+가져오기: 요청 본문을 스트림으로 읽으면서(NDJSON 또는 CSV) batch 개씩 모아 한 번에 INSERT 한다.
+내보내기: 서버 측 커서(yield_per)로 조금씩 읽어서 바로 응답으로 흘려보내므로 테이블 크기와 상관없이 메모리 사용량이 일정하다.
+"""
+import codecs
+import csv
+import io
+import json
+from collections import Counter
+
+from pydantic import ValidationError
+from sqlalchemy import insert, text
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from database.connection import async_engine, replica_engine
+from tools.categories import upsert_categories, adjust_category_counts
+from tools.authors import upsert_authors, adjust_author_counts
+from tools.count_cache import count_cache
+from tools.initials import fill_initial
+from tools.random_pool import id_pool
+from tools.suggest import suggest_index
+from tools.similar import similar_index
+from tools.search import search_backend
+from tools.http_cache import bump_version
+from tools.changes import record_inserted, change_version
+
+
+# 가져오기에서 클라이언트가 지정할 수 없는 필드(자동 생성)
+AUTO_FIELDS = {"id", "initial"}
+MAX_ERRORS = 100  # 응답에 담는 오류 행 최대 개수
+
+
+async def read_lines(stream):  # 바이트 청크 스트림을 줄 단위 문자열로 변환(청크 경계에서 잘린 한글도 처리)
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    buffer = ""
+    async for chunk in stream:
+        buffer += decoder.decode(chunk)
+        *lines, buffer = buffer.split("\n")
+        for line in lines:
+            yield line.rstrip("\r")
+    buffer += decoder.decode(b"", final=True)
+    if buffer:
+        yield buffer.rstrip("\r")
+
+
+async def parse_ndjson(stream):  # (줄 번호, dict) 생성
+    line_no = 0
+    async for line in read_lines(stream):
+        line_no += 1
+        if not line.strip():
+            continue
+        try:
+            yield line_no, json.loads(line)
+        except ValueError:
+            yield line_no, None
+
+
+async def parse_csv(stream):  # (줄 번호, dict) 생성. 첫 줄은 헤더, 따옴표 안의 줄바꿈 지원
+    header = None
+    pending = ""
+    line_no = 0
+    async for line in read_lines(stream):
+        line_no += 1
+        pending = f"{pending}\n{line}" if pending else line
+        if pending.count('"') % 2:  # 따옴표가 닫히지 않았으면 다음 줄과 합친다
+            continue
+        record, pending = pending, ""
+        if not record.strip():
+            continue
+        values = next(csv.reader([record]))
+        if header is None:
+            header = [name.strip() for name in values]
+            continue
+        yield line_no, {name: value for name, value in zip(header, values) if value != ""}
+
+
+def default_row(Table):  # 모델 기본값으로 채운 INSERT용 dict(created_at 등)
+    return {
+        name: None if field.is_required() else field.get_default(call_default_factory=True)  # 기본값이 없는 필드는 NULL
+        for name, field in Table.model_fields.items()
+        if name not in AUTO_FIELDS
+    }
+
+
+async def insert_rows(session, Table, rows):  # 이 배치가 넣은 행의 id 목록(동시에 다른 요청이 넣은 행은 포함하지 않음)
+    if session.bind.dialect.insert_executemany_returning:  # SQLite, MariaDB 등: INSERT ... RETURNING 을 묶어서 실행
+        return list((await session.exec(insert(Table).returning(Table.id), params=rows)).scalars())
+    # RETURNING을 지원하지 않으면(MySQL) 여러 행 VALUES INSERT 1번으로 넣는다. 행 수가 정해진 INSERT라 InnoDB는 id를 한 번에
+    # 연속으로 할당하고(id를 직접 넣지 않으므로), lastrowid는 그 첫 id다. 간격은 auto_increment_increment(복제 구성에 따라 1이 아닐 수 있음)
+    result = await session.exec(insert(Table).values(rows))
+    step = (await session.exec(text("SELECT @@auto_increment_increment"))).scalar_one()
+    return list(range(result.lastrowid, result.lastrowid + len(rows) * step, step))
+
+
+async def insert_batch(session, Table, rows):
+    """
+    카테고리(명언은 발화자도) 추가 및 개수 갱신을 한 번씩 실행하고, rows를 한 번에 INSERT(insert_rows)한 뒤 커밋한다.
+    새로 들어간 행들은 검색 색인, 랜덤 조회 목록, 자동완성 색인에 반영한다.
+    """
+    table = Table.__tablename__
+    await upsert_categories(session, table, {row.get("category") for row in rows})
+    await adjust_category_counts(session, table, Counter(row.get("category") for row in rows if row.get("use_yn") == 1))
+    if table == "saying":  # 발화자 집계
+        await upsert_authors(session, {row.get("author") for row in rows})
+        await adjust_author_counts(session, Counter(row.get("author") for row in rows if row.get("use_yn") == 1))
+    ids = await insert_rows(session, Table, rows)
+    await bump_version(session, table, "category")
+    await session.exec(record_inserted(Table, ids, await change_version(session, table)))  # 새로 들어간 행들의 변경 기록
+    await session.commit()
+
+    inserted = (await session.exec(select(Table).where(Table.id.in_(ids)))).all()
+    for row in inserted:
+        search_backend.index(row)
+        id_pool.update(row)
+        suggest_index.update(row)
+    similar_index.update_many(inserted)  # 행렬을 한 번에 이어 붙인다
+    return len(rows)
+
+
+async def bulk_import(stream, content_type, Table, UpdateModel, batch, session):
+    """
+    stream: 요청 본문(request.stream()), UpdateModel: 필드 검증에 사용할 수정 모델
+    """
+    parse = parse_csv if "csv" in (content_type or "") else parse_ndjson
+    allowed = set(UpdateModel.model_fields) - AUTO_FIELDS
+    inserted = 0
+    errors = []
+    failed = 0
+    rows = []
+    async for line_no, data in parse(stream):
+        try:
+            if not isinstance(data, dict):
+                raise ValueError("JSON 객체 형식이 아닙니다.")
+            values = UpdateModel.model_validate({k: v for k, v in data.items() if k in allowed}).model_dump(exclude_unset=True)
+        except (ValueError, ValidationError) as error:  # ValidationError도 ValueError의 하위 클래스
+            failed += 1
+            if len(errors) < MAX_ERRORS:
+                detail = error.errors(include_url=False, include_input=False) if isinstance(error, ValidationError) else str(error)
+                errors.append({"line": line_no, "detail": detail})
+            continue
+        row = default_row(Table)
+        row.update(values)
+        row["initial"] = fill_initial(Table(**row)).initial  # 초성/첫 글자 필드 계산
+        rows.append(row)
+        if len(rows) >= batch:
+            inserted += await insert_batch(session, Table, rows)
+            rows = []
+    if rows:
+        inserted += await insert_batch(session, Table, rows)
+
+    count_cache.invalidate(Table.__tablename__)
+    return {
+        "inserted": inserted,
+        "failed": failed,
+        "errors": errors
+    }
+
+
+async def bulk_export(Table, format, batch):
+    """
+    전체 데이터를 id 순서로 NDJSON 또는 CSV 문자열 조각으로 생성한다.
+    StreamingResponse가 끝까지 읽을 때까지 세션을 유지해야 하므로 별도의 세션을 연다.
+    """
+    fields = list(Table.model_fields)
+    async with AsyncSession(replica_engine or async_engine) as session:
+        statement = select(Table).order_by(Table.id).execution_options(yield_per=batch)
+        result = await session.stream_scalars(statement)
+        if format == "csv":
+            yield ",".join(fields) + "\n"
+        async for rows in result.partitions():
+            buffer = io.StringIO()
+            if format == "csv":
+                writer = csv.writer(buffer, lineterminator="\n")
+                writer.writerows([["" if getattr(row, name) is None else getattr(row, name) for name in fields] for row in rows])
+            else:
+                for row in rows:
+                    buffer.write(row.model_dump_json() + "\n")
+            yield buffer.getvalue()
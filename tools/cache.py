@@ -0,0 +1,140 @@
+# tools/cache.py
+"""
+단일 데이터 조회(/saying/{id}, /fourchar/{id}) 캐시
+"""
+import time
+from collections import OrderedDict
+
+from database.connection import settings
+
+
+class CacheBackend:
+    """
+    캐시 저장소 기본 클래스.
+    여러 워커가 같은 캐시를 쓰려면 이 클래스를 상속해 공유 저장소(예: Redis)를 구현하고
+    item_cache.backend 에 지정한다. 값(model_dump() 결과 dict)은 datetime 등 타입이 유지되도록 저장해야 한다(예: pickle).
+    """
+    async def get(self, key):  # 값이 없거나 만료되면 None
+        raise NotImplementedError
+
+    async def get_many(self, keys):  # {key: 값} (없는 key는 제외). 공유 저장소는 한 번에 조회하도록(MGET 등) 재정의
+        values = {}
+        for key in keys:
+            value = await self.get(key)
+            if value is not None:
+                values[key] = value
+        return values
+
+    async def set(self, key, value, ttl):
+        raise NotImplementedError
+
+    async def delete(self, key):
+        raise NotImplementedError
+
+    async def clear(self):
+        raise NotImplementedError
+
+
+class MemoryCacheBackend(CacheBackend):  # 프로세스 메모리 LRU + TTL 캐시
+    def __init__(self, maxsize=10000):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()  # key: (값, 만료 시각)
+
+    async def get(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if time.monotonic() > expires_at:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key, value, ttl):
+        self._entries[key] = (value, time.monotonic() + ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    async def delete(self, key):
+        self._entries.pop(key, None)
+
+    async def clear(self):
+        self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class NullCacheBackend(CacheBackend):  # 캐시 사용 안 함
+    async def get(self, key):
+        return None
+
+    async def set(self, key, value, ttl):
+        pass
+
+    async def delete(self, key):
+        pass
+
+    async def clear(self):
+        pass
+
+
+class ItemCache:
+    """
+    id별로 직렬화된 응답(dict)을 저장한다. 수정/삭제/생성 라우트에서 invalidate 한다.
+    """
+    def __init__(self, backend, ttl=300):
+        self.backend = backend
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(table, id):
+        return f"{table}:{id}"
+
+    async def get(self, table, id):
+        value = await self.backend.get(self.key(table, id))
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    async def get_many(self, table, ids):  # {id: 값} (캐시에 없는 id는 제외)
+        keys = {self.key(table, id): id for id in ids}
+        values = await self.backend.get_many(list(keys))
+        self.hits += len(values)
+        self.misses += len(keys) - len(values)
+        return {keys[key]: value for key, value in values.items()}
+
+    async def set(self, table, id, value):
+        await self.backend.set(self.key(table, id), value, self.ttl)
+
+    async def invalidate(self, table, id):
+        await self.backend.delete(self.key(table, id))
+
+    def stats(self):  # 캐시 적중 현황
+        total = self.hits + self.misses
+        stats = {
+            "backend": type(self.backend).__name__,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+        }
+        if isinstance(self.backend, MemoryCacheBackend):
+            stats["size"] = len(self.backend)
+            stats["maxsize"] = self.backend.maxsize
+        return stats
+
+
+def get_cache_backend(name):  # 설정값에 맞는 캐시 저장소 생성
+    if name == "none":
+        return NullCacheBackend()
+    return MemoryCacheBackend(maxsize=settings.ITEM_CACHE_SIZE)
+
+
+item_cache = ItemCache(get_cache_backend(settings.ITEM_CACHE_BACKEND), ttl=settings.ITEM_CACHE_TTL)
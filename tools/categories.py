@@ -0,0 +1,83 @@
+# tools/categories.py
+"""
+카테고리 테이블 동기화
+"""
+from sqlalchemy import bindparam, func, insert, literal, update
+from sqlmodel import select
+
+from models.category import Category
+from tools.upsert import upsert_statement
+
+
+# 데이터 테이블별 카테고리 테이블 필드
+CATEGORY_FIELDS = {
+    "saying": "saying_categories",
+    "fourchar": "fourchar_categories",
+}
+
+
+async def upsert_categories(session, table, names):
+    """
+    names 중 카테고리 테이블에 없는 카테고리를 한 번의 INSERT로 추가한다(커밋은 호출한 쪽에서).
+    조회 후 추가하는 방식과 달리 동시에 요청이 와도 중복이 생기지 않는다.
+    """
+    names = sorted({name for name in names if name})
+    if not names:
+        return
+    field = CATEGORY_FIELDS[table]
+    connection = await session.connection()
+    statement = upsert_statement(connection.dialect.name, Category, field)
+    await connection.execute(statement, [{field: name, "item_count": 0} for name in names])
+
+
+async def adjust_category_counts(session, table, counts):  # counts: {카테고리: 증감값}
+    counts = {name: delta for name, delta in counts.items() if name and delta}
+    if not counts:
+        return
+    column = getattr(Category, CATEGORY_FIELDS[table])
+    statement = (
+        update(Category)
+        .where(column == bindparam("name"))
+        .values(item_count=func.coalesce(Category.item_count, 0) + bindparam("delta"))
+    )
+    connection = await session.connection()
+    await connection.execute(statement, [{"name": name, "delta": delta} for name, delta in counts.items()])
+
+
+async def apply_category_change(session, table, before=None, after=None):
+    """
+    데이터 1개의 (카테고리, use_yn) 변경을 카테고리 테이블에 반영한다.
+    생성은 before=None, 삭제는 after=None
+    """
+    if after and after[0]:
+        await upsert_categories(session, table, [after[0]])
+    old = before[0] if before and before[1] == 1 else None
+    new = after[0] if after and after[1] == 1 else None
+    if old != new:
+        await adjust_category_counts(session, table, {old: -1, new: 1})
+
+
+def sync_statements(Table):
+    """
+    new_all 에서 실행하는 문장들
+    1. 데이터 테이블에는 있지만 카테고리 테이블에 없는 카테고리만 한 번에 추가(INSERT ... SELECT)
+    2. 카테고리별 데이터 개수를 한 번에 다시 계산(UPDATE ... SET item_count = (SELECT count(*) ...))
+    """
+    field = CATEGORY_FIELDS[Table.__tablename__]
+    column = getattr(Category, field)
+    existing = select(column).where(column.isnot(None))
+    missing = (
+        select(Table.category, literal(0))
+        .where(Table.category.isnot(None), Table.category.not_in(existing))
+        .group_by(Table.category)
+    )
+    count = (
+        select(func.count(Table.id))
+        .where(Table.category == column, Table.use_yn == 1)
+        .scalar_subquery()
+    )
+    return [
+        insert(Category).from_select([field, "item_count"], missing),
+        update(Category).where(column.isnot(None)).values(item_count=count),
+    ]
+
@@ -0,0 +1,108 @@
+# tools/changes.py
+"""
+변경 기록(change feed)
+
+생성/수정/삭제 라우트와 대량 가져오기는 같은 트랜잭션에서 change_log 에 (테이블, id, 동작, 버전)을 남긴다.
+버전은 bump_version(tools/http_cache.py)이 올린 table_version 의 값이다. 같은 테이블의 쓰기는 버전 행 잠금을 커밋까지 잡고 있으므로
+버전이 커밋 순서대로 정해지고, 버전 N이 보이면 N보다 작은 버전은 모두 커밋된 상태다.
+(change_log 의 자동 증가 id는 커밋 전에 정해져서 커밋 순서와 다를 수 있으므로 토큰으로 쓰지 않는다)
+클라이언트는 마지막으로 받은 토큰(since) 이후의 변경만 받아 로컬 캐시를 갱신한다. 같은 데이터가 여러 번 바뀌었으면 현재 상태 1건으로 합쳐서 응답한다.
+"""
+from fastapi import HTTPException, status
+from sqlalchemy import insert, literal
+from sqlmodel import select, func, delete
+
+from models.changes import ChangeLog, ChangeLogState
+from models.versions import TableVersion
+from models.sayings import current_time_kst
+from tools.pagination import projection, as_dicts
+
+
+async def change_version(session, table):  # bump_version 이후(버전 행 잠금을 잡은 상태)에 호출
+    return (await session.exec(select(TableVersion.version).where(TableVersion.name == table))).one()
+
+
+async def record_change(session, table, row_id, action):  # bump_version 다음에 호출. 커밋은 호출한 쪽에서
+    version = await change_version(session, table)
+    session.add(ChangeLog(table_name=table, row_id=row_id, action=action, version=version))
+
+
+def record_inserted(Table, ids, version):  # 대량 가져오기: 새로 넣은 행들을 create로 기록하는 INSERT ... SELECT
+    table = Table.__tablename__
+    rows = (
+        select(literal(table), Table.id, literal("create"), literal(version), literal(current_time_kst()))
+        .where(Table.id.in_(ids))
+        .order_by(Table.id)
+    )
+    return insert(ChangeLog).from_select(["table_name", "row_id", "action", "version", "changed_at"], rows)
+
+
+async def read_changes(session, Table, ReadModel, since, limit):
+    """
+    since 이후의 변경을 읽어서 {since, next, has_more, content(운영 중인 데이터), deleted(삭제/미사용 id)} 반환.
+    since가 None이면 현재 토큰만 반환(처음 전체 목록을 받은 직후 호출).
+    토큰은 버전 단위라 한 버전(트랜잭션)의 변경은 나누지 않는다. limit을 넘으면 마지막 버전은 다음 요청으로 넘기고,
+    한 버전이 limit보다 크면 그 버전만 모두 반환한다.
+    """
+    table = Table.__tablename__
+    state = await session.get(ChangeLogState, table)
+    pruned = state.pruned_version if state is not None else 0
+    if since is None:  # 기록을 모두 정리했어도 정리 위치보다 작은 토큰은 주지 않는다
+        latest = (await session.exec(select(func.max(ChangeLog.version)).where(ChangeLog.table_name == table))).one() or 0
+        return {"since": None, "next": max(latest, pruned), "has_more": False, "content": [], "deleted": []}
+
+    if since < pruned:
+        raise HTTPException(
+            status_code=status.HTTP_410_GONE,
+            detail="변경 기록이 정리된 토큰입니다. 전체 목록을 다시 받으세요."
+        )
+
+    statement = (
+        select(ChangeLog.version, ChangeLog.row_id)
+        .where(ChangeLog.table_name == table, ChangeLog.version > since)
+        .order_by(ChangeLog.version, ChangeLog.id)
+        .limit(limit + 1)  # 다음 변경 존재 여부 확인용으로 1개 더 조회
+    )
+    entries = (await session.exec(statement)).all()
+    has_more = len(entries) > limit
+    if has_more:
+        cut = entries[limit].version  # 이 버전은 잘렸을 수 있으므로 다음 요청에서 처음부터
+        if entries[0].version == cut:  # 한 버전이 limit보다 크면 그 버전 전체
+            entries = (await session.exec(
+                select(ChangeLog.version, ChangeLog.row_id)
+                .where(ChangeLog.table_name == table, ChangeLog.version == cut)
+                .order_by(ChangeLog.id)
+            )).all()
+        else:
+            entries = [entry for entry in entries[:limit] if entry.version != cut]
+
+    row_ids = list(dict.fromkeys(entry.row_id for entry in entries))
+    rows = []
+    if row_ids:
+        rows = (await session.exec(projection(Table, ReadModel).where(Table.id.in_(row_ids), Table.use_yn==1).order_by(Table.id))).all()
+    found = {row.id for row in rows}
+    return {
+        "since": since,
+        "next": entries[-1].version if entries else since,
+        "has_more": has_more,
+        "content": as_dicts(rows),
+        "deleted": [id for id in row_ids if id not in found]
+    }
+
+
+def prune_changes(session, before):  # before(datetime) 이전 기록 삭제(동기 세션, tools/manage.py)
+    count = 0
+    tables = session.exec(select(ChangeLog.table_name).distinct()).all()
+    for table in tables:
+        last = session.exec(
+            select(func.max(ChangeLog.version)).where(ChangeLog.table_name == table, ChangeLog.changed_at < before)
+        ).one()
+        if last is None:
+            continue
+        result = session.exec(delete(ChangeLog).where(ChangeLog.table_name == table, ChangeLog.version <= last))
+        state = session.get(ChangeLogState, table) or ChangeLogState(table_name=table)
+        state.pruned_version = max(state.pruned_version, last)
+        session.add(state)
+        count += result.rowcount
+    session.commit()
+    return count
@@ -0,0 +1,63 @@
+# tools/coalesce.py
+"""
+같은 조회 요청 합치기(single-flight)
+
+같은 조건의 목록/필터 요청이 동시에 많이 들어오면 먼저 들어온 요청 1개만 DB 조회(개수 + 페이지)를 실행하고,
+실행 중에 들어온 나머지 요청은 그 결과를 같이 받는다. 실행이 끝나면 바로 지워지므로 결과를 캐시하지는 않는다.
+조회는 요청과 분리된 task에서 실행되므로 먼저 들어온 요청의 연결이 끊겨도(취소) 기다리던 요청들은 결과를 받는다.
+"""
+import asyncio
+import functools
+
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+
+class SingleFlight:
+    def __init__(self):
+        self.calls = {}  # {key: 실행 중인 조회 task}
+        self.shared = 0  # 다른 요청의 결과를 같이 받은 횟수
+
+    async def do(self, key, fn):
+        task = self.calls.get(key)
+        if task is not None:
+            self.shared += 1
+        else:
+            task = asyncio.get_running_loop().create_task(fn())  # 요청과 분리된 task로 실행(먼저 온 요청이 취소되어도 나머지는 결과를 받는다)
+            self.calls[key] = task
+            task.add_done_callback(functools.partial(self.forget, key))
+        return await asyncio.shield(task)  # 기다리던 요청이 취소되어도 task는 취소되지 않게
+
+    def forget(self, key, task):
+        if self.calls.get(key) is task:
+            del self.calls[key]
+        if not task.cancelled():
+            task.exception()  # 기다리는 요청이 모두 취소됐을 때 "exception was never retrieved" 경고 방지
+
+
+single_flight = SingleFlight()
+
+
+def freeze(value):  # 캐시 키로 쓸 수 있도록 list를 tuple로 변환
+    return tuple(value) if isinstance(value, list) else value
+
+
+def coalesce(route):
+    """
+    라우트 함수 데코레이터. session을 제외한 쿼리 파라미터가 같으면 같은 요청으로 본다.
+    @saying_router.get(...) 아래에 붙인다(FastAPI는 functools.wraps로 유지된 원래 함수 시그니처를 사용).
+    """
+    @functools.wraps(route)
+    async def wrapper(**kwargs):
+        key = (route.__module__, route.__name__) + tuple(
+            (name, freeze(value)) for name, value in sorted(kwargs.items()) if name != "session"
+        )
+
+        async def run():  # 요청 세션은 요청이 끝나면 닫히므로 task 전용 세션(같은 엔진)으로 실행
+            session = kwargs.get("session")
+            if session is None:
+                return await route(**kwargs)
+            async with AsyncSession(session.bind, expire_on_commit=False) as own:
+                return await route(**{**kwargs, "session": own})
+
+        return await single_flight.do(key, run)
+    return wrapper
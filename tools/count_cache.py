@@ -0,0 +1,60 @@
+# tools/count_cache.py
+"""
+전체 개수(total_rows) 캐시
+"""
+import time
+from collections import OrderedDict
+
+from database.connection import settings
+
+
+class CountCache:
+    """
+    필터 조건별 count(*) 결과를 저장하는 캐시.
+    생성/수정/삭제 라우트가 해당 테이블의 항목을 갱신하거나 무효화하므로 응답의 개수는 정확하게 유지된다.
+    (다른 워커에서 일어난 쓰기는 ttl 초 안에 반영된다)
+    """
+    def __init__(self, maxsize=1024, ttl=60):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()  # key: (table, 필터...) / value: (개수, 저장 시각)
+
+    @staticmethod
+    def key(table, categories=None, keyword=None, consonants=None):  # 필터 조건을 정규화한 캐시 키
+        return (
+            table,
+            tuple(sorted(set(categories))) if categories else (),
+            keyword or "",  # 라우트에서 clean_keyword로 정리된 값
+            tuple(sorted(set(c.upper() for c in consonants))) if consonants else (),
+        )
+
+    def get(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        count, stored_at = entry
+        if time.monotonic() - stored_at > self.ttl:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return count
+
+    def set(self, key, count):
+        self._entries[key] = (count, time.monotonic())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def adjust(self, table, delta):  # 생성/삭제 시 필터 없는 전체 개수는 증감하고, 필터가 걸린 항목들은 무효화
+        total_key = self.key(table)
+        entry = self._entries.get(total_key)
+        self.invalidate(table)
+        if entry is not None:
+            self._entries[total_key] = (entry[0] + delta, entry[1])
+
+    def invalidate(self, table):  # 해당 테이블의 모든 항목 삭제
+        for key in [key for key in self._entries if key[0] == table]:
+            del self._entries[key]
+
+
+count_cache = CountCache(maxsize=settings.COUNT_CACHE_SIZE, ttl=settings.COUNT_CACHE_TTL)
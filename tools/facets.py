@@ -0,0 +1,47 @@
+# tools/facets.py
+"""
+필터 화면의 카테고리/초성(첫 글자)별 개수(facets=true)
+
+검색어 조건만 건 GROUP BY category, initial 쿼리 1번의 결과로 두 가지 개수를 모두 계산한다.
+- 카테고리별 개수: 선택한 초성 조건은 적용하고 카테고리 조건은 빼고 센다(다른 카테고리 칩을 눌렀을 때의 개수)
+- 초성별 개수: 선택한 카테고리 조건은 적용하고 초성 조건은 빼고 센다
+그룹 결과는 전체 개수 캐시(count_cache)에 같이 저장되어 쓰기 시 함께 무효화된다.
+"""
+from collections import Counter
+
+from sqlmodel import select, func
+
+from tools.count_cache import count_cache
+from tools.search import search_backend
+
+
+def facet_statement(Table, keyword):
+    statement = select(Table.category, Table.initial, func.count()).where(Table.use_yn==1)
+    if keyword:
+        statement = statement.where(search_backend.condition(Table, keyword))
+    return statement.group_by(Table.category, Table.initial)
+
+
+def build_facets(groups, categories=None, consonants=None):  # groups: [(category, initial, 개수)]
+    categories = set(categories or [])
+    consonants = {consonant.upper() for consonant in consonants or []}
+    by_category, by_initial = Counter(), Counter()
+    for category, initial, count in groups:
+        if category is not None and (not consonants or initial in consonants):
+            by_category[category] += count
+        if initial is not None and (not categories or category in categories):
+            by_initial[initial] += count
+    return {
+        "categories": dict(by_category.most_common()),
+        "consonants": dict(sorted(by_initial.items()))
+    }
+
+
+async def facet_counts(session, Table, keyword, categories, consonants):
+    table = Table.__tablename__
+    cache_key = count_cache.key(table, keyword=keyword) + ("facets",)  # 첫 값이 테이블명이라 invalidate(table)에 같이 지워짐
+    groups = count_cache.get(cache_key)
+    if groups is None:
+        groups = [tuple(row) for row in (await session.exec(facet_statement(Table, keyword))).all()]
+        count_cache.set(cache_key, groups)
+    return build_facets(groups, categories, consonants)
@@ -0,0 +1,99 @@
+# tools/http_cache.py
+"""
+HTTP 캐시(ETag, Last-Modified, Cache-Control)
+
+쓰기 라우트는 같은 트랜잭션에서 table_version 테이블의 버전을 올린다.
+조회 라우트는 버전 행(PK 조회)만 읽어 ETag를 만들고, 클라이언트의 If-None-Match/If-Modified-Since와 같으면
+페이지 쿼리를 실행하지 않고 바로 304를 응답한다. 버전이 DB에 있으므로 여러 워커에서도 일관된다.
+"""
+import hashlib
+from datetime import timedelta, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+
+from fastapi import Depends, HTTPException, Request, Response, status
+from sqlalchemy import update
+from sqlmodel import Session, select
+
+from database.connection import settings, get_read_session
+from models.versions import TableVersion
+from models.sayings import current_time_kst
+from tools.snapshot import snapshot_store
+
+
+KST = timezone(timedelta(hours=9))
+TABLES = ("saying", "fourchar", "category")
+
+
+def ensure_versions(engine):  # 앱 시작 시 버전 행이 없으면 생성
+    with Session(engine) as session:
+        existing = set(session.exec(select(TableVersion.name)).all())
+        for name in TABLES:
+            if name not in existing:
+                session.add(TableVersion(name=name))
+        session.commit()
+
+
+async def bump_version(session, *tables):
+    """
+    쓰기 라우트에서 커밋 전에 호출한다(커밋은 호출한 쪽에서).
+    스냅샷 모드에서는 이 세션이 커밋되면 스냅샷 파일을 다시 만든다.
+    """
+    session.info["snapshot_changed"] = True
+    for name in tables:
+        statement = (
+            update(TableVersion)
+            .where(TableVersion.name == name)
+            .values(version=TableVersion.version + 1, updated_at=current_time_kst())
+        )
+        result = await session.exec(statement)
+        if result.rowcount == 0:
+            session.add(TableVersion(name=name, version=1))
+
+
+def make_etag(request, versions):  # 테이블 버전 + 요청 경로/쿼리로 결과 집합별 ETag 생성
+    stamp = ",".join(f"{row.name}:{row.version}" for row in versions)
+    query = "&".join(sorted(f"{key}={value}" for key, value in request.query_params.multi_items()))
+    digest = hashlib.sha1(f"{stamp}|{request.url.path}?{query}".encode()).hexdigest()[:20]
+    return f'W/"{digest}"'
+
+
+def is_not_modified(request, etag, last_modified):
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:  # If-None-Match가 있으면 If-Modified-Since보다 우선
+        tags = {tag.strip() for tag in if_none_match.split(",")}
+        return "*" in tags or etag in tags or etag[2:] in tags
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            return last_modified.replace(microsecond=0) <= parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+    return False
+
+
+def http_cache(*tables, snapshot=False):
+    """
+    조회 라우트의 dependencies 에 추가해서 사용한다.
+    @router.get("", dependencies=[Depends(http_cache("saying"))])
+    snapshot=True 는 스냅샷 모드에서 스냅샷 파일을 읽는 라우트(목록/필터/카테고리)에만 지정한다.
+    """
+    async def check_version(request: Request, response: Response, session=Depends(get_read_session)):
+        if snapshot and snapshot_store.enabled:  # 스냅샷에서 응답하는 라우트는 DB 대신 스냅샷 파일의 버전 사용(tools/snapshot.py)
+            versions = snapshot_store.current.table_versions(tables)
+        else:
+            versions = (await session.exec(
+                select(TableVersion).where(TableVersion.name.in_(tables)).order_by(TableVersion.name)
+            )).all()
+        etag = make_etag(request, versions)
+        updated = [row.updated_at for row in versions if row.updated_at is not None]
+        last_modified = max(updated).replace(tzinfo=KST).astimezone(timezone.utc) if updated else None
+
+        headers = {"ETag": etag, "Cache-Control": settings.HTTP_CACHE_CONTROL}
+        if last_modified is not None:
+            headers["Last-Modified"] = format_datetime(last_modified, usegmt=True)
+
+        if is_not_modified(request, etag, last_modified):
+            raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)  # 본문 없이 응답
+        response.headers.update(headers)
+
+    return check_version
@@ -0,0 +1,104 @@
+# tools/index_sync.py
+"""
+워커 간 메모리 색인 동기화
+
+검색(ngram) 색인, 랜덤 조회 id 목록, 자동완성 색인, 추천 색인, 단일 조회 캐시는 워커 프로세스마다 메모리에 있어서
+쓰기를 처리한 워커에만 바로 반영된다. 각 워커는 INDEX_SYNC_INTERVAL초마다 change_log(tools/changes.py)에서
+마지막으로 반영한 토큰 이후의 변경을 읽어 같은 갱신을 적용한다. 자기 워커의 쓰기도 다시 적용되지만 결과는 같다.
+"""
+import asyncio
+import logging
+
+from sqlmodel import select, func
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from models.changes import ChangeLog
+from tools.search import search_backend
+from tools.random_pool import id_pool
+from tools.suggest import suggest_index
+from tools.similar import similar_index
+from tools.cache import item_cache
+from tools.count_cache import count_cache
+
+
+logger = logging.getLogger(__name__)
+
+CHUNK = 1000  # 한 번에 다시 읽는 행 수
+
+
+def tables():
+    from models.sayings import Saying
+    from models.fourchars import FourChar
+
+    return (Saying, FourChar)
+
+
+class IndexSync:
+    def __init__(self):
+        self.versions = {}  # 테이블별로 마지막으로 반영한 변경 토큰 {table: version}
+        self.task = None
+
+    def mark(self, session):  # 앱 시작 시 색인을 만들기 전에 호출(동기 세션). 이후 변경만 따라잡는다
+        for Table in tables():
+            table = Table.__tablename__
+            statement = select(func.max(ChangeLog.version)).where(ChangeLog.table_name == table)
+            self.versions[table] = session.exec(statement).one() or 0
+
+    async def catch_up(self, session):  # 반영한 변경 수
+        applied = 0
+        for Table in tables():
+            table = Table.__tablename__
+            statement = (
+                select(ChangeLog.version, ChangeLog.row_id)
+                .where(ChangeLog.table_name == table, ChangeLog.version > self.versions.get(table, 0))
+                .order_by(ChangeLog.version, ChangeLog.id)
+            )
+            entries = (await session.exec(statement)).all()
+            if not entries:
+                continue
+            row_ids = list(dict.fromkeys(entry.row_id for entry in entries))
+            for start in range(0, len(row_ids), CHUNK):
+                chunk = row_ids[start:start + CHUNK]
+                rows = {row.id: row for row in (await session.exec(select(Table).where(Table.id.in_(chunk)))).all()}
+                for id in chunk:
+                    row = rows.get(id)
+                    if row is None or row.use_yn != 1:  # 삭제/미사용
+                        search_backend.remove(Table, id)
+                        id_pool.remove(table, id)
+                        suggest_index.remove(table, id)
+                        similar_index.remove(table, id)
+                    else:
+                        search_backend.index(row)
+                        id_pool.update(row)
+                        suggest_index.update(row)
+                    await item_cache.invalidate(table, id)
+                similar_index.update_many([row for row in rows.values() if row.use_yn == 1])  # 행렬을 한 번에 이어 붙인다
+            count_cache.invalidate(table)
+            self.versions[table] = entries[-1].version
+            applied += len(row_ids)
+        return applied
+
+    async def run(self, engine, interval):
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                async with AsyncSession(engine, expire_on_commit=False) as session:
+                    await self.catch_up(session)
+            except Exception:  # DB 오류가 나도 다음 주기에 다시 시도
+                logger.exception("메모리 색인 동기화 실패")
+
+    def start(self, engine, interval):  # 앱 시작 시 호출(interval이 0이면 동기화하지 않음)
+        if interval > 0:
+            self.task = asyncio.get_running_loop().create_task(self.run(engine, interval))
+
+    async def stop(self):
+        if self.task is not None:
+            self.task.cancel()
+            try:
+                await self.task
+            except asyncio.CancelledError:
+                pass
+            self.task = None
+
+
+index_sync = IndexSync()
@@ -0,0 +1,32 @@
+# tools/initials.py
+"""
+초성/첫 글자 계산
+사자성어는 contents_kr의 첫 글자 초성, 명언은 contents_eng의 첫 글자(대문자)를 initial 필드에 저장해
+필터링 시 인덱스를 탄 IN (...) 조회가 되도록 한다.
+"""
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+DOUBLE_CONSONANTS = {"ㄲ": "ㄱ", "ㄸ": "ㄷ", "ㅃ": "ㅂ", "ㅆ": "ㅅ", "ㅉ": "ㅈ"}  # 된소리는 예사소리 탭에 포함(기존 '가'~'나' 범위와 동일)
+
+
+def hangul_initial(value):  # 첫 글자의 초성(한글 음절이 아니면 None)
+    if not value:
+        return None
+    char = value.strip()[:1]
+    if not ("가" <= char <= "힣"):
+        return None
+    consonant = CHOSEONG[(ord(char) - ord("가")) // 588]
+    return DOUBLE_CONSONANTS.get(consonant, consonant)
+
+
+def alpha_initial(value):  # 첫 글자(대문자). 기존 ilike("A%") 필터와 같은 기준
+    if not value:
+        return None
+    return value[:1].upper()[:1]
+
+
+def fill_initial(row):  # 모델 종류에 맞게 initial 필드를 채운다
+    if row.__tablename__ == "fourchar":
+        row.initial = hangul_initial(row.contents_kr)
+    else:
+        row.initial = alpha_initial(row.contents_eng)
+    return row
@@ -0,0 +1,60 @@
+# tools/manage.py
+"""
+운영용 명령어 모음
+
+$ python -m tools.manage prune-changes --days 90
+$ python -m tools.manage sync-authors
+$ python -m tools.manage build-similar
+$ python -m tools.manage export-snapshot
+"""
+import argparse
+from datetime import timedelta
+
+from sqlmodel import Session
+
+from database.connection import engine_url
+from models.sayings import current_time_kst
+from tools.changes import prune_changes
+from tools import authors
+from tools.similar import similar_index
+from tools.snapshot import export_snapshot
+from database.connection import settings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="명언 백엔드 운영 명령어")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("sync-authors", help="발화자 테이블(/saying/authors) 전체 재계산")
+
+    similar = commands.add_parser("build-similar", help="추천 색인 파일(/{id}/similar) 새로 만들기")
+    similar.add_argument("--path", default=settings.SIMILAR_SNAPSHOT_PATH, required=settings.SIMILAR_SNAPSHOT_PATH is None)
+
+    snapshot = commands.add_parser("export-snapshot", help="읽기 전용 스냅샷 파일(SNAPSHOT_PATH) 만들기")
+    snapshot.add_argument("--path", default=settings.SNAPSHOT_PATH, required=settings.SNAPSHOT_PATH is None)
+
+    prune = commands.add_parser("prune-changes", help="오래된 변경 기록(change_log) 삭제")
+    prune.add_argument("--days", type=int, default=90)
+
+    args = parser.parse_args()
+    if args.command == "sync-authors":
+        with engine_url.begin() as connection:
+            for statement in authors.sync_statements():
+                connection.execute(statement)
+        print("author: 발화자별 개수 계산을 완료했습니다.")
+    elif args.command == "build-similar":
+        with Session(engine_url) as session:
+            similar_index.build(session)
+        similar_index.save(args.path)
+        print(f"{args.path}: 추천 색인 파일을 만들었습니다(실행 중인 워커는 다음 시작 시 읽음).")
+    elif args.command == "export-snapshot":
+        export_snapshot(engine_url, args.path)
+        print(f"{args.path}: 스냅샷 파일을 만들었습니다(실행 중인 워커는 {settings.SNAPSHOT_CHECK_INTERVAL}초 안에 새 파일로 교체).")
+    elif args.command == "prune-changes":
+        with Session(engine_url) as session:
+            count = prune_changes(session, current_time_kst() - timedelta(days=args.days))
+        print(f"change_log: {count}개 기록을 삭제했습니다.")
+
+
+if __name__ == "__main__":
+    main()
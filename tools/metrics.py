@@ -0,0 +1,162 @@
+# tools/metrics.py
+"""
+요청 처리 시간 / SQL 실행 통계
+
+- MetricsMiddleware : 라우트별 처리 시간 히스토그램 기록, 응답에 Server-Timing 헤더 추가
+- instrument_engine : SQLAlchemy 이벤트로 요청마다 실행된 쿼리 수와 쿼리 시간 누적
+- metrics.render()  : /metrics 에서 Prometheus 텍스트 형식으로 출력
+워커 프로세스마다 따로 집계된다.
+"""
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+
+from sqlalchemy import event
+from starlette.datastructures import MutableHeaders
+
+
+# 히스토그램 구간(초)
+BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class RequestStats:  # 요청 1개의 SQL 실행 통계
+    __slots__ = ("queries", "db_seconds")
+
+    def __init__(self):
+        self.queries = 0
+        self.db_seconds = 0.0
+
+
+current_request = ContextVar("current_request", default=None)
+
+
+class Histogram:
+    def __init__(self, name, help, labels):
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self.series = {}  # {라벨 값 tuple: [구간별 개수..., 합계, 전체 개수]}
+
+    def observe(self, label_values, value):
+        series = self.series.get(label_values)
+        if series is None:
+            series = self.series[label_values] = [0] * len(BUCKETS) + [0.0, 0]
+        index = bisect_left(BUCKETS, value)
+        if index < len(BUCKETS):  # 가장 큰 구간보다 크면 +Inf 에만 포함
+            series[index] += 1
+        series[-2] += value
+        series[-1] += 1
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        for label_values, series in sorted(self.series.items()):
+            labels = ",".join(f'{key}="{value}"' for key, value in zip(self.labels, label_values))
+            cumulative = 0
+            for bound, count in zip(BUCKETS, series):
+                cumulative += count
+                lines.append(f'{self.name}_bucket{{{labels},le="{bound}"}} {cumulative}')
+            lines.append(f'{self.name}_bucket{{{labels},le="+Inf"}} {series[-1]}')
+            lines.append(f"{self.name}_sum{{{labels}}} {series[-2]:.6f}")
+            lines.append(f"{self.name}_count{{{labels}}} {series[-1]}")
+        return lines
+
+
+class Counter:
+    def __init__(self, name, help, labels):
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self.values = {}
+
+    def inc(self, label_values, amount=1):
+        self.values[label_values] = self.values.get(label_values, 0) + amount
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        for label_values, value in sorted(self.values.items()):
+            labels = ",".join(f'{key}="{value}"' for key, value in zip(self.labels, label_values))
+            lines.append(f"{self.name}{{{labels}}} {value}")
+        return lines
+
+
+class Metrics:
+    def __init__(self):
+        self.request_duration = Histogram("http_request_duration_seconds", "요청 처리 시간", ("method", "route", "status"))
+        self.request_db_duration = Histogram("http_request_db_duration_seconds", "요청 1개에서 SQL 실행에 걸린 시간", ("method", "route"))
+        self.db_queries = Counter("db_queries_total", "실행된 SQL 수", ("method", "route"))
+        self.collectors = []  # render 시 추가로 출력할 함수들(() -> 줄 목록)
+
+    def observe(self, method, route, status, seconds, stats):
+        self.request_duration.observe((method, route, str(status)), seconds)
+        self.request_db_duration.observe((method, route), stats.db_seconds)
+        self.db_queries.inc((method, route), stats.queries)
+
+    def render(self):
+        lines = self.request_duration.render() + self.request_db_duration.render() + self.db_queries.render()
+        for collector in self.collectors:
+            lines.extend(collector())
+        return "\n".join(lines) + "\n"
+
+
+metrics = Metrics()
+
+
+def instrument_engine(engine):  # 엔진(동기/비동기)에 쿼리 시간 측정 이벤트 등록
+    sync_engine = getattr(engine, "sync_engine", engine)
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info["query_start"].pop()
+        stats = current_request.get()
+        if stats is not None:
+            stats.queries += 1
+            stats.db_seconds += time.perf_counter() - started
+
+
+class MetricsMiddleware:
+    """
+    순수 ASGI 미들웨어. 라우트 경로(/saying/{id} 등)별로 집계해 라벨 수가 늘어나지 않게 한다.
+    """
+    def __init__(self, app):
+        self.app = app
+        self.route_paths = None  # {endpoint: 경로 템플릿}
+
+    def route_label(self, scope):
+        endpoint = scope.get("endpoint")
+        if endpoint is None:
+            return "unmatched"
+        if self.route_paths is None:
+            self.route_paths = {route.endpoint: route.path for route in scope["app"].routes if hasattr(route, "endpoint")}
+        return self.route_paths.get(endpoint, "unmatched")
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats()
+        token = current_request.set(stats)
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_with_timing(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                elapsed = (time.perf_counter() - started) * 1000
+                headers = MutableHeaders(scope=message)
+                headers.append(
+                    "Server-Timing",
+                    f'app;dur={elapsed:.1f}, db;dur={stats.db_seconds * 1000:.1f};desc="{stats.queries} queries"'
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            current_request.reset(token)
+            metrics.observe(scope["method"], self.route_label(scope), status_code, time.perf_counter() - started, stats)
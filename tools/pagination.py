@@ -2,10 +2,87 @@
 """
 페이지 처리
 """
+import base64
+import json
+
+from fastapi import HTTPException, status
+from sqlmodel import select, func
+
+
+def projection(Table, ReadModel):  # 목록 조회용 SELECT 문(ReadModel에 있는 컬럼만 조회)
+    return select(*[getattr(Table, field) for field in ReadModel.model_fields])
+
+
+def as_dicts(rows):  # 조회 결과(Row)를 응답용 dict 목록으로 변환
+    return [row._asdict() for row in rows]
+
+
+def count_statement(Table, statement=None, limit=None):
+    """
+    페이지 조회(paging, keyset_paging)와 같은 조건(use_yn==1)으로 개수를 세는 SELECT 문.
+    statement(필터 조건이 걸린 조회문)가 있으면 id만 남겨 서브쿼리로 센다. limit개까지만 셀 수도 있다.
+    """
+    if statement is None:
+        return select(func.count(Table.id)).where(Table.use_yn==1)
+    statement = statement.with_only_columns(Table.id).where(Table.use_yn==1)
+    if limit is not None:
+        statement = statement.limit(limit)
+    return select(func.count()).select_from(statement.subquery())
+
+
 def paging(page, size, Table, statement):  # 페이징 처리 함수
     if page < 1:
         page = 1
     offset = (page - 1) * size
     statement = statement.where(Table.use_yn==1)  # 운영에 사용 여부 확인
     statement = statement.offset(offset).limit(size).order_by(Table.id.desc())
-    return statement
\ No newline at end of file
+    return statement
+
+
+# 커서(keyset) 페이징
+"""
+OFFSET은 앞 페이지의 행들을 모두 읽고 버리기 때문에 뒤 페이지일수록 느려진다.
+커서 모드는 마지막으로 받은 id보다 작은 행부터 바로 찾기 때문에(id < last_id)
+몇 번째 페이지든 같은 비용으로 조회된다.
+"""
+def encode_cursor(last_id, key="id"):  # 마지막 id(또는 정렬 기준 값)를 불투명한 커서 문자열로 변환
+    raw = json.dumps({key: last_id}).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor, key="id", kind=int):  # 커서 문자열에서 마지막 값을 꺼냄(빈 문자열이면 첫 페이지)
+    if not cursor:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        last_id = json.loads(raw)[key]
+        if not isinstance(last_id, kind):
+            raise ValueError
+        return last_id
+    except (ValueError, KeyError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="잘못된 커서 값입니다."
+        )
+
+
+def keyset_paging(cursor, size, Table, statement):  # 커서 페이징 처리 함수
+    last_id = decode_cursor(cursor)
+    statement = statement.where(Table.use_yn==1)  # 운영에 사용 여부 확인
+    if last_id is not None:
+        statement = statement.where(Table.id < last_id)
+    statement = statement.order_by(Table.id.desc()).limit(size + 1)  # 다음 페이지 존재 여부 확인용으로 1개 더 조회
+    return statement
+
+
+def keyset_page(rows, size):  # 커서 페이징 결과를 응답 형태로 변환
+    rows = list(rows)
+    next_cursor = None
+    if len(rows) > size:
+        rows = rows[:size]
+        next_cursor = encode_cursor(rows[-1].id) if rows else None  # size가 0이면 빈 페이지
+    return {
+        "size": len(rows),
+        "next_cursor": next_cursor,
+        "content": as_dicts(rows)
+    }
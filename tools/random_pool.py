@@ -0,0 +1,116 @@
+# tools/random_pool.py
+"""
+랜덤 조회(/saying/random, /fourchar/random)용 id 목록
+"""
+import random
+import zlib
+
+from sqlmodel import select, func
+
+
+class IdPool:
+    """
+    테이블별, 카테고리별로 운영 중(use_yn==1)인 id 배열을 메모리에 들고 있는다.
+    배열에서 임의의 위치를 고르므로 데이터가 많아도 O(1)로 뽑을 수 있고(ORDER BY RAND() 불필요),
+    삭제는 마지막 원소와 자리를 바꾼 뒤 pop 하므로 O(1)이다.
+    """
+    def __init__(self):
+        self.ids = {}        # {(table, category): [id, ...]}  category가 None이면 전체
+        self.positions = {}  # {(table, category): {id: 배열 위치}}
+        self.categories = {}  # {table: {id: category}}
+
+    def build(self, session):  # 앱 시작 시 전체 id 목록 생성
+        from models.sayings import Saying
+        from models.fourchars import FourChar
+
+        self.ids, self.positions, self.categories = {}, {}, {}
+        for Table in (Saying, FourChar):
+            self.categories[Table.__tablename__] = {}
+            statement = select(Table.id, Table.category).where(Table.use_yn==1).execution_options(yield_per=10000)
+            for id, category in session.exec(statement):
+                self.add(Table.__tablename__, id, category)
+
+    def _push(self, key, id):
+        positions = self.positions.setdefault(key, {})
+        if id in positions:
+            return
+        ids = self.ids.setdefault(key, [])
+        positions[id] = len(ids)
+        ids.append(id)
+
+    def _pop(self, key, id):
+        positions = self.positions.get(key, {})
+        index = positions.pop(id, None)
+        if index is None:
+            return
+        ids = self.ids[key]
+        last = ids.pop()
+        if last != id:  # 마지막 원소를 빈 자리로 옮긴다
+            ids[index] = last
+            positions[last] = index
+
+    def add(self, table, id, category):
+        self.categories.setdefault(table, {})[id] = category
+        self._push((table, None), id)
+        self._push((table, category), id)
+
+    def remove(self, table, id):
+        if id not in self.categories.get(table, {}):
+            return
+        category = self.categories[table].pop(id)
+        self._pop((table, None), id)
+        self._pop((table, category), id)
+
+    def update(self, row):  # 생성/수정된 데이터 반영(운영 중이 아니면 제외)
+        table = row.__tablename__
+        self.remove(table, row.id)
+        if row.use_yn == 1:
+            self.add(table, row.id, row.category)
+
+    def choice(self, table, category=None):  # 임의의 id(없으면 None)
+        ids = self.ids.get((table, category))
+        if not ids:
+            return None
+        return ids[random.randrange(len(ids))]
+
+
+id_pool = IdPool()
+
+
+class DailyPicks:
+    """
+    날짜별로 고정된 id(오늘의 명언).
+    워커마다 다른 메모리 배열 대신 DB의 운영 중인 id 순서에서 (테이블, 카테고리, 날짜) 해시 번째 행을 고르므로
+    모든 워커가 같은 데이터를 반환한다. 고른 id는 그날 동안 기억하므로 COUNT/OFFSET 조회는 (테이블, 카테고리)마다 하루 1번이다.
+    고른 데이터가 삭제/미사용되거나 카테고리가 바뀌면(id_pool로 확인) 다시 고른다. 이때 개수가 바뀌었으면 다른 데이터가 선택될 수 있다.
+    """
+    def __init__(self):
+        self.day = None
+        self.ids = {}  # {(table, category): id}  self.day 날짜의 선택
+
+    def valid(self, table, id, category):  # 아직 운영 중이고 같은 카테고리인지
+        categories = id_pool.categories.get(table, {})
+        return id in categories and (category is None or categories[id] == category)
+
+    async def choice(self, session, Table, category, day):  # 없으면 None
+        table = Table.__tablename__
+        if day != self.day:  # 날짜가 바뀌면 전날 선택은 버린다
+            self.day, self.ids = day, {}
+        id = self.ids.get((table, category))
+        if id is not None and self.valid(table, id, category):
+            return id
+
+        conditions = [Table.use_yn==1]
+        if category is not None:
+            conditions.append(Table.category==category)
+        count = (await session.exec(select(func.count()).select_from(Table).where(*conditions))).one()
+        if not count:
+            return None
+        offset = zlib.crc32(f"{table}:{category}:{day}".encode()) % count  # 프로세스마다 같은 값(hash()는 프로세스마다 다름)
+        id = (await session.exec(select(Table.id).where(*conditions).order_by(Table.id).offset(offset).limit(1))).first()
+        if id is not None:
+            self.ids[table, category] = id
+        return id
+
+
+daily_picks = DailyPicks()
@@ -0,0 +1,83 @@
+# tools/rate_limit.py
+"""
+요청 수 제한(token bucket)
+
+클라이언트(IP 또는 API 키)마다 버킷에 초당 RATE_LIMIT_PER_SECOND개씩 토큰이 쌓이고(최대 RATE_LIMIT_BURST개),
+요청마다 1개를 쓴다. 토큰이 없으면 DB 세션을 잡기 전에 429 Too Many Requests로 응답한다.
+"""
+import json
+import math
+import time
+from collections import OrderedDict
+
+
+class RateLimitBackend:
+    """
+    버킷 저장소 기본 클래스. 여러 워커/서버가 같은 제한을 공유하려면 상속해서 공유 저장소(예: Redis)를 구현한다.
+    """
+    async def take(self, key, rate, burst):  # (허용 여부, 다음 토큰까지 남은 초)
+        raise NotImplementedError
+
+
+class MemoryRateLimitBackend(RateLimitBackend):  # 프로세스 메모리 버킷(워커마다 따로 제한)
+    def __init__(self, maxsize=100_000, clock=time.monotonic):
+        self.maxsize = maxsize
+        self.clock = clock
+        self.buckets = OrderedDict()  # {key: (남은 토큰, 마지막 갱신 시각)} 오래 사용하지 않은 순
+
+    async def take(self, key, rate, burst):
+        now = self.clock()
+        tokens, updated_at = self.buckets.pop(key, (burst, now))
+        tokens = min(burst, tokens + (now - updated_at) * rate)
+        allowed = tokens >= 1
+        if allowed:
+            tokens -= 1
+        self.buckets[key] = (tokens, now)  # 맨 뒤(가장 최근)로
+        if len(self.buckets) > self.maxsize:  # 가장 오래 요청이 없던 버킷을 지운다(대부분 이미 가득 찼을 버킷)
+            self.buckets.popitem(last=False)
+        return allowed, 0 if allowed else (1 - tokens) / rate
+
+
+class RateLimitMiddleware:
+    """
+    순수 ASGI 미들웨어.
+    key_header를 주면 그 헤더 값(API 키)으로, 없으면 클라이언트 IP로 구분한다.
+    API 키는 클라이언트가 마음대로 바꿀 수 있으므로 키를 검증하는 게이트웨이 뒤에서만 key_header를 사용한다.
+    """
+    def __init__(self, app, backend, rate, burst, key_header=None, exempt=("/health", "/metrics")):
+        self.app = app
+        self.backend = backend
+        self.rate = rate
+        self.burst = burst
+        self.key_header = key_header.lower().encode() if key_header else None
+        self.exempt = exempt
+
+    def client_key(self, scope):
+        if self.key_header:
+            for name, value in scope["headers"]:
+                if name == self.key_header and value:
+                    return "key:" + value.decode("latin-1")
+        client = scope.get("client")
+        return "ip:" + (client[0] if client else "unknown")
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"].startswith(self.exempt):
+            await self.app(scope, receive, send)
+            return
+
+        allowed, retry_after = await self.backend.take(self.client_key(scope), self.rate, self.burst)
+        if allowed:
+            await self.app(scope, receive, send)
+            return
+
+        body = json.dumps({"detail": "요청이 너무 많습니다. 잠시 후 다시 시도하세요."}, ensure_ascii=False).encode()
+        await send({
+            "type": "http.response.start",
+            "status": 429,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"retry-after", str(math.ceil(retry_after)).encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,183 @@
+# tools/search.py
+"""
+검색어(keyword) 필터링 백엔드
+
+- like     : 기존 방식. LIKE '%keyword%' (인덱스를 사용하지 못해 전체 테이블을 읽는다)
+- ngram    : 프로세스 메모리에 만든 1~2글자 n-gram 역색인. DB 종류와 상관없이 동작(SQLite 포함)
+- fulltext : MySQL FULLTEXT 인덱스(WITH PARSER ngram). MySQL이 아니면 ngram으로 대체
+"""
+from sqlalchemy import case, false, inspect, or_, text
+from sqlalchemy.dialects.mysql import match
+from sqlmodel import select
+
+from database.connection import settings, engine_url
+
+
+# 테이블별 검색 대상 필드
+SEARCH_FIELDS = {
+    "saying": ("contents_kr", "contents_eng"),
+    "fourchar": ("contents_detail", "contents_kr", "contents_zh"),
+}
+
+
+def normalize(value):  # 대소문자 구분 없이 검색하기 위해 소문자로 통일
+    return (value or "").lower()
+
+
+def clean_keyword(keyword):  # 라우트에서 한 번만 정리해서 검색 조건, 개수 캐시 키, facets에 같은 값을 사용
+    keyword = normalize(keyword).strip()
+    return keyword or None
+
+
+class SearchBackend:  # 검색 백엔드 기본 클래스
+    def build(self, session):  # 앱 시작 시 색인 생성
+        pass
+
+    def index(self, row):  # 생성/수정된 데이터 색인
+        pass
+
+    def remove(self, Table, id):  # 삭제된 데이터 색인 제거
+        pass
+
+    def condition(self, Table, keyword):  # 검색어 WHERE 조건
+        raise NotImplementedError
+
+    def relevance(self, Table, keyword):  # 관련도 정렬식(지원하지 않으면 None)
+        return None
+
+
+class LikeSearchBackend(SearchBackend):
+    def condition(self, Table, keyword):
+        fields = SEARCH_FIELDS[Table.__tablename__]
+        return or_(*[getattr(Table, field).like(f"%{keyword}%") for field in fields])
+
+
+class NgramSearchBackend(SearchBackend):
+    """
+    각 행의 검색 필드를 합친 문자열을 1글자, 2글자 단위로 쪼개 역색인을 만든다.
+    검색어의 n-gram 목록의 교집합으로 후보를 좁힌 뒤 실제 포함 여부를 확인하므로 결과는 LIKE와 같다.
+    한글, 한자는 글자 단위로, 영문은 소문자로 색인된다.
+    """
+    def __init__(self, max_ids=5000):
+        self.max_ids = max_ids  # 결과가 이보다 많으면 IN 목록 대신 LIKE 조건을 사용
+        self.fallback = LikeSearchBackend()
+        self.docs = {name: {} for name in SEARCH_FIELDS}      # {table: {id: 색인 문자열}}
+        self.postings = {name: {} for name in SEARCH_FIELDS}  # {table: {n-gram: {id, ...}}}
+
+    @staticmethod
+    def grams(value):  # 1글자, 2글자 n-gram 집합
+        grams = set(value)
+        grams.update(value[i:i + 2] for i in range(len(value) - 1))
+        return grams
+
+    def document(self, table, row):
+        return "\n".join(normalize(getattr(row, field)) for field in SEARCH_FIELDS[table])
+
+    def build(self, session):
+        from models.sayings import Saying
+        from models.fourchars import FourChar
+
+        for Table in (Saying, FourChar):
+            table = Table.__tablename__
+            self.docs[table] = {}
+            self.postings[table] = {}
+            fields = [getattr(Table, field) for field in SEARCH_FIELDS[table]]
+            statement = select(Table.id, *fields).execution_options(yield_per=5000)
+            for row in session.exec(statement):
+                self._add(table, row.id, self.document(table, row))
+
+    def _add(self, table, id, doc):
+        self.docs[table][id] = doc
+        postings = self.postings[table]
+        for gram in self.grams(doc):
+            postings.setdefault(gram, set()).add(id)
+
+    def index(self, row):
+        table = row.__tablename__
+        self.remove(type(row), row.id)
+        self._add(table, row.id, self.document(table, row))
+
+    def remove(self, Table, id):
+        table = Table.__tablename__
+        doc = self.docs[table].pop(id, None)
+        if doc is None:
+            return
+        postings = self.postings[table]
+        for gram in self.grams(doc):
+            ids = postings.get(gram)
+            if ids is not None:
+                ids.discard(id)
+                if not ids:
+                    del postings[gram]
+
+    def search(self, table, keyword):  # {id: 검색어 등장 횟수}
+        keyword = normalize(keyword)
+        docs = self.docs[table]
+        postings = self.postings[table]
+        grams = [keyword] if len(keyword) == 1 else [keyword[i:i + 2] for i in range(len(keyword) - 1)]
+        candidate_sets = sorted((postings.get(gram, set()) for gram in set(grams)), key=len)
+        candidates = set.intersection(*candidate_sets) if candidate_sets else set()
+        scores = {}
+        for id in candidates:
+            count = docs[id].count(keyword)
+            if count:
+                scores[id] = count
+        return scores
+
+    def condition(self, Table, keyword):
+        scores = self.search(Table.__tablename__, keyword)
+        if len(scores) > self.max_ids:  # 흔한 검색어는 어차피 대부분의 행이 걸리므로 LIKE가 더 싸다
+            return self.fallback.condition(Table, keyword)
+        if not scores:
+            return false()
+        return Table.id.in_(scores)
+
+    def relevance(self, Table, keyword):
+        scores = self.search(Table.__tablename__, keyword)
+        if not scores or len(scores) > self.max_ids:
+            return None
+        return case(scores, value=Table.id, else_=0)
+
+
+class FulltextSearchBackend(SearchBackend):
+    """
+    MySQL FULLTEXT 인덱스(ngram 파서)를 사용한다. 인덱스가 없으면 앱 시작 시 생성한다.
+    ngram_token_size(기본 2)보다 짧은 검색어는 FULLTEXT로 찾을 수 없어 LIKE를 사용한다.
+    """
+    def __init__(self):
+        self.fallback = LikeSearchBackend()
+
+    def build(self, session):
+        inspector = inspect(session.get_bind())
+        for table, fields in SEARCH_FIELDS.items():
+            index_name = f"ft_{table}_contents"
+            if index_name in {index["name"] for index in inspector.get_indexes(table)}:
+                continue
+            session.exec(text(f"CREATE FULLTEXT INDEX {index_name} ON {table} ({', '.join(fields)}) WITH PARSER ngram"))
+        session.commit()
+
+    def _match(self, Table, keyword):
+        fields = [getattr(Table, field) for field in SEARCH_FIELDS[Table.__tablename__]]
+        phrase = '"' + keyword.replace('"', " ") + '"'  # 구문 검색으로 연속된 글자만 일치시킨다
+        return match(*fields, against=phrase).in_boolean_mode()
+
+    def condition(self, Table, keyword):
+        if len(keyword.strip()) < 2:
+            return self.fallback.condition(Table, keyword)
+        return self._match(Table, keyword)
+
+    def relevance(self, Table, keyword):
+        if len(keyword.strip()) < 2:
+            return None
+        return self._match(Table, keyword)
+
+
+def get_search_backend(name):  # 설정값에 맞는 검색 백엔드 생성
+    if name == "like":
+        return LikeSearchBackend()
+    if name == "fulltext" and engine_url.dialect.name == "mysql":
+        return FulltextSearchBackend()
+    return NgramSearchBackend(max_ids=settings.SEARCH_MAX_IDS)
+
+
+search_backend = get_search_backend(settings.SEARCH_BACKEND)
@@ -0,0 +1,300 @@
+# tools/similar.py
+"""
+비슷한 명언/사자성어 추천(/saying/{id}/similar, /fourchar/{id}/similar)
+
+본문을 글자 n-gram(2~3글자)으로 나눠 TF-IDF 희소 행렬(scipy CSR)을 만들고, 질의 행의 n-gram 열만 잘라낸
+행렬 곱 한 번으로 모든 행과의 코사인 유사도를 계산해 상위 k개를 고른다(행마다 L2 정규화되어 있어 내적 = 코사인 유사도).
+n-gram은 어휘 사전 대신 crc32 해시로 열 번호를 정하므로 새 데이터가 들어와도 열이 바뀌지 않는다.
+
+- 앱 시작 시 SIMILAR_SNAPSHOT_PATH 파일(.npz)을 읽는다. 파일에 저장된 테이블 버전(table_version)이
+  DB와 다르면(그 사이 쓰기가 있었으면) 새로 만들어 파일을 교체하므로, 다음 워커부터는 파일만 읽는다.
+- 생성/수정/삭제 시 해당 행만 다시 계산해 작은 추가 행렬에 붙인다(일정 크기가 넘으면 본 행렬에 합침). idf는 색인을 만들 때 값으로 고정하고,
+  삭제된 행은 표시만 해 두었다가 일정 개수가 넘으면 정리한다. 다른 워커의 쓰기는 tools/index_sync.py가 변경 기록을 읽어 반영한다.
+"""
+import os
+import unicodedata
+import zlib
+from collections import Counter
+
+import numpy as np
+from scipy import sparse
+from scipy.sparse.linalg import norm
+from sqlmodel import select
+
+from tools.batch import fetch_batch
+
+
+# 테이블별 유사도 계산 대상 필드
+SIMILAR_FIELDS = {
+    "saying": ("contents_kr", "contents_eng"),
+    "fourchar": ("contents_kr", "contents_detail"),
+}
+
+NGRAM_SIZES = (2, 3)
+DIMENSION = 2 ** 18  # 해시 열 개수
+COMPACT_MIN = 1000  # 삭제 표시된 행이 이 개수와 전체의 절반을 모두 넘으면 행렬 정리
+DELTA_MAX = 1024  # 추가 행렬이 이 행 수를 넘으면 본 행렬에 합친다
+
+
+def features(texts):  # {열 번호: 등장 횟수}
+    counts = Counter()
+    for text in texts:
+        text = " ".join(unicodedata.normalize("NFC", text or "").lower().split())
+        if not text:
+            continue
+        text = f" {text} "  # 단어 처음/끝 n-gram 구분
+        for size in NGRAM_SIZES:
+            for start in range(len(text) - size + 1):
+                counts[zlib.crc32(text[start:start + size].encode()) % DIMENSION] += 1
+    return counts
+
+
+def count_matrix(documents):  # [Counter, ...] -> 등장 횟수 CSR 행렬
+    indptr, indices, data = [0], [], []
+    for counts in documents:
+        indices.extend(counts.keys())
+        data.extend(counts.values())
+        indptr.append(len(indices))
+    matrix = sparse.csr_matrix(
+        (np.array(data, dtype=np.float32), np.array(indices, dtype=np.int32), np.array(indptr, dtype=np.int64)),
+        shape=(len(documents), DIMENSION)
+    )
+    matrix.sort_indices()
+    return matrix
+
+
+class TfidfMatrix:
+    """
+    테이블 1개의 TF-IDF 행렬. matrix[i]는 ids[i] 데이터의 벡터이고, active[i]가 False인 행은 삭제된 행이다.
+    생성/수정된 행은 작은 추가 행렬(delta)에 모아 두고 DELTA_MAX개가 넘으면 본 행렬에 한 번에 합친다.
+    (쓰기마다 본 행렬을 다시 만들면 전체 크기만큼 복사해야 한다) 행 번호는 본 행렬 다음에 추가 행렬이 이어진다.
+    """
+    def __init__(self, ids=None, matrix=None, idf=None):
+        self.ids = np.zeros(0, dtype=np.int64) if ids is None else ids
+        self.matrix = sparse.csr_matrix((0, DIMENSION), dtype=np.float32) if matrix is None else matrix
+        self.idf = np.ones(DIMENSION, dtype=np.float32) if idf is None else idf
+        self.active = np.ones(len(self.ids), dtype=bool)
+        self.positions = {int(id): row for row, id in enumerate(self.ids)}  # {id: 행 번호}
+        self._columns = None
+        self.pending, self.pending_ids, self.pending_active = [], [], []  # 추가 행렬(CSR 블록 목록), id, 운영 여부
+        self._delta = None
+
+    @property
+    def columns(self):  # 열(n-gram)별로 묶은 본 행렬(CSC). 합친 후 첫 조회 때 다시 만든다
+        if self._columns is None:
+            self._columns = self.matrix.tocsc()
+        return self._columns
+
+    @property
+    def delta(self):  # 추가 행렬(CSR)
+        if self._delta is None:
+            self._delta = sparse.vstack(self.pending, format="csr") if self.pending else sparse.csr_matrix((0, DIMENSION), dtype=np.float32)
+        return self._delta
+
+    def __len__(self):
+        return len(self.ids) + len(self.pending_ids)
+
+    @classmethod
+    def fit(cls, ids, documents):
+        counts = count_matrix(documents)
+        df = np.bincount(counts.indices, minlength=DIMENSION)
+        idf = (np.log((1 + len(documents)) / (1 + df)) + 1).astype(np.float32)  # smooth idf
+        return cls(np.array(ids, dtype=np.int64), cls.weigh(counts, idf), idf)
+
+    @staticmethod
+    def weigh(counts, idf):  # 등장 횟수 -> (1 + log tf) * idf, 행별 L2 정규화
+        counts.data = (1 + np.log(counts.data)) * idf[counts.indices]
+        lengths = norm(counts, axis=1)
+        lengths[lengths == 0] = 1
+        return (sparse.diags((1 / lengths).astype(np.float32)) @ counts).tocsr()
+
+    def transform(self, documents):
+        return self.weigh(count_matrix(documents), self.idf)
+
+    def upsert(self, ids, documents):  # 새 행을 추가 행렬에 붙이고 기존 행은 삭제 표시
+        for id in ids:
+            self.discard(id)
+        start = len(self)
+        self.pending.append(self.transform(documents))
+        self.pending_ids.extend(ids)
+        self.pending_active.extend([True] * len(ids))
+        self._delta = None
+        for offset, id in enumerate(ids):
+            self.positions[id] = start + offset
+        if len(self.pending_ids) > DELTA_MAX:
+            self.merge()
+
+    def discard(self, id):
+        row = self.positions.pop(id, None)
+        if row is None:
+            return
+        if row < len(self.ids):
+            self.active[row] = False
+        else:
+            self.pending_active[row - len(self.ids)] = False
+
+    def merge(self):  # 추가 행렬을 본 행렬에 합친다(행 번호는 그대로)
+        if self.pending:
+            self.matrix = sparse.vstack([self.matrix, self.delta], format="csr")
+            self.ids = np.concatenate([self.ids, np.array(self.pending_ids, dtype=np.int64)])
+            self.active = np.concatenate([self.active, np.array(self.pending_active, dtype=bool)])
+            self.pending, self.pending_ids, self.pending_active = [], [], []
+            self._delta = None
+            self._columns = None
+        removed = len(self.ids) - len(self.positions)
+        if removed > COMPACT_MIN and removed * 2 > len(self.ids):
+            self.compact()
+
+    def compact(self):  # 삭제 표시된 행 제거
+        if self.pending:
+            self.merge()
+        self.matrix = self.matrix[self.active]
+        self.ids = self.ids[self.active]
+        self.active = np.ones(len(self.ids), dtype=bool)
+        self.positions = {int(id): row for row, id in enumerate(self.ids)}
+        self._columns = None
+
+    def row_id(self, row):
+        return int(self.ids[row]) if row < len(self.ids) else self.pending_ids[row - len(self.ids)]
+
+    def neighbours(self, ids, k):
+        """
+        ids 각각과 가장 비슷한 데이터 최대 k개 [[(id, 유사도), ...], ...]. 색인에 없는 id는 None
+        질의 행들을 모아, 질의에 나온 n-gram 열만 잘라낸 행렬 곱 한 번(전체 행 x 질의 수)으로 계산한다.
+        """
+        rows = [self.positions.get(id) for id in ids]
+        queries = [row for row in rows if row is not None]
+        if not queries:
+            return [None] * len(ids)
+        size = len(self.ids)
+        vectors = sparse.vstack([self.matrix[row] if row < size else self.delta[row - size] for row in queries], format="csr")
+        features = np.unique(vectors.indices)
+        query = vectors[:, features].toarray().T
+        scores = self.columns[:, features] @ query  # (전체 행, 질의 수)
+        if self.pending:
+            scores = np.vstack([scores, self.delta[:, features] @ query])
+        active = np.concatenate([self.active, np.array(self.pending_active, dtype=bool)]) if self.pending else self.active
+        scores[~active] = 0
+        scores[queries, np.arange(len(queries))] = 0  # 자기 자신 제외
+        count = min(k, len(scores))
+        results, column = [], 0
+        for row in rows:
+            if row is None:
+                results.append(None)
+                continue
+            score = scores[:, column]
+            column += 1
+            top = np.argpartition(-score, count - 1)[:count] if count < len(score) else np.arange(len(score))
+            top = top[np.argsort(-score[top], kind="stable")]
+            results.append([(self.row_id(index), round(float(score[index]), 4)) for index in top if score[index] > 0])
+        return results
+
+
+class SimilarIndex:
+    def __init__(self):
+        self.tables = {name: TfidfMatrix() for name in SIMILAR_FIELDS}
+        self.versions = {}  # 색인을 만들 때의 테이블 버전 {table: version}
+
+    @staticmethod
+    def document(table, row):
+        return features(getattr(row, field) for field in SIMILAR_FIELDS[table])
+
+    @staticmethod
+    def current_versions(session):
+        from models.versions import TableVersion
+
+        statement = select(TableVersion.name, TableVersion.version).where(TableVersion.name.in_(list(SIMILAR_FIELDS)))
+        return {name: version for name, version in session.exec(statement)}
+
+    def build(self, session):
+        from models.sayings import Saying
+        from models.fourchars import FourChar
+
+        self.versions = self.current_versions(session)  # 데이터보다 먼저 읽어야 그 사이 쓰기가 있을 때 다음 시작에서 다시 만든다
+        for Table in (Saying, FourChar):
+            table = Table.__tablename__
+            fields = [getattr(Table, field) for field in SIMILAR_FIELDS[table]]
+            statement = select(Table.id, *fields).where(Table.use_yn==1).order_by(Table.id).execution_options(yield_per=10000)
+            ids, documents = [], []
+            for row in session.exec(statement):
+                ids.append(row.id)
+                documents.append(self.document(table, row))
+            self.tables[table] = TfidfMatrix.fit(ids, documents)
+
+    def save(self, path):  # 임시 파일에 쓴 뒤 교체(읽는 중인 다른 워커는 이전 파일을 계속 읽음)
+        arrays = {"versions": np.array(",".join(f"{name}:{version}" for name, version in sorted(self.versions.items())))}
+        for table, index in self.tables.items():
+            index.compact()
+            arrays.update({
+                f"{table}.ids": index.ids,
+                f"{table}.idf": index.idf,
+                f"{table}.data": index.matrix.data,
+                f"{table}.indices": index.matrix.indices,
+                f"{table}.indptr": index.matrix.indptr,
+            })
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as file:
+            np.savez(file, **arrays)
+        os.replace(temp_path, path)
+
+    def load(self, path):
+        with np.load(path, allow_pickle=False) as arrays:
+            versions = str(arrays["versions"])
+            self.versions = {name: int(version) for name, version in (item.split(":") for item in versions.split(",") if item)}
+            for table in SIMILAR_FIELDS:
+                ids = arrays[f"{table}.ids"]
+                matrix = sparse.csr_matrix(
+                    (arrays[f"{table}.data"], arrays[f"{table}.indices"], arrays[f"{table}.indptr"]),
+                    shape=(len(ids), DIMENSION)
+                )
+                self.tables[table] = TfidfMatrix(ids, matrix, arrays[f"{table}.idf"])
+
+    def load_or_build(self, session, path=None):  # 앱 시작 시 호출. 파일이 최신이면 읽기만 한다
+        if path and os.path.exists(path):
+            try:
+                self.load(path)
+            except (OSError, KeyError, ValueError):
+                self.versions = {}
+            if self.versions == self.current_versions(session):
+                return False
+        self.build(session)
+        if path:
+            self.save(path)
+        return True
+
+    def update_many(self, rows):  # 생성/수정된 데이터 반영(운영 중이 아니면 제외)
+        for table in SIMILAR_FIELDS:
+            index = self.tables[table]
+            targets = [row for row in rows if row.__tablename__ == table]
+            for row in targets:
+                if row.use_yn != 1:
+                    index.discard(row.id)
+            targets = [row for row in targets if row.use_yn == 1]
+            if targets:
+                index.upsert([row.id for row in targets], [self.document(table, row) for row in targets])
+
+    def update(self, row):
+        self.update_many([row])
+
+    def remove(self, table, id):
+        self.tables[table].discard(id)
+
+    def similar(self, table, id, k=10):  # [(id, 유사도), ...]. 운영 중이 아니거나 없는 id면 None
+        return self.tables[table].neighbours([id], k)[0]
+
+
+similar_index = SimilarIndex()
+
+
+async def similar_items(session, Table, id, size):  # 라우트 응답. 색인에 없는 id면 None
+    neighbours = similar_index.similar(Table.__tablename__, id, size)
+    if neighbours is None:
+        return None
+    scores = dict(neighbours)
+    content = (await fetch_batch(session, Table, list(scores)))["content"]  # 단일 조회 캐시 + IN 쿼리 1번
+    return {
+        "content": [{**data, "score": scores[data["id"]]} for data in content]
+    }
@@ -0,0 +1,449 @@
+# tools/snapshot.py
+"""
+읽기 전용 스냅샷 모드(SNAPSHOT_PATH)
+
+명언/사자성어/카테고리 테이블을 열(column) 단위 배열로 파일 1개에 저장하고, 워커는 이 파일을 mmap으로 열어
+목록/필터/단일/카테고리 조회를 DB 연결 없이 처리한다. 읽기 전용 mmap이라 모든 워커가 같은 물리 메모리(페이지 캐시)를 공유한다.
+
+파일 구조: MAGIC(8) + 헤더 길이(8) + 헤더(JSON) + 배열들(8바이트 정렬)
+- 행은 id 오름차순이므로 id 열이 곧 id 색인이다(이진 탐색)
+- 문자열 열은 offsets(행 수 + 1) + UTF-8 바이트, 날짜 열은 초 단위 정수로 저장한다
+- active: 운영 중(use_yn==1)인 행 번호, by_category/by_initial: 값별 행 번호 목록(미리 만든 필터 색인)
+- search: 검색 필드를 소문자로 합친 바이트열(검색어는 mmap 위에서 바로 찾는다. 결과는 LIKE/ngram 백엔드와 같다)
+
+쓰기 라우트는 DB에 쓰고, bump_version이 표시해 둔 세션이 커밋되면 SNAPSHOT_REFRESH_DELAY초 뒤에 파일을 다시 만든다.
+새 파일은 임시 파일에 쓴 뒤 os.replace로 교체하므로 읽는 쪽은 항상 완전한 파일만 보고,
+각 워커는 SNAPSHOT_CHECK_INTERVAL초마다 파일이 바뀌었는지 확인해서 새 파일로 바꿔 연다.
+"""
+import asyncio
+import json
+import mmap
+import os
+import struct
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+from sqlalchemy import DateTime, Integer, event
+from sqlalchemy.orm import Session as OrmSession
+from sqlmodel import Session, select
+
+from models.sayings import Saying, SayingRead
+from models.fourchars import FourChar, FourCharRead
+from models.category import Category
+from models.versions import TableVersion
+from tools.pagination import encode_cursor, decode_cursor
+from tools.facets import build_facets
+from tools.search import SEARCH_FIELDS, normalize
+
+
+MAGIC = b"SNAPSHT1"
+TABLES = {"saying": (Saying, SayingRead), "fourchar": (FourChar, FourCharRead)}
+CATEGORY_COLUMNS = ("saying_categories", "fourchar_categories")
+VERSION_TABLES = ("saying", "fourchar", "category")
+EPOCH = datetime(1970, 1, 1)
+NULL_TIME = np.iinfo(np.int64).min
+ALIGN = 8
+MEMO_SIZE = 1024
+
+
+def column_kinds(Table):  # {필드: "int" | "time" | "str"}
+    kinds = {}
+    for column in Table.__table__.columns:
+        kinds[column.name] = "int" if isinstance(column.type, Integer) else "time" if isinstance(column.type, DateTime) else "str"
+    return kinds
+
+
+def string_arrays(values):  # 문자열 목록 -> (offsets, UTF-8 바이트, None 여부)
+    encoded = [None if value is None else value.encode() for value in values]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(value or b"") for value in encoded], out=offsets[1:])
+    data = np.frombuffer(b"".join(value or b"" for value in encoded), dtype=np.uint8)
+    nulls = np.array([value is None for value in encoded], dtype=np.uint8)
+    return offsets, data, nulls
+
+
+def grouped_rows(keys, rows):  # 값별 행 번호 목록 -> (값 목록, offsets, 행 번호)
+    names = sorted({keys[row] for row in rows if keys[row] is not None})
+    groups = {name: [] for name in names}
+    for row in rows:
+        if keys[row] is not None:
+            groups[keys[row]].append(row)
+    offsets = np.zeros(len(names) + 1, dtype=np.int64)
+    np.cumsum([len(groups[name]) for name in names], out=offsets[1:])
+    positions = np.array([row for name in names for row in groups[name]], dtype=np.int32)
+    return names, offsets, positions
+
+
+class SnapshotWriter:
+    def __init__(self):
+        self.arrays = {}
+        self.header = {"tables": {}, "versions": {}}
+
+    def add_strings(self, name, values):
+        self.arrays[f"{name}.offsets"], self.arrays[f"{name}.data"], self.arrays[f"{name}.nulls"] = string_arrays(values)
+
+    def add_table(self, table, Table, rows):
+        kinds = column_kinds(Table)
+        for field, kind in kinds.items():
+            values = [getattr(row, field) for row in rows]
+            if kind == "str":
+                self.add_strings(f"{table}.{field}", values)
+            elif kind == "time":
+                self.arrays[f"{table}.{field}"] = np.array(
+                    [NULL_TIME if value is None else int((value - EPOCH).total_seconds()) for value in values], dtype=np.int64
+                )
+            else:
+                self.arrays[f"{table}.{field}"] = np.array([NULL_TIME if value is None else value for value in values], dtype=np.int64)
+
+        active = [position for position, row in enumerate(rows) if row.use_yn == 1]
+        self.arrays[f"{table}.active"] = np.array(active, dtype=np.int32)
+        for field in ("category", "initial"):  # 필터 색인
+            names, offsets, positions = grouped_rows([getattr(row, field) for row in rows], active)
+            self.add_strings(f"{table}.by_{field}.names", names)
+            self.arrays[f"{table}.by_{field}.offsets"] = offsets
+            self.arrays[f"{table}.by_{field}.rows"] = positions
+        self.add_strings(f"{table}.search", [  # \0으로 행을 구분해 검색어가 두 행에 걸쳐 찾아지지 않게
+            "\n".join(normalize(getattr(row, field)) for field in SEARCH_FIELDS[table]) + "\0" for row in rows
+        ])
+        self.header["tables"][table] = {"rows": len(rows), "columns": kinds}
+
+    def add_categories(self, rows):
+        for field in CATEGORY_COLUMNS:
+            values = sorted((getattr(row, field), row.item_count or 0) for row in rows if getattr(row, field) is not None)
+            self.add_strings(f"category.{field}", [name for name, _ in values])
+            self.arrays[f"category.{field}.count"] = np.array([count for _, count in values], dtype=np.int64)
+
+    def write(self, file):
+        layout, offset = {}, 0
+        for name, array in self.arrays.items():
+            layout[name] = [array.dtype.str, offset, len(array)]
+            offset += -(-array.nbytes // ALIGN) * ALIGN
+        header = json.dumps({**self.header, "arrays": layout}).encode()
+        header += b" " * (-len(header) % ALIGN)
+        file.write(MAGIC + struct.pack("<Q", len(header)) + header)
+        for array in self.arrays.values():
+            file.write(array.tobytes())
+            file.write(b"\0" * (-array.nbytes % ALIGN))
+
+
+def newer_on_disk(path, versions):  # 이미 교체된 파일이 더 최신이면 True(다른 워커가 나중 데이터로 먼저 교체한 경우)
+    try:
+        with open(path, "rb") as file:
+            if file.read(len(MAGIC)) != MAGIC:
+                return False
+            (length,) = struct.unpack("<Q", file.read(8))
+            existing = json.loads(file.read(length))["versions"]
+    except (OSError, ValueError, KeyError):
+        return False
+    return any(existing.get(name, [0])[0] > version for name, (version, _) in versions.items())
+
+
+def export_snapshot(engine, path):
+    """
+    DB에서 스냅샷 파일을 만든다(관리 명령어, 쓰기 후 갱신에서 호출). 새 파일로 교체했으면 True
+    """
+    writer = SnapshotWriter()
+    with Session(engine) as session:
+        versions = session.exec(select(TableVersion).where(TableVersion.name.in_(VERSION_TABLES))).all()
+        writer.header["versions"] = {
+            row.name: [row.version, row.updated_at.isoformat() if row.updated_at else None] for row in versions
+        }
+        for table, (Table, _) in TABLES.items():
+            writer.add_table(table, Table, session.exec(select(Table).order_by(Table.id)).all())
+        writer.add_categories(session.exec(select(Category)).all())
+
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "wb") as file:
+        writer.write(file)
+        file.flush()
+        os.fsync(file.fileno())
+    if newer_on_disk(path, writer.header["versions"]):
+        os.remove(temp_path)
+        return False
+    os.replace(temp_path, path)  # 원자적 교체. 이미 열려 있는 이전 파일은 닫힐 때까지 그대로 읽힌다
+    return True
+
+
+class Snapshot:
+    """
+    mmap으로 연 스냅샷 파일 1개. 배열은 파일 위의 numpy 뷰라 복사하지 않는다.
+    """
+    def __init__(self, path):
+        with open(path, "rb") as file:
+            self.stamp = self.file_stamp(os.fstat(file.fileno()))
+            self.buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self.buffer[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"{path}: 스냅샷 파일이 아닙니다.")
+        (length,) = struct.unpack_from("<Q", self.buffer, len(MAGIC))
+        start = len(MAGIC) + 8
+        header = json.loads(self.buffer[start:start + length])
+        start += length
+        self.arrays = {
+            name: np.frombuffer(self.buffer, dtype=np.dtype(dtype), count=count, offset=start + offset)
+            for name, (dtype, offset, count) in header["arrays"].items()
+        }
+        self.tables = header["tables"]
+        self.versions = {
+            name: TableVersion(name=name, version=version, updated_at=datetime.fromisoformat(updated_at) if updated_at else None)
+            for name, (version, updated_at) in header["versions"].items()
+        }
+        self.data_offsets = {  # 문자열 열의 파일 내 시작 위치(바이트를 mmap에서 바로 디코딩)
+            name[:-len(".data")]: start + offset for name, (_, offset, _) in header["arrays"].items() if name.endswith(".data")
+        }
+        self.names = {}    # {(table, field): [값, ...]}
+        self.lookups = {}  # {(table, field): {값: 색인 번호}}
+        for table in self.tables:
+            for field in ("category", "initial"):
+                names = self.names[table, field] = self.strings(f"{table}.by_{field}.names")
+                self.lookups[table, field] = {name: index for index, name in enumerate(names)}
+        self.memo = {}  # 검색어별 검색/개수 결과. 파일 내용이 바뀌지 않으므로 무효화할 필요가 없다
+
+    def memoized(self, key, compute):
+        if key not in self.memo:
+            if len(self.memo) >= MEMO_SIZE:
+                self.memo.clear()
+            self.memo[key] = compute()
+        return self.memo[key]
+
+    @staticmethod
+    def file_stamp(stat):
+        return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+    def string(self, name, row):
+        if self.arrays[f"{name}.nulls"][row]:
+            return None
+        offsets = self.arrays[f"{name}.offsets"]
+        base = self.data_offsets[name]
+        return str(self.buffer[base + offsets[row]:base + offsets[row + 1]], "utf-8")
+
+    def strings(self, name):
+        return [self.string(name, row) for row in range(len(self.arrays[f"{name}.offsets"]) - 1)]
+
+    def value(self, table, field, kind, row):
+        if kind == "str":
+            return self.string(f"{table}.{field}", row)
+        value = int(self.arrays[f"{table}.{field}"][row])
+        if value == NULL_TIME:
+            return None
+        return EPOCH + timedelta(seconds=value) if kind == "time" else value
+
+    def record(self, table, row, fields=None):  # 행 번호 -> 응답용 dict
+        kinds = self.tables[table]["columns"]
+        return {field: self.value(table, field, kinds[field], row) for field in fields or kinds}
+
+    def records(self, table, rows):
+        fields = list(TABLES[table][1].model_fields)
+        return [self.record(table, int(row), fields) for row in rows]
+
+    def position(self, table, id):  # id 색인(이진 탐색). 없으면 None
+        ids = self.arrays[f"{table}.id"]
+        position = int(np.searchsorted(ids, id))
+        return position if position < len(ids) and ids[position] == id else None
+
+    def table_versions(self, tables):  # HTTP 캐시(ETag)용 테이블 버전. DB 대신 스냅샷을 만들 때의 버전을 사용
+        return [self.versions[name] for name in sorted(tables) if name in self.versions]
+
+    def get(self, table, id):  # 단일 조회(운영 중인 데이터만, DB 라우트와 같음)
+        position = self.position(table, id)
+        if position is None:
+            return None
+        active = self.arrays[f"{table}.active"]  # 운영 중인 행 번호(오름차순)
+        index = int(np.searchsorted(active, position))
+        if index == len(active) or active[index] != position:
+            return None
+        return self.record(table, position)
+
+    def index_rows(self, table, field, values):  # 값 목록에 해당하는 운영 중 행 번호(오름차순)
+        lookup = self.lookups[table, field]
+        offsets = self.arrays[f"{table}.by_{field}.offsets"]
+        rows = self.arrays[f"{table}.by_{field}.rows"]
+        parts = [rows[offsets[lookup[value]]:offsets[lookup[value] + 1]] for value in set(values) if value in lookup]
+        return np.sort(np.concatenate(parts)) if parts else np.zeros(0, dtype=np.int32)
+
+    def search(self, table, keyword):  # 검색어가 들어 있는 (행 번호, 등장 횟수)
+        needle = normalize(keyword).replace("\0", "").encode()
+        return self.memoized((table, "search", needle), lambda: self.scan(table, needle))
+
+    def scan(self, table, needle):
+        active = self.arrays[f"{table}.active"]
+        if not needle:  # LIKE '%%' 와 같이 모두 해당
+            return active, np.ones(len(active), dtype=np.int64)
+        offsets = self.arrays[f"{table}.search.offsets"]
+        base = self.data_offsets[f"{table}.search"]
+        end = base + int(offsets[-1])
+        found = []
+        index = self.buffer.find(needle, base, end)
+        while index != -1:
+            found.append(index - base)
+            index = self.buffer.find(needle, index + len(needle), end)
+        rows = np.searchsorted(offsets, np.array(found, dtype=np.int64), side="right") - 1
+        rows, counts = np.unique(rows, return_counts=True)
+        keep = np.isin(rows, active, assume_unique=True)
+        return rows[keep], counts[keep]
+
+    def codes(self, table, field):  # 행별 값 번호(값이 없거나 운영 중이 아니면 -1)
+        def compute():
+            code = np.full(self.tables[table]["rows"], -1, dtype=np.int64)
+            offsets = self.arrays[f"{table}.by_{field}.offsets"]
+            code[self.arrays[f"{table}.by_{field}.rows"]] = np.repeat(np.arange(len(offsets) - 1), np.diff(offsets))
+            return code
+        return self.memoized((table, "codes", field), compute)
+
+    def facet_groups(self, table, keyword):  # tools/facets.py 의 GROUP BY category, initial 결과와 같은 [(category, initial, 개수)]
+        rows = self.arrays[f"{table}.active"] if not keyword else self.search(table, keyword)[0]
+        category_names, initial_names = self.names[table, "category"], self.names[table, "initial"]
+        width = len(initial_names) + 1
+        keys = (self.codes(table, "category")[rows] + 1) * width + self.codes(table, "initial")[rows] + 1
+        counts = np.bincount(keys, minlength=(len(category_names) + 1) * width)
+        return [
+            (category_names[key // width - 1] if key // width else None, initial_names[key % width - 1] if key % width else None, int(counts[key]))
+            for key in np.flatnonzero(counts)
+        ]
+
+    def facets(self, table, keyword, categories, consonants):
+        groups = self.memoized((table, "facets", normalize(keyword)), lambda: self.facet_groups(table, keyword))
+        return build_facets(groups, categories, consonants)
+
+    def page(self, table, rows, p, size, cursor, ordered=False):
+        """
+        rows: 조건에 맞는 행 번호(오름차순 = id 오름차순). ordered=True면 rows 순서 그대로(관련도순) 페이징
+        응답 형태는 tools/pagination.py 의 페이지/커서 페이징과 같다.
+        """
+        if cursor is not None:
+            last_id = decode_cursor(cursor)
+            if last_id is not None:
+                rows = rows[:np.searchsorted(rows, np.searchsorted(self.arrays[f"{table}.id"], last_id))]
+            chosen = rows[::-1][:size + 1]
+            next_cursor = None
+            if len(chosen) > size:
+                chosen = chosen[:size]
+                next_cursor = encode_cursor(int(self.arrays[f"{table}.id"][chosen[-1]])) if len(chosen) else None
+            return {"size": len(chosen), "next_cursor": next_cursor, "content": self.records(table, chosen)}
+
+        total_record = len(rows)
+        total_page = (total_record // size) + bool(total_record % size)
+        page = max(min(p, total_page), 1)
+        if not ordered:
+            rows = rows[::-1]
+        return {
+            "total_rows": total_record,
+            "total_page": total_page,
+            "content": self.records(table, rows[(page - 1) * size:page * size])
+        }
+
+    def list(self, table, p, size, cursor):
+        return self.page(table, self.arrays[f"{table}.active"], p, size, cursor)
+
+    def filter(self, table, categories, keyword, consonants, p, size, cursor, order, facets):
+        rows = self.arrays[f"{table}.active"]
+        if categories:
+            rows = self.index_rows(table, "category", categories)
+        if consonants:
+            rows = np.intersect1d(rows, self.index_rows(table, "initial", [consonant.upper() for consonant in consonants]), assume_unique=True)
+
+        facet = None
+        if facets:  # 검색어 조건만 건 행들로 계산
+            facet = self.facets(table, keyword, categories, consonants)
+
+        ordered = False
+        if keyword:
+            matched, counts = self.search(table, keyword)
+            keep = np.isin(matched, rows, assume_unique=True)
+            rows, counts = matched[keep], counts[keep]
+            if order == "relevance" and cursor is None:  # 관련도순(같은 관련도는 최신순)
+                rows = rows[np.lexsort((-rows, -counts))]
+                ordered = True
+
+        response = self.page(table, rows, p, size, cursor, ordered)
+        if cursor is None:
+            response["estimated"] = False
+        if facets:
+            response["facets"] = facet
+        return response
+
+    def categories(self, select_category, with_counts):  # routes/category.py 와 같은 응답
+        field = "fourchar_categories" if select_category == "fourchar" else "saying_categories"
+        names = self.strings(f"category.{field}")
+        if with_counts:
+            counts = self.arrays[f"category.{field}.count"]
+            return [{"name": name, "count": int(count)} for name, count in zip(names, counts)]
+        return names
+
+
+class SnapshotStore:
+    def __init__(self):
+        self.snapshot = None
+        self.path = None
+        self.engine = None
+        self.check_interval = 1.0
+        self.refresh_delay = 1.0
+        self.checked_at = 0.0
+        self.requested = False
+        self.refreshing = None  # 실행 중인 갱신 task
+
+    @property
+    def enabled(self):
+        return self.snapshot is not None
+
+    @property
+    def current(self):  # 다른 워커가 파일을 교체했으면 새 파일로 바꿔 연다(check_interval초마다 확인)
+        now = time.monotonic()
+        if now - self.checked_at >= self.check_interval:
+            self.checked_at = now
+            try:
+                if Snapshot.file_stamp(os.stat(self.path)) != self.snapshot.stamp:
+                    self.snapshot = Snapshot(self.path)  # 이전 mmap은 참조가 없어지면 닫힌다
+            except (OSError, ValueError):
+                pass  # 파일이 없어졌거나 읽을 수 없으면 열어 둔 스냅샷을 계속 사용
+        return self.snapshot
+
+    def open(self, engine, path, check_interval=1.0, refresh_delay=1.0):
+        """
+        앱 시작 시 호출. 파일이 없거나 DB의 테이블 버전과 다르면 먼저 새로 만든다.
+        """
+        self.engine, self.path = engine, path
+        self.check_interval, self.refresh_delay = check_interval, refresh_delay
+        snapshot = Snapshot(path) if os.path.exists(path) else None
+        if snapshot is None or self.stale(snapshot):
+            export_snapshot(engine, path)
+            snapshot = Snapshot(path)
+        self.snapshot = snapshot
+        self.checked_at = time.monotonic()
+
+    def stale(self, snapshot):
+        with Session(self.engine) as session:
+            versions = {row.name: row.version for row in session.exec(select(TableVersion).where(TableVersion.name.in_(VERSION_TABLES)))}
+        return versions != {name: row.version for name, row in snapshot.versions.items()}
+
+    def request_refresh(self):  # 쓰기 커밋 후 호출. 대기 중인 갱신이 있으면 그 갱신에 합쳐진다
+        self.requested = True
+        if self.refreshing is None or self.refreshing.done():
+            self.refreshing = asyncio.get_running_loop().create_task(self.refresh())
+
+    async def refresh(self):
+        while self.requested:
+            await asyncio.sleep(self.refresh_delay)  # 그 사이 들어온 쓰기는 한 번에 반영
+            self.requested = False  # 파일을 만드는 동안 들어온 쓰기는 다음 반복에서 반영
+            await asyncio.to_thread(export_snapshot, self.engine, self.path)
+            self.checked_at = 0.0  # 다음 조회에서 바로 새 파일 사용
+
+    def watch_commits(self):
+        """
+        bump_version(tools/http_cache.py)을 호출한 세션이 커밋되면 스냅샷을 다시 만든다.
+        쓰기 라우트는 모두 커밋 전에 bump_version을 호출하므로 라우트마다 따로 호출하지 않아도 된다.
+        """
+        @event.listens_for(OrmSession, "after_commit")
+        def after_commit(session):
+            if session.info.pop("snapshot_changed", False):
+                self.request_refresh()
+
+        @event.listens_for(OrmSession, "after_rollback")
+        def after_rollback(session):
+            session.info.pop("snapshot_changed", None)
+
+
+snapshot_store = SnapshotStore()
@@ -0,0 +1,132 @@
+# tools/suggest.py
+"""
+자동완성(/saying/suggest, /fourchar/suggest)용 접두어 색인
+
+검색 대상 문자열을 자모 단위로 풀어서(사자 -> ㅅㅏㅈㅏ) 정렬된 배열에 넣고, 입력값도 같은 방식으로 풀어 bisect로 찾는다.
+자모 단위로 비교하므로 입력 중인 글자("사ㅈ", "삭" -> "사기")도 찾을 수 있다.
+겹받침/이중모음은 입력 순서대로 나눈다(ㄳ -> ㄱㅅ, ㅘ -> ㅗㅏ). 영문은 소문자로 비교한다.
+운영 중(use_yn==1)인 데이터만 넣고 DB는 조회하지 않는다.
+"""
+import unicodedata
+from bisect import bisect_left, insort
+
+from sqlmodel import select
+
+
+# 테이블별 자동완성 대상 필드
+SUGGEST_FIELDS = {
+    "saying": ("author", "contents_eng"),
+    "fourchar": ("contents_kr", "contents_zh"),
+}
+
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+JUNGSEONG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+JONGSEONG = ("", "ㄱ", "ㄲ", "ㄳ", "ㄴ", "ㄵ", "ㄶ", "ㄷ", "ㄹ", "ㄺ", "ㄻ", "ㄼ", "ㄽ", "ㄾ", "ㄿ", "ㅀ",
+             "ㅁ", "ㅂ", "ㅄ", "ㅅ", "ㅆ", "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ")
+COMPOUND = {  # 겹받침, 이중모음을 입력 순서대로 분리
+    "ㄳ": "ㄱㅅ", "ㄵ": "ㄴㅈ", "ㄶ": "ㄴㅎ", "ㄺ": "ㄹㄱ", "ㄻ": "ㄹㅁ", "ㄼ": "ㄹㅂ", "ㄽ": "ㄹㅅ",
+    "ㄾ": "ㄹㅌ", "ㄿ": "ㄹㅍ", "ㅀ": "ㄹㅎ", "ㅄ": "ㅂㅅ",
+    "ㅘ": "ㅗㅏ", "ㅙ": "ㅗㅐ", "ㅚ": "ㅗㅣ", "ㅝ": "ㅜㅓ", "ㅞ": "ㅜㅔ", "ㅟ": "ㅜㅣ", "ㅢ": "ㅡㅣ",
+}
+
+
+def decompose(value):  # 비교용 키(자모 분리 + 소문자)
+    keys = []
+    for char in unicodedata.normalize("NFC", value or "").lower():
+        code = ord(char) - 0xAC00
+        if 0 <= code < 11172:  # 한글 음절
+            jamo = CHOSEONG[code // 588] + JUNGSEONG[code % 588 // 28] + JONGSEONG[code % 28]
+            keys.append("".join(COMPOUND.get(part, part) for part in jamo))
+        else:
+            keys.append(COMPOUND.get(char, char))
+    return "".join(keys)
+
+
+class SuggestIndex:
+    """
+    테이블별로 (키, 필드, 원문) 정렬 배열과 항목별 id 집합을 들고 있는다.
+    같은 원문(예: 같은 발화자)은 한 항목으로 합쳐지고 count에 데이터 수가 들어간다.
+    """
+    def __init__(self):
+        self.entries = {name: [] for name in SUGGEST_FIELDS}  # {table: [(키, 필드, 원문), ...]} 정렬 유지
+        self.refs = {name: {} for name in SUGGEST_FIELDS}     # {table: {(키, 필드, 원문): {id, ...}}}
+        self.rows = {name: {} for name in SUGGEST_FIELDS}     # {table: {id: [(키, 필드, 원문), ...]}}
+
+    @staticmethod
+    def terms(table, row):
+        terms = []
+        for field in SUGGEST_FIELDS[table]:
+            text = (getattr(row, field) or "").strip()
+            if text:
+                terms.append((decompose(text), field, text))
+        return terms
+
+    def build(self, session):  # 앱 시작 시 생성
+        from models.sayings import Saying
+        from models.fourchars import FourChar
+
+        for Table in (Saying, FourChar):
+            table = Table.__tablename__
+            refs, rows = {}, {}
+            fields = [getattr(Table, field) for field in SUGGEST_FIELDS[table]]
+            statement = select(Table.id, *fields).where(Table.use_yn==1).execution_options(yield_per=10000)
+            for row in session.exec(statement):
+                rows[row.id] = self.terms(table, row)
+                for term in rows[row.id]:
+                    refs.setdefault(term, set()).add(row.id)
+            self.entries[table] = sorted(refs)
+            self.refs[table] = refs
+            self.rows[table] = rows
+
+    def add(self, table, id, terms):
+        self.rows[table][id] = terms
+        refs = self.refs[table]
+        for term in terms:
+            if term not in refs:
+                refs[term] = set()
+                insort(self.entries[table], term)
+            refs[term].add(id)
+
+    def remove(self, table, id):
+        terms = self.rows[table].pop(id, None)
+        if terms is None:
+            return
+        refs = self.refs[table]
+        entries = self.entries[table]
+        for term in terms:
+            ids = refs.get(term)
+            if ids is None:
+                continue
+            ids.discard(id)
+            if not ids:
+                del refs[term]
+                del entries[bisect_left(entries, term)]
+
+    def update(self, row):  # 생성/수정된 데이터 반영(운영 중이 아니면 제외)
+        table = row.__tablename__
+        self.remove(table, row.id)
+        if row.use_yn == 1:
+            self.add(table, row.id, self.terms(table, row))
+
+    def suggest(self, table, query, limit=10):  # 접두어가 같은 항목을 키 순서로 최대 limit개
+        prefix = decompose(query.strip())
+        if not prefix:
+            return []
+        entries = self.entries[table]
+        refs = self.refs[table]
+        results = []
+        for index in range(bisect_left(entries, (prefix,)), len(entries)):
+            term = entries[index]
+            if not term[0].startswith(prefix) or len(results) >= limit:
+                break
+            ids = refs[term]
+            results.append({
+                "text": term[2],
+                "field": term[1],
+                "count": len(ids),
+                "id": next(iter(ids)) if len(ids) == 1 else None,  # 데이터가 1개면 바로 이동할 수 있게 id 제공
+            })
+        return results
+
+
+suggest_index = SuggestIndex()
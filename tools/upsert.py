@@ -0,0 +1,19 @@
+# tools/upsert.py
+"""
+이미 있는 행은 무시하는 INSERT 문(카테고리, 발화자 테이블)
+"""
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+
+
+def upsert_statement(dialect, Table, column):
+    """
+    Table의 유니크 인덱스 컬럼(column) 값이 이미 있으면 건너뛰는 INSERT 문(실행할 값 목록은 호출한 쪽에서 넘긴다)
+    """
+    if dialect == "mysql":  # 같은 값으로 갱신 = 무시(INSERT IGNORE와 달리 다른 오류는 숨기지 않는다)
+        statement = mysql.insert(Table)
+        return statement.on_duplicate_key_update({column: statement.inserted[column]})
+    if dialect == "sqlite":
+        return sqlite.insert(Table).on_conflict_do_nothing(index_elements=[column])
+    if dialect == "postgresql":
+        return postgresql.insert(Table).on_conflict_do_nothing(index_elements=[column])
+    raise NotImplementedError(f"{dialect}는 upsert를 지원하지 않습니다.")